@@ -0,0 +1,89 @@
+"""
+Compares the cache serializers' read/write throughput and on-disk size
+for offer lists of different lengths.
+
+    uv run python benchmarks/cache_serialization.py
+"""
+
+import argparse
+import json
+import time
+import uuid
+from random import Random
+from typing import Callable, Dict, List
+
+from offers_sdk_applifting.http.cache.serialization import (
+    BinaryCacheSerializer,
+    CacheEntry,
+    CacheSerializer,
+    JsonCacheSerializer,
+)
+
+SERIALIZERS: Dict[str, CacheSerializer] = {
+    "json": JsonCacheSerializer(),
+    "binary": BinaryCacheSerializer(compression_level=None),
+    "binary+zlib(1)": BinaryCacheSerializer(compression_level=1),
+}
+
+
+def offers_entry(offers: int, rng: Random) -> CacheEntry:
+    body = [
+        {
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "price": rng.randint(100, 100_000),
+            "items_in_stock": rng.randint(0, 500),
+        }
+        for _ in range(offers)
+    ]
+    now = time.time()
+    return CacheEntry(
+        status_code=200,
+        content=json.dumps(body).encode(),
+        expires_at=now + 300,
+        stored_at=now,
+        headers={"Content-Type": "application/json"},
+        fetch_time=0.05,
+    )
+
+
+def per_second(action: Callable[[], object], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        action()
+    return rounds / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=2_000)
+    parser.add_argument(
+        "--offers", type=int, nargs="+", default=[1, 10, 100, 1000]
+    )
+    args = parser.parse_args()
+
+    rng = Random(0)
+    print(
+        f"{'offers':>6} {'serializer':<14} {'bytes':>9} "
+        f"{'writes/s':>10} {'reads/s':>10}"
+    )
+    for offers in args.offers:
+        entry = offers_entry(offers, rng)
+        rows: List[str] = []
+        for name, serializer in SERIALIZERS.items():
+            data = serializer.dumps(entry)
+            assert serializer.loads(data) == entry
+            writes = per_second(
+                lambda: serializer.dumps(entry), args.rounds
+            )
+            reads = per_second(
+                lambda: serializer.loads(data), args.rounds
+            )
+            rows.append(
+                f"{offers:>6} {name:<14} {len(data):>9} "
+                f"{writes:>10.0f} {reads:>10.0f}"
+            )
+        print("\n".join(rows))
+
+
+if __name__ == "__main__":
+    main()
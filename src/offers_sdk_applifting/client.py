@@ -1,15 +1,53 @@
+import asyncio
+import logging
+import time
 import uuid
+from functools import partial
 from http import HTTPStatus
-from typing import Awaitable, Callable, List, Optional
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+from urllib.parse import quote
 from uuid import UUID
 
-from offers_sdk_applifting.config import ApiConfig
+from offers_sdk_applifting.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    as_async_iterator,
+    bounded_as_completed,
+)
+from offers_sdk_applifting.config import (
+    ApiConfig,
+    HttpTransport,
+    TokenStore,
+)
 from offers_sdk_applifting.exceptions import (
     AuthenticationError,
+    NotCachedError,
+    RequestTimeoutError,
     SDKError,
     ServerError,
     ValidationError,
 )
+from offers_sdk_applifting.http.auth_token.auth_token_manager import (
+    AuthTokenManager,
+)
+from offers_sdk_applifting.http.auth_token.encrypted_file_token_manager import (
+    EncryptedFileTokenManager,
+)
+from offers_sdk_applifting.http.auth_token.file_token_manager import (
+    FileTokenManager,
+)
 from offers_sdk_applifting.http.auth_token.keyring_token_manager import (
     KeyringTokenManager,
 )
@@ -18,13 +56,45 @@ from offers_sdk_applifting.http.base_client import (
     HttpResponse,
     TokenRefreshError,
 )
+from offers_sdk_applifting.http.cache.backends import (
+    CacheBackendType,
+    create_cache_backend,
+)
+from offers_sdk_applifting.http.cache.response_cache import CacheMode
+from offers_sdk_applifting.http.cache.usage import CacheFootprint
+from offers_sdk_applifting.http.concurrency_limiter import (
+    ConcurrencyMetrics,
+)
+from offers_sdk_applifting.http.connection_pool import PoolMetrics
+from offers_sdk_applifting.http.deadline import deadline_after
+from offers_sdk_applifting.http.httpx_client import HttpxClient
+from offers_sdk_applifting.http.rate_limiter import RateLimit
 from offers_sdk_applifting.http.requests_client import RequestsClient
+from offers_sdk_applifting.http.single_flight import (
+    SingleFlight,
+    SingleFlightStats,
+)
+from offers_sdk_applifting.http.thread_pool import ThreadPoolMetrics
+from offers_sdk_applifting.http.tenancy import (
+    Tenant,
+    acting_for,
+    current_tenant,
+    tenant_context,
+)
+from offers_sdk_applifting.memo import ExpiringMemo
 from offers_sdk_applifting.models import (
     Offer,
     Offers,
     Product,
     ProductID,
+    ProductIDAdapter,
 )
+from offers_sdk_applifting.registration import (
+    RegistrationReport,
+    RegistrationStatus,
+)
+
+LOGGER = logging.getLogger(__name__)
 
 TOKEN_ERROR_MESSAGES = {
     HTTPStatus.UNAUTHORIZED: "Failed to refresh token",
@@ -32,6 +102,13 @@ TOKEN_ERROR_MESSAGES = {
     HTTPStatus.UNPROCESSABLE_CONTENT: "Malformed authentication request",
 }
 
+HTTP_CLIENTS: Dict[
+    HttpTransport, Type[RequestsClient | HttpxClient]
+] = {
+    HttpTransport.REQUESTS: RequestsClient,
+    HttpTransport.HTTPX: HttpxClient,
+}
+
 
 def handle_token_refresh_error[**P, T](
     decorated_func: Callable[P, Awaitable[T]],
@@ -51,21 +128,203 @@ def handle_token_refresh_error[**P, T](
     return wrapper
 
 
+def handle_timeout_error[**P, T](
+    decorated_func: Callable[P, Awaitable[T]],
+) -> Callable[P, Awaitable[T]]:
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        try:
+            return await decorated_func(*args, **kwargs)
+        except TimeoutError as exc:
+            raise RequestTimeoutError(
+                "Request did not complete in time"
+            ) from exc
+
+    return wrapper
+
+
 class OffersClient:
     def __init__(
         self,
         api_config: ApiConfig,
         http_client: Optional[BaseHttpClient] = None,
+        eager: bool = False,
     ) -> None:
-        self._http_client = http_client or RequestsClient(
+        """
+        `eager` starts `warmup` in the background right away, so it
+        must be set within a running event loop.
+        """
+        http_client_type = HTTP_CLIENTS[api_config.http_transport]
+        self._http_client = http_client or http_client_type(
             base_url=api_config.base_url,
             refresh_token=api_config.refresh_token,
             auth_endpoint=api_config.auth_endpoint,
-            token_manager=KeyringTokenManager(
-                token_key=api_config.persistent_auth_token_key
+            token_manager=OffersClient._token_manager(api_config),
+            token_renewal_margin=api_config.token_renewal_margin,
+            retry_policy=api_config.retry_policy,
+            endpoint_retry_policies=api_config.endpoint_retry_policies,
+            connect_timeout=api_config.connect_timeout,
+            read_timeout=api_config.read_timeout,
+            rate_limit=api_config.rate_limit,
+            endpoint_rate_limits=api_config.endpoint_rate_limits,
+            adaptive_concurrency=api_config.adaptive_concurrency,
+            cache_backend=create_cache_backend(
+                api_config.cache_backend,
+                BaseHttpClient._CACHE_PATH,
+                api_config.cache_serializer,
+            )
+            if api_config.cache_backend is not None
+            else None,
+            cache_ttl=api_config.cache_ttl,
+            endpoint_cache_ttls=api_config.endpoint_cache_ttls,
+            cache_limits=api_config.cache_limits,
+            cache_stale_while_revalidate=api_config.cache_stale_while_revalidate,
+            adaptive_cache_ttl=api_config.adaptive_cache_ttl,
+            cache_early_expiration=api_config.cache_early_expiration,
+            negative_caching=api_config.negative_caching,
+            cache_fill_lock_directory=OffersClient._cache_fill_lock_directory(
+                api_config
             ),
+            max_active_tenants=api_config.max_active_tenants,
+            pool_limits=api_config.pool_limits,
+            **OffersClient._transport_options(api_config),
         )
         self._api_config = api_config
+        self._offers_flight: SingleFlight[
+            Tuple[Optional[str], UUID, CacheMode],
+            List[Offer],
+        ] = SingleFlight()
+        self._offers_memo: Optional[
+            ExpiringMemo[
+                Tuple[Optional[str], UUID], Tuple[Offer, ...]
+            ]
+        ] = (
+            ExpiringMemo(api_config.offers_memo)
+            if api_config.offers_memo is not None
+            else None
+        )
+        self._warmup_task: Optional[asyncio.Task[None]] = (
+            asyncio.create_task(self._warmup_in_background())
+            if eager
+            else None
+        )
+
+    @property
+    def coalescing_stats(self) -> SingleFlightStats:
+        return self._offers_flight.stats
+
+    @property
+    def concurrency_metrics(self) -> Optional[ConcurrencyMetrics]:
+        return self._http_client.concurrency_metrics
+
+    @property
+    def pool_metrics(self) -> Optional[PoolMetrics]:
+        return self._http_client.pool_metrics
+
+    @property
+    def thread_pool_metrics(self) -> Optional[ThreadPoolMetrics]:
+        return self._http_client.thread_pool_metrics
+
+    @property
+    def cache_footprint(self) -> Optional[CacheFootprint]:
+        return self._http_client.cache_footprint
+
+    @property
+    def learned_ttls(self) -> Dict[UUID, float]:
+        """
+        Cache lifetimes learned per product when
+        `ApiConfig.adaptive_cache_ttl` is set.
+        """
+        learned: Dict[UUID, float] = {}
+        for (
+            endpoint,
+            ttl,
+        ) in self._http_client.learned_cache_ttls.items():
+            match endpoint.split("/"):
+                case ["products", product_id, "offers"]:
+                    learned[UUID(product_id)] = ttl
+        return learned
+
+    def add_tenant(
+        self,
+        tenant_id: str,
+        refresh_token: str,
+        rate_limit: Optional[RateLimit] = None,
+    ) -> None:
+        """
+        Registers another account to call the API for, selected with the
+        `tenant` argument of each call. Tenants share this client's
+        connections, cache and limits; `rate_limit` additionally paces
+        the tenant's own requests. Its access token is stored like the
+        client's own, under a key derived from `tenant_id`.
+        """
+        self._http_client.add_tenant(
+            tenant_id,
+            Tenant(
+                refresh_token=refresh_token,
+                token_manager=partial(
+                    OffersClient._token_manager,
+                    self._api_config,
+                    tenant_id,
+                ),
+                rate_limit=rate_limit,
+            ),
+        )
+
+    async def invalidate(
+        self, product_id: UUID, tenant: Optional[str] = None
+    ) -> None:
+        """
+        Drops the cached offers of one product, so the next
+        `get_offers` call fetches them from the server.
+        """
+        with acting_for(tenant):
+            if self._offers_memo is not None:
+                self._offers_memo.invalidate(
+                    (current_tenant(), product_id)
+                )
+            await self._http_client.invalidate(
+                OffersClient._offers_endpoint(product_id)
+            )
+
+    async def invalidate_all(self) -> None:
+        """
+        Drops the cached offers of every product and tenant.
+        """
+
+        if self._offers_memo is not None:
+            self._offers_memo.clear()
+        await self._http_client.invalidate_all()
+
+    @handle_timeout_error
+    @handle_token_refresh_error
+    async def warmup(self, deadline: Optional[float] = None) -> None:
+        """
+        Refreshes the access token if needed and opens the cache and
+        `ApiConfig.warmup_connections` connections to the server, so
+        the first call is as fast as later ones.
+        """
+        async with deadline_after(deadline):
+            await self._http_client.warmup(
+                self._api_config.warmup_connections
+            )
+
+    async def _warmup_in_background(self) -> None:
+        try:
+            await self.warmup()
+        except Exception:
+            # the first call retries whatever failed and reports it
+            LOGGER.warning("Eager warm-up failed", exc_info=True)
+
+    async def aclose(self) -> None:
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+        await self._http_client.aclose()
+
+    async def __aenter__(self) -> OffersClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
 
     @staticmethod
     def _validate_response(resp: HttpResponse) -> None:
@@ -93,29 +352,275 @@ class OffersClient:
                 )
         OffersClient._validate_response(resp)
 
+    @handle_timeout_error
     @handle_token_refresh_error
-    async def get_offers(self, product_id: UUID) -> List[Offer]:
+    async def get_offers(
+        self,
+        product_id: UUID,
+        deadline: Optional[float] = None,
+        cache: CacheMode = CacheMode.DEFAULT,
+        tenant: Optional[str] = None,
+    ) -> List[Offer]:
+        """
+        `deadline` bounds the whole call in seconds, including token
+        refresh, retries and backoff, and raises `RequestTimeoutError`
+        when exceeded.
+
+        `cache` selects how the call uses cached offers: `REFRESH`
+        fetches fresh offers and caches them, `BYPASS` fetches without
+        touching the cache and `ONLY_IF_CACHED` raises `NotCachedError`
+        instead of contacting the server.
+
+        `tenant` calls on behalf of an account added with `add_tenant`.
+        """
+        with acting_for(tenant):
+            memo_key = (current_tenant(), product_id)
+            if (
+                cache.reads
+                and self._offers_memo is not None
+                and (memoized := self._offers_memo.get(memo_key))
+                is not None
+            ):
+                return list(memoized)
+            async with deadline_after(deadline):
+                # concurrent callers for the same product share one
+                # request and one parsed result, fetched without a
+                # deadline; each gets its own list of the frozen offers
+                offers = await self._offers_flight.do(
+                    (*memo_key, cache),
+                    lambda: self._fetch_offers(product_id, cache),
+                    context=tenant_context(),
+                )
+        return list(offers)
+
+    def get_offers_many(
+        self,
+        product_ids: Iterable[UUID] | AsyncIterable[UUID],
+        max_concurrency: Optional[int] = None,
+        deadline: Optional[float] = None,
+        cache: CacheMode = CacheMode.DEFAULT,
+        tenant: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[UUID, List[Offer] | Exception]]:
+        """
+        Fetches offers for many products with bounded concurrency,
+        yielding `(product_id, offers_or_error)` as each completes.
+        Errors are the same ones `get_offers` raises and are yielded
+        per product instead of aborting the batch. `deadline`, `cache`
+        and `tenant` apply to each product.
+        """
+        return bounded_as_completed(
+            product_ids,
+            partial(
+                self.get_offers,
+                deadline=deadline,
+                cache=cache,
+                tenant=tenant,
+            ),
+            self._batch_concurrency(max_concurrency),
+        )
+
+    def _batch_concurrency(
+        self, max_concurrency: Optional[int]
+    ) -> int | Callable[[], int]:
+        """
+        An explicit `max_concurrency` wins; otherwise batches follow the
+        HTTP client's adaptive limit when one is configured.
+        """
+        if max_concurrency is not None:
+            return max_concurrency
+        limiter = self._http_client.concurrency_limiter
+        if limiter is None:
+            return DEFAULT_MAX_CONCURRENCY
+        return lambda: limiter.limit
+
+    @staticmethod
+    def _token_manager(
+        api_config: ApiConfig, tenant_id: Optional[str] = None
+    ) -> AuthTokenManager:
+        token_key = file_name = api_config.persistent_auth_token_key
+        if tenant_id is not None:
+            token_key = f"{token_key or 'default'}.{tenant_id}"
+            # keeps ids such as "../x" inside the tokens directory
+            file_name = f"{file_name or 'default'}.{quote(tenant_id, safe='')}"
+        if (
+            api_config.token_store == TokenStore.KEYRING
+            and not api_config.multiprocess
+        ):
+            return KeyringTokenManager(token_key=token_key)
+        path = (
+            BaseHttpClient._CACHE_PATH
+            / "tokens"
+            / (file_name or "default")
+        )
+        if api_config.token_encryption_key is None:
+            return FileTokenManager(path)
+        return EncryptedFileTokenManager(
+            path, api_config.token_encryption_key
+        )
+
+    @staticmethod
+    def _transport_options(api_config: ApiConfig) -> Dict[str, Any]:
+        # httpx needs no threads
+        if api_config.http_transport == HttpTransport.REQUESTS:
+            return {"thread_pool": api_config.thread_pool}
+        return {}
+
+    @staticmethod
+    def _cache_fill_lock_directory(
+        api_config: ApiConfig,
+    ) -> Optional[Path]:
+        # a per-process cache has nothing to share
+        if (
+            not api_config.multiprocess
+            or api_config.cache_backend == CacheBackendType.MEMORY
+        ):
+            return None
+        return BaseHttpClient._CACHE_PATH / "locks"
+
+    @staticmethod
+    def _offers_endpoint(product_id: UUID) -> str:
+        return f"products/{product_id}/offers"
+
+    async def _fetch_offers(
+        self, product_id: UUID, cache: CacheMode
+    ) -> List[Offer]:
         resp = await self._http_client.get(
-            f"products/{product_id}/offers"
+            OffersClient._offers_endpoint(product_id),
+            cache_mode=cache,
         )
+        if (
+            cache == CacheMode.ONLY_IF_CACHED
+            and resp.status_code == HTTPStatus.GATEWAY_TIMEOUT
+        ):
+            raise NotCachedError(
+                f"No cached offers for product {product_id}"
+            )
         OffersClient._validate_response(resp)
-        offers: List[Offer] = Offers.validate_python(
-            resp.get_json_as(list)
-        )
+        offers: List[Offer] = resp.validate_as(Offers)
+        # the validated offers stay valid exactly as long as the cached
+        # response they were built from
+        if (
+            self._offers_memo is not None
+            and resp.expires_at is not None
+        ):
+            self._offers_memo.put(
+                (current_tenant(), product_id),
+                tuple(offers),
+                resp.expires_at,
+            )
         return offers
 
-    @handle_token_refresh_error
-    async def register_product(
-        self, product: Product, product_id: Optional[UUID] = None
-    ) -> ProductID:
-        product_id = product_id or uuid.uuid7()
+    @staticmethod
+    def _is_retried_conflict(resp: HttpResponse) -> bool:
+        # product IDs are assigned client-side, so a conflict on a
+        # retried attempt means an earlier attempt of this very request
+        # was registered before its response got lost
+        return (
+            resp.status_code == HTTPStatus.CONFLICT
+            and resp.attempts > 1
+        )
+
+    async def _post_registration(
+        self, product: Product, product_id: UUID
+    ) -> HttpResponse:
         id_payload = {"id": str(product_id)}
-        response = await self._http_client.post(
+        return await self._http_client.post(
             "products/register",
             data=product.model_dump() | id_payload,
         )
+
+    @handle_timeout_error
+    @handle_token_refresh_error
+    async def register_product(
+        self,
+        product: Product,
+        product_id: Optional[UUID] = None,
+        deadline: Optional[float] = None,
+        tenant: Optional[str] = None,
+    ) -> ProductID:
+        product_id = product_id or uuid.uuid7()
+        with acting_for(tenant):
+            async with deadline_after(deadline):
+                response = await self._post_registration(
+                    product, product_id
+                )
+        if OffersClient._is_retried_conflict(response):
+            return ProductID(id=str(product_id))
         OffersClient._validate_register_product_response(
             response, product_id
         )
-        data = response.get_json_as(dict)
-        return ProductID(**data)
+        return response.validate_as(ProductIDAdapter)
+
+    async def register_products(
+        self,
+        products: Iterable[Product | Tuple[Product, UUID]]
+        | AsyncIterable[Product | Tuple[Product, UUID]],
+        max_concurrency: Optional[int] = None,
+        deadline: Optional[float] = None,
+        tenant: Optional[str] = None,
+    ) -> RegistrationReport:
+        """
+        Registers a stream of products through a bounded worker pool.
+        Products without an explicit `(product, product_id)` pairing are
+        assigned a uuid7 ID up front, so retries stay idempotent.
+        `deadline` applies to each product, all of which are registered
+        for `tenant`.
+        """
+        started = time.monotonic()
+        succeeded: List[UUID] = []
+        conflicted: List[UUID] = []
+        failed: Dict[UUID, Exception] = {}
+        async for (_, product_id), outcome in bounded_as_completed(
+            OffersClient._with_product_ids(products),
+            partial(
+                self._register_with_status,
+                deadline=deadline,
+                tenant=tenant,
+            ),
+            self._batch_concurrency(max_concurrency),
+        ):
+            match outcome:
+                case RegistrationStatus.SUCCEEDED:
+                    succeeded.append(product_id)
+                case RegistrationStatus.CONFLICTED:
+                    conflicted.append(product_id)
+                case Exception() as exc:
+                    failed[product_id] = exc
+        return RegistrationReport(
+            succeeded=succeeded,
+            conflicted=conflicted,
+            failed=failed,
+            elapsed_seconds=time.monotonic() - started,
+        )
+
+    @staticmethod
+    async def _with_product_ids(
+        products: Iterable[Product | Tuple[Product, UUID]]
+        | AsyncIterable[Product | Tuple[Product, UUID]],
+    ) -> AsyncIterator[Tuple[Product, UUID]]:
+        async for item in as_async_iterator(products):
+            if isinstance(item, Product):
+                yield item, uuid.uuid7()
+            else:
+                yield item
+
+    @handle_timeout_error
+    @handle_token_refresh_error
+    async def _register_with_status(
+        self,
+        item: Tuple[Product, UUID],
+        deadline: Optional[float] = None,
+        tenant: Optional[str] = None,
+    ) -> RegistrationStatus:
+        product, product_id = item
+        with acting_for(tenant):
+            async with deadline_after(deadline):
+                response = await self._post_registration(
+                    product, product_id
+                )
+        if response.status_code == HTTPStatus.CONFLICT:
+            if OffersClient._is_retried_conflict(response):
+                return RegistrationStatus.SUCCEEDED
+            return RegistrationStatus.CONFLICTED
+        OffersClient._validate_response(response)
+        return RegistrationStatus.SUCCEEDED
@@ -0,0 +1,82 @@
+import asyncio
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Tuple,
+)
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+async def as_async_iterator[T](
+    items: Iterable[T] | AsyncIterable[T],
+) -> AsyncIterator[T]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def bounded_as_completed[T, R](
+    items: Iterable[T] | AsyncIterable[T],
+    func: Callable[[T], Awaitable[R]],
+    max_concurrency: int
+    | Callable[[], int] = DEFAULT_MAX_CONCURRENCY,
+) -> AsyncIterator[Tuple[T, R | Exception]]:
+    """
+    Applies `func` to `items` with at most `max_concurrency` calls in
+    flight and yields `(item, result_or_exception)` as calls complete.
+    A callable `max_concurrency` is re-read whenever a slot frees up,
+    so the window can follow an adaptive limit.
+
+    Items are pulled from the source only when a slot frees up and the
+    consumer has taken the finished results, so memory stays flat for
+    arbitrarily long inputs. A failing item is yielded with its
+    exception and does not stop the rest of the batch.
+    """
+    current_limit = (
+        max_concurrency
+        if callable(max_concurrency)
+        else lambda: max_concurrency
+    )
+    if current_limit() < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    source = as_async_iterator(items)
+    pending: Dict[asyncio.Future[R], T] = {}
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < max(
+                current_limit(), 1
+            ):
+                try:
+                    item = await anext(source)
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending[asyncio.ensure_future(func(item))] = item
+            if not pending:
+                return
+
+            done, _ = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                item = pending.pop(future)
+                outcome: R | Exception
+                try:
+                    outcome = future.result()
+                except Exception as exc:
+                    outcome = exc
+                yield item, outcome
+    finally:
+        # the consumer stopped early or was cancelled
+        for future in pending:
+            future.cancel()
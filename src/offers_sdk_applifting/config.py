@@ -1,6 +1,51 @@
 import os
-from dataclasses import dataclass
-from typing import Type
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Mapping, Optional, Type
+
+from offers_sdk_applifting.http.cache.adaptive_ttl import AdaptiveTtl
+from offers_sdk_applifting.http.cache.backends import CacheBackendType
+from offers_sdk_applifting.http.cache.early_expiration import (
+    EarlyExpiration,
+)
+from offers_sdk_applifting.http.cache.negative_caching import (
+    NegativeCaching,
+)
+from offers_sdk_applifting.http.cache.response_cache import (
+    DEFAULT_CACHE_TTL_SECONDS,
+)
+from offers_sdk_applifting.http.cache.serialization import (
+    BinaryCacheSerializer,
+    CacheSerializer,
+)
+from offers_sdk_applifting.http.cache.usage import CacheLimits
+from offers_sdk_applifting.http.concurrency_limiter import (
+    AdaptiveConcurrency,
+)
+from offers_sdk_applifting.http.connection_pool import PoolLimits
+from offers_sdk_applifting.http.rate_limiter import RateLimit
+from offers_sdk_applifting.http.retry import RetryPolicy
+from offers_sdk_applifting.http.thread_pool import ThreadPoolLimits
+from offers_sdk_applifting.http.tenancy import (
+    DEFAULT_MAX_ACTIVE_TENANTS,
+)
+from offers_sdk_applifting.memo import MemoLimits
+
+
+class HttpTransport(StrEnum):
+    REQUESTS = "requests"
+    HTTPX = "httpx"
+
+
+class TokenStore(StrEnum):
+    """
+    Where the access token is kept between runs. `FILE` suits servers
+    without a keyring and is encrypted when a
+    `token_encryption_key` is set.
+    """
+
+    KEYRING = "keyring"
+    FILE = "file"
 
 
 @dataclass(frozen=True)
@@ -9,11 +54,55 @@ class ApiConfig:
     auth_endpoint: str
     refresh_token: str
     persistent_auth_token_key: str
+    http_transport: HttpTransport = HttpTransport.REQUESTS
+    token_store: TokenStore = TokenStore.KEYRING
+    token_encryption_key: Optional[str] = field(
+        default=None, repr=False
+    )
+    token_renewal_margin: Optional[float] = None
+    # keep-alive connections opened by `OffersClient.warmup`
+    warmup_connections: int = 1
+    retry_policy: RetryPolicy = RetryPolicy()
+    endpoint_retry_policies: Mapping[str, RetryPolicy] = field(
+        default_factory=dict
+    )
+    connect_timeout: Optional[float] = 5.0
+    read_timeout: Optional[float] = 30.0
+    pool_limits: PoolLimits = PoolLimits()
+    # worker threads of the requests transport
+    thread_pool: ThreadPoolLimits = ThreadPoolLimits()
+    rate_limit: Optional[RateLimit] = None
+    endpoint_rate_limits: Mapping[str, RateLimit] = field(
+        default_factory=dict
+    )
+    adaptive_concurrency: Optional[AdaptiveConcurrency] = None
+    cache_backend: Optional[CacheBackendType] = (
+        CacheBackendType.FILESYSTEM
+    )
+    cache_serializer: CacheSerializer = BinaryCacheSerializer()
+    cache_ttl: Optional[float] = DEFAULT_CACHE_TTL_SECONDS
+    endpoint_cache_ttls: Mapping[str, Optional[float]] = field(
+        default_factory=dict
+    )
+    cache_limits: Optional[CacheLimits] = None
+    cache_stale_while_revalidate: float = 0.0
+    adaptive_cache_ttl: Optional[AdaptiveTtl] = None
+    cache_early_expiration: Optional[EarlyExpiration] = None
+    negative_caching: Optional[NegativeCaching] = None
+    offers_memo: Optional[MemoLimits] = MemoLimits()
+    # share the token and cache fills between worker processes; the
+    # token is then kept in a file
+    multiprocess: bool = False
+    # tenants whose token state is kept in memory at once
+    max_active_tenants: int = DEFAULT_MAX_ACTIVE_TENANTS
 
     BASE_URL_ENV_KEY = "OFFERS_API_BASE_URL"
     AUTH_ENDPOINT_ENV_KEY = "AUTH_ENDPOINT"
     REFRESH_TOKEN_ENV_KEY = "REFRESH_TOKEN"
     PERSISTENT_AUTH_TOKEN_KEY = "PERSISTENT_TOKEN_KEY"
+    HTTP_TRANSPORT_ENV_KEY = "OFFERS_HTTP_TRANSPORT"
+    TOKEN_STORE_ENV_KEY = "OFFERS_TOKEN_STORE"
+    TOKEN_ENCRYPTION_KEY_ENV_KEY = "OFFERS_TOKEN_ENCRYPTION_KEY"
 
     @classmethod
     def from_env(cls: Type[ApiConfig]) -> ApiConfig:
@@ -29,6 +118,21 @@ class ApiConfig:
                 persistent_auth_token_key=os.environ[
                     ApiConfig.PERSISTENT_AUTH_TOKEN_KEY
                 ],
+                http_transport=HttpTransport(
+                    os.environ.get(
+                        ApiConfig.HTTP_TRANSPORT_ENV_KEY,
+                        HttpTransport.REQUESTS,
+                    )
+                ),
+                token_store=TokenStore(
+                    os.environ.get(
+                        ApiConfig.TOKEN_STORE_ENV_KEY,
+                        TokenStore.KEYRING,
+                    )
+                ),
+                token_encryption_key=os.environ.get(
+                    ApiConfig.TOKEN_ENCRYPTION_KEY_ENV_KEY
+                ),
             )
         except KeyError as e:
             missing_var = e.args[0]
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from offers_sdk_applifting.http.base_client import HttpResponse
+from offers_sdk_applifting.http.http_response import HttpResponse
 
 
 class SDKError(Exception):
@@ -44,3 +44,39 @@ class ValidationError(SDKError):
     """
 
     pass
+
+
+class RequestTimeoutError(SDKError):
+    """
+    Exception raised when a call does not complete within its deadline
+    or a request exceeds the configured transport timeouts.
+    """
+
+    pass
+
+
+class NotCachedError(SDKError):
+    """
+    Exception raised when a call restricted to cached data finds
+    nothing in the cache.
+    """
+
+    pass
+
+
+class ThreadPoolSaturatedError(SDKError, RuntimeError):
+    """
+    Exception raised when the requests transport's worker threads and
+    their queue stay full for longer than the queue timeout.
+    """
+
+    pass
+
+
+class UnknownTenantError(SDKError, LookupError):
+    """
+    Exception raised when a call acts for a tenant that was never
+    added with `add_tenant`.
+    """
+
+    pass
@@ -1,8 +1,11 @@
 import logging
+import math
+import time
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from functools import lru_cache
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 import jwt
 
@@ -10,6 +13,10 @@ LOGGER = logging.getLogger(__name__)
 
 
 class AuthTokenManager(ABC):
+    # whether other processes read the stored token, so it must be
+    # stored before they are let in to refresh it
+    shares_storage = False
+
     def __init__(self) -> None:
         super().__init__()
         token = self.get_token()
@@ -22,21 +29,67 @@ class AuthTokenManager(ABC):
             self._token_expiry: datetime = datetime.min.replace(
                 tzinfo=timezone.utc
             )
+            self._token_deadline: float = -math.inf
 
     def update_auth_token(
         self, valid_token: str, save: bool = False
     ) -> None:
         self._access_token = valid_token
         self._token_expiry = self._decode_jwt_expiry(valid_token)
+        # the wall clock is read once per token; expiry checks on the
+        # request path compare against the monotonic clock instead
+        self._token_deadline = (
+            time.monotonic()
+            + (
+                self._token_expiry - datetime.now(timezone.utc)
+            ).total_seconds()
+        )
         if save:
             self.set_token(valid_token)
 
+    @property
+    def access_token(self) -> Optional[str]:
+        """
+        The token in use, without reading storage.
+        """
+        return self._access_token
+
     def is_current_token_expired(self) -> bool:
         return (
             self._access_token is None
-            or self._token_expiry <= datetime.now(timezone.utc)
+            or self._token_deadline <= time.monotonic()
         )
 
+    def seconds_until_expiry(self) -> float:
+        if self._access_token is None:
+            return -math.inf
+        return self._token_deadline - time.monotonic()
+
+    def reload_token(self) -> bool:
+        """
+        Adopts the stored token if it outlives the current one, e.g.
+        because another process refreshed it. Returns whether it did.
+        """
+        token = self.get_token()
+        if (
+            not token
+            or token == self._access_token
+            or not self._is_string_valid_token(token)
+            or self._decode_jwt_expiry(token) <= self._token_expiry
+        ):
+            return False
+        LOGGER.debug("Loaded refreshed token from storage.")
+        self.update_auth_token(token)
+        return True
+
+    @asynccontextmanager
+    async def exclusive_refresh(self) -> AsyncIterator[None]:
+        """
+        Held while the token is refreshed. Managers whose storage is
+        shared between processes lock it, so only one of them refreshes.
+        """
+        yield
+
     @abstractmethod
     def get_token(self) -> Optional[str]:
         pass
@@ -0,0 +1,37 @@
+import logging
+from pathlib import Path
+from typing import Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from offers_sdk_applifting.http.auth_token.file_token_manager import (
+    FileTokenManager,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class EncryptedFileTokenManager(FileTokenManager):
+    """
+    `FileTokenManager` whose file is encrypted and authenticated with
+    Fernet (AES-128-CBC and HMAC-SHA256), for servers without a keyring.
+    `key` is a key from `Fernet.generate_key()`, typically read from a
+    secret. A file that cannot be decrypted, e.g. after the key was
+    rotated, counts as no stored token.
+    """
+
+    def __init__(self, path: Path, key: str | bytes) -> None:
+        self._fernet = Fernet(key)
+        super().__init__(path)
+
+    def _encode(self, token: str) -> bytes:
+        return self._fernet.encrypt(token.encode())
+
+    def _decode(self, data: bytes) -> Optional[str]:
+        try:
+            return self._fernet.decrypt(data).decode()
+        except InvalidToken:
+            LOGGER.warning(
+                "Stored access token could not be decrypted"
+            )
+            return None
@@ -0,0 +1,58 @@
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from offers_sdk_applifting.http.auth_token.auth_token_manager import (
+    AuthTokenManager,
+)
+from offers_sdk_applifting.http.file_lock import FileLock
+
+
+class FileTokenManager(AuthTokenManager):
+    """
+    Keeps the access token in a file readable only by its owner, so
+    every process of a multi-worker server shares one token. Refreshes
+    are serialized through a lock file next to it, so a worker whose
+    token expired picks up the one another worker just fetched instead
+    of refreshing it again.
+    """
+
+    shares_storage = True
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        super().__init__()
+
+    def get_token(self) -> Optional[str]:
+        try:
+            data = self._path.read_bytes()
+        except FileNotFoundError:
+            return None
+        return self._decode(data) if data else None
+
+    def set_token(self, token: str) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # mkstemp creates the file with 0600 permissions
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self._path.parent, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(self._encode(token))
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    @asynccontextmanager
+    async def exclusive_refresh(self) -> AsyncIterator[None]:
+        async with FileLock(self._path.with_suffix(".lock")).hold():
+            yield
+
+    def _encode(self, token: str) -> bytes:
+        return token.encode()
+
+    def _decode(self, data: bytes) -> Optional[str]:
+        return data.decode().strip() or None
@@ -1,11 +1,15 @@
+import logging
 from typing import Optional
 
 import keyring
+from keyring.errors import KeyringError
 
 from offers_sdk_applifting.http.auth_token.auth_token_manager import (
     AuthTokenManager,
 )
 
+LOGGER = logging.getLogger(__name__)
+
 
 class KeyringTokenManager(AuthTokenManager):
     _KEYRING_SERVICE_NAME = "offers_sdk"
@@ -15,9 +19,15 @@ class KeyringTokenManager(AuthTokenManager):
         super().__init__()
 
     def get_token(self) -> Optional[str]:
-        token = keyring.get_password(
-            KeyringTokenManager._KEYRING_SERVICE_NAME, self._token_key
-        )
+        try:
+            token = keyring.get_password(
+                KeyringTokenManager._KEYRING_SERVICE_NAME,
+                self._token_key,
+            )
+        except KeyringError:
+            # e.g. no keyring backend in a container
+            LOGGER.warning("Keyring unavailable", exc_info=True)
+            return None
         return token
 
     def set_token(self, token: str) -> None:
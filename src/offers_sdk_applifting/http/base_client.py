@@ -1,14 +1,78 @@
+import asyncio
+import contextvars
 import logging
+import os
+import time
+import weakref
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from http import HTTPStatus
 from pathlib import Path
 from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ClassVar,
     Dict,
+    Hashable,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
 )
 
+from offers_sdk_applifting.exceptions import UnknownTenantError
 from offers_sdk_applifting.http.auth_token.auth_token_manager import (
     AuthTokenManager,
 )
+from offers_sdk_applifting.http.cache.adaptive_ttl import AdaptiveTtl
+from offers_sdk_applifting.http.cache.backends import CacheBackend
+from offers_sdk_applifting.http.cache.early_expiration import (
+    EarlyExpiration,
+)
+from offers_sdk_applifting.http.cache.negative_caching import (
+    NegativeCaching,
+)
+from offers_sdk_applifting.http.cache.response_cache import (
+    DEFAULT_CACHE_TTL_SECONDS,
+    CacheMode,
+    ResponseCache,
+)
+from offers_sdk_applifting.http.cache.usage import (
+    CacheFootprint,
+    CacheLimits,
+)
+from offers_sdk_applifting.http.concurrency_limiter import (
+    AdaptiveConcurrency,
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyMetrics,
+)
+from offers_sdk_applifting.http.connection_pool import PoolMetrics
+from offers_sdk_applifting.http.deadline import remaining_seconds
+from offers_sdk_applifting.http.endpoint_rules import EndpointRules
 from offers_sdk_applifting.http.http_response import HttpResponse
+from offers_sdk_applifting.http.rate_limiter import (
+    RateLimit,
+    RateLimiter,
+)
+from offers_sdk_applifting.http.retry import (
+    RetryBudget,
+    RetryPolicy,
+    parse_retry_after,
+)
+from offers_sdk_applifting.http.single_flight import (
+    SingleFlight,
+    SingleFlightStats,
+)
+from offers_sdk_applifting.http.thread_pool import ThreadPoolMetrics
+from offers_sdk_applifting.http.tenancy import (
+    DEFAULT_MAX_ACTIVE_TENANTS,
+    Tenant,
+    TenantSession,
+    current_tenant,
+    tenant_context,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +89,15 @@ class BaseHttpClient(ABC):
     _ACCESS_TOKEN_HEADER_KEY = "Bearer"
     _REFRESH_TOKEN_HEADER_KEY = "Bearer"
     _CACHE_PATH = Path.home() / ".cache" / "offers_sdk"
+    _MIN_RENEWAL_INTERVAL_SECONDS = 1.0
+    # transport errors worth another attempt, set by each transport
+    _RETRYABLE_EXCEPTIONS: Tuple[Type[Exception], ...] = ()
+    # transport timeouts, surfaced as the builtin TimeoutError
+    _TIMEOUT_EXCEPTIONS: Tuple[Type[Exception], ...] = ()
+    # live clients of this process, reset in forked children
+    _INSTANCES: ClassVar[weakref.WeakSet[BaseHttpClient]] = (
+        weakref.WeakSet()
+    )
 
     def __init__(
         self,
@@ -33,72 +106,896 @@ class BaseHttpClient(ABC):
         refresh_token: str,
         auth_endpoint: str,
         token_manager: AuthTokenManager,
+        token_renewal_margin: Optional[float] = None,
+        retry_policy: RetryPolicy = RetryPolicy(),
+        endpoint_retry_policies: Mapping[str, RetryPolicy] = {},
+        retry_budget: Optional[RetryBudget] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        rate_limit: Optional[RateLimit] = None,
+        endpoint_rate_limits: Mapping[str, RateLimit] = {},
+        adaptive_concurrency: Optional[AdaptiveConcurrency] = None,
+        cache_backend: Optional[CacheBackend] = None,
+        cache_ttl: Optional[float] = DEFAULT_CACHE_TTL_SECONDS,
+        endpoint_cache_ttls: Mapping[str, Optional[float]] = {},
+        cache_limits: Optional[CacheLimits] = None,
+        cache_stale_while_revalidate: float = 0.0,
+        adaptive_cache_ttl: Optional[AdaptiveTtl] = None,
+        cache_early_expiration: Optional[EarlyExpiration] = None,
+        negative_caching: Optional[NegativeCaching] = None,
+        cache_fill_lock_directory: Optional[Path] = None,
+        max_active_tenants: int = DEFAULT_MAX_ACTIVE_TENANTS,
     ) -> None:
+        """
+        `token_renewal_margin` enables a background task that renews the
+        access token this many seconds before it expires, so requests
+        never wait on a refresh.
+
+        `retry_policy` applies to every endpoint not matched by a glob
+        pattern in `endpoint_retry_policies`. All retries of the client
+        draw from one `retry_budget`.
+
+        `connect_timeout` and `read_timeout` bound each attempt; `None`
+        waits indefinitely unless a deadline is in effect.
+
+        `rate_limit` and `endpoint_rate_limits` pace every attempt,
+        retries and token refreshes included, on the client side.
+
+        `adaptive_concurrency` caps in-flight attempts at a limit that
+        follows the server's health.
+
+        `cache_backend` enables caching of successful GET responses for
+        `cache_ttl` seconds, or per glob pattern in `endpoint_cache_ttls`
+        (`None` disables caching). `cache_limits` bounds the cache and
+        enables periodic sweeping of expired entries. For
+        `cache_stale_while_revalidate` seconds after expiry, an entry is
+        still served while a single background request refreshes it.
+        `adaptive_cache_ttl` lets each endpoint's TTL follow how often
+        its responses change. `cache_early_expiration` refreshes entries
+        cached together at different times, in the background.
+        `negative_caching` also caches not-found and empty responses,
+        for a shorter time. Processes sharing `cache_backend` and
+        `cache_fill_lock_directory` fetch each missing entry only once.
+
+        Tenants added with `add_tenant` share the connections, cache
+        and limits of the client. Only the token state of the
+        `max_active_tenants` most recently active ones is kept.
+
+        Clients survive `os.fork`: the child drops its parent's
+        connections, background tasks and in-flight requests.
+        """
         self._base_url = base_url
-        self._refresh_token = refresh_token
         self._auth_endpoint = auth_endpoint
-        self._default_headers: Dict[str, str] = {}
-        self._token_manager = token_manager
-        self._update_headers_with_token_on_load()
+        self._own_session = TenantSession(
+            refresh_token, token_manager
+        )
+        self._tenants: Dict[str, Tenant] = {}
+        self._tenant_sessions: OrderedDict[str, TenantSession] = (
+            OrderedDict()
+        )
+        self._session_loads: SingleFlight[str, TenantSession] = (
+            SingleFlight()
+        )
+        self._max_active_tenants = max_active_tenants
+        self._token_renewal_margin = token_renewal_margin
+        self._get_flight: SingleFlight[Hashable, HttpResponse] = (
+            SingleFlight()
+        )
+        self._retry_policies = EndpointRules(
+            retry_policy, endpoint_retry_policies
+        )
+        self._retry_budget = retry_budget or RetryBudget()
+        self._paused_until = 0.0
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._rate_limit = rate_limit
+        self._endpoint_rate_limits = endpoint_rate_limits
+        self._adaptive_concurrency = adaptive_concurrency
+        self._reset_limiters()
+        self._cache_limits = cache_limits
+        self._response_cache = (
+            ResponseCache(
+                cache_backend,
+                namespace=base_url,
+                ttl=cache_ttl,
+                endpoint_ttls=endpoint_cache_ttls,
+                excluded_endpoints=[auth_endpoint],
+                limits=cache_limits,
+                stale_while_revalidate=cache_stale_while_revalidate,
+                adaptive_ttl=adaptive_cache_ttl,
+                early_expiration=cache_early_expiration,
+                negative_caching=negative_caching,
+                fill_lock_directory=cache_fill_lock_directory,
+            )
+            if cache_backend is not None
+            else None
+        )
+        self._revalidations: Dict[str, asyncio.Task[None]] = {}
+        self._cache_sweeper_task: Optional[asyncio.Task[None]] = None
+        self._update_headers_with_token_on_load(self._own_session)
+        BaseHttpClient._INSTANCES.add(self)
+
+    def add_tenant(self, tenant_id: str, tenant: Tenant) -> None:
+        """
+        Lets calls made within `acting_for(tenant_id)` act for `tenant`.
+        """
+        self._tenants[tenant_id] = tenant
+        # a replaced tenant starts over with its new credentials
+        if (
+            session := self._tenant_sessions.pop(tenant_id, None)
+        ) is not None:
+            session.stop_renewal()
+
+    def _tenant_session(self) -> TenantSession:
+        """
+        The current tenant's session, once `_load_tenant_session`
+        opened it.
+        """
+        tenant_id = current_tenant()
+        if tenant_id is None:
+            return self._own_session
+        self._tenant_sessions.move_to_end(tenant_id)
+        return self._tenant_sessions[tenant_id]
+
+    async def _load_tenant_session(self) -> TenantSession:
+        """
+        The current tenant's session. A new one reads its stored token
+        on a worker thread rather than on the event loop.
+        """
+        tenant_id = current_tenant()
+        if tenant_id is None or tenant_id in self._tenant_sessions:
+            return self._tenant_session()
+        tenant = self._tenant(tenant_id)
+        return await self._session_loads.do(
+            tenant_id, lambda: self._open_session(tenant_id, tenant)
+        )
+
+    async def _open_session(
+        self, tenant_id: str, tenant: Tenant
+    ) -> TenantSession:
+        session = await asyncio.to_thread(
+            BaseHttpClient._new_tenant_session, tenant
+        )
+        # a tenant replaced meanwhile starts over on its next call
+        if self._tenants.get(tenant_id) is tenant:
+            self._tenant_sessions[tenant_id] = session
+            self._evict_idle_sessions()
+        return session
+
+    @staticmethod
+    def _new_tenant_session(tenant: Tenant) -> TenantSession:
+        session = TenantSession(
+            tenant.refresh_token,
+            tenant.token_manager(),
+            tenant.rate_limit,
+        )
+        BaseHttpClient._update_headers_with_token_on_load(session)
+        return session
+
+    def _evict_idle_sessions(self) -> None:
+        excess = len(self._tenant_sessions) - self._max_active_tenants
+        if excess <= 0:
+            return
+        # least recently used first, never the one about to be used;
+        # sessions serving requests stay, so more tenants than the
+        # limit may be active for a while
+        idle = [
+            tenant_id
+            for tenant_id, session in list(
+                self._tenant_sessions.items()
+            )[:-1]
+            if session.in_flight == 0
+        ][:excess]
+        for tenant_id in idle:
+            # its token stays stored and is reloaded on its next call
+            self._tenant_sessions.pop(tenant_id).stop_renewal()
+
+    @asynccontextmanager
+    async def _session_in_use(self) -> AsyncIterator[TenantSession]:
+        """
+        The current tenant's session, kept from eviction until the
+        block is left.
+        """
+        session = await self._load_tenant_session()
+        session.in_flight += 1
+        try:
+            yield session
+        finally:
+            session.in_flight -= 1
+
+    @staticmethod
+    def _request_headers(
+        session: TenantSession, headers: Mapping[str, str]
+    ) -> Dict[str, str]:
+        # read per attempt, so retries carry a refreshed token
+        return dict(headers) | session.headers
+
+    def _tenant(self, tenant_id: str) -> Tenant:
+        try:
+            return self._tenants[tenant_id]
+        except KeyError:
+            raise UnknownTenantError(
+                f"Unknown tenant: {tenant_id}"
+            ) from None
 
-    def _update_headers_with_token_on_load(self) -> None:
-        if not self._token_manager.is_current_token_expired():
+    def _check_tenant(self) -> None:
+        if (tenant_id := current_tenant()) is not None:
+            self._tenant(tenant_id)
+
+    @property
+    def _refresh_token(self) -> str:
+        return self._tenant_session().refresh_token
+
+    @property
+    def _token_manager(self) -> AuthTokenManager:
+        return self._tenant_session().token_manager
+
+    @property
+    def _default_headers(self) -> Dict[str, str]:
+        """
+        Headers sent with every request of the current tenant.
+        """
+        return self._tenant_session().headers
+
+    @classmethod
+    def _reset_instances_after_fork(cls) -> None:
+        for client in list(cls._INSTANCES):
+            client._after_fork()
+
+    def _after_fork(self) -> None:
+        """
+        Runs in a forked child. Tasks and pending calls belong to the
+        parent's event loop; transports extend this to reopen their
+        connections.
+        """
+        self._own_session.after_fork()
+        self._tenant_sessions.clear()
+        # in-flight counts and waiters are the parent's
+        self._reset_limiters()
+        self._session_loads = SingleFlight()
+        self._get_flight = SingleFlight()
+        self._revalidations = {}
+        self._cache_sweeper_task = None
+        if self._response_cache is not None:
+            self._response_cache.after_fork()
+
+    def _reset_limiters(self) -> None:
+        self._rate_limiter = RateLimiter(
+            self._rate_limit, self._endpoint_rate_limits
+        )
+        self._concurrency_limiter = (
+            AdaptiveConcurrencyLimiter(self._adaptive_concurrency)
+            if self._adaptive_concurrency is not None
+            else None
+        )
+
+    @staticmethod
+    def _update_headers_with_token_on_load(
+        session: TenantSession,
+    ) -> None:
+        # the manager loaded the stored token when it was created
+        if not session.token_manager.is_current_token_expired():
             assert (
-                token := self._token_manager.get_token()
+                token := session.token_manager.access_token
             ) is not None
-            self._default_headers[
+            session.headers[
                 BaseHttpClient._ACCESS_TOKEN_HEADER_KEY
             ] = token
 
-    def _update_auth_token(self, token: str) -> None:
-        self._token_manager.update_auth_token(token, save=True)
-        self._default_headers[
-            BaseHttpClient._ACCESS_TOKEN_HEADER_KEY
-        ] = token
-
-    async def _ensure_refresh_token(self) -> None:
-        if self._token_manager.is_current_token_expired():
-            await self._refresh_access_token()
-
-    async def _refresh_access_token(self) -> None:
-        resp = await self._unauthenticated_post(
-            self._auth_endpoint,
-            headers={
-                BaseHttpClient._REFRESH_TOKEN_HEADER_KEY: self._refresh_token
-            },
-        )
-
-        if resp.status_code.is_success:
-            data = resp.get_json_as(dict)
-            token = data["access_token"]
-            self._update_auth_token(token)
-        else:
-            raise TokenRefreshError(
-                "Failed to refresh access token", resp
+    def _update_auth_token(
+        self, session: TenantSession, token: str
+    ) -> None:
+        session.token_manager.update_auth_token(token)
+        session.headers[BaseHttpClient._ACCESS_TOKEN_HEADER_KEY] = (
+            token
+        )
+        self._save_token_behind(session, token)
+
+    def _save_token_behind(
+        self, session: TenantSession, token: str
+    ) -> None:
+        """
+        Stores `token` off the event loop. Requests use it right away;
+        when several refreshes outpace a slow store, only the latest
+        token is written.
+        """
+        session.pending_token = token
+        if session.token_writer is None:
+            session.token_writer = asyncio.create_task(
+                self._write_pending_tokens(session),
+                context=contextvars.Context(),
             )
 
+    async def _write_pending_tokens(
+        self, session: TenantSession
+    ) -> None:
+        try:
+            while (token := session.pending_token) is not None:
+                session.pending_token = None
+                try:
+                    await asyncio.to_thread(
+                        session.token_manager.set_token, token
+                    )
+                except Exception:
+                    LOGGER.warning(
+                        "Storing the access token failed",
+                        exc_info=True,
+                    )
+        finally:
+            session.token_writer = None
+
+    @staticmethod
+    async def _flush_token_writes(session: TenantSession) -> None:
+        if session.token_writer is not None:
+            # waiting callers must not cancel the write
+            await asyncio.shield(session.token_writer)
+
+    async def _ensure_refresh_token(
+        self, session: TenantSession
+    ) -> None:
+        self._ensure_token_renewal_started(session)
+        if session.token_manager.is_current_token_expired():
+            await session.token_refresh.do(
+                None,
+                lambda: self._refresh_access_token(session),
+                # waiters bring their own deadlines
+                context=tenant_context(),
+            )
+
+    def _ensure_token_renewal_started(
+        self, session: TenantSession
+    ) -> None:
+        if (
+            self._token_renewal_margin is None
+            or session.token_renewal_task is not None
+        ):
+            return
+        # a fresh context, so the starting request's deadline does not
+        # outlive it
+        session.token_renewal_task = asyncio.create_task(
+            self._renew_token_periodically(
+                session, self._token_renewal_margin
+            ),
+            context=tenant_context(),
+        )
+
+    async def _renew_token_periodically(
+        self, session: TenantSession, margin: float
+    ) -> None:
+        manager = session.token_manager
+        while True:
+            if manager.seconds_until_expiry() <= margin:
+                try:
+                    await session.token_refresh.do(
+                        None,
+                        lambda: self._refresh_access_token(session),
+                    )
+                except Exception:
+                    # retried after the minimum interval at the latest
+                    LOGGER.warning(
+                        "Background token renewal failed",
+                        exc_info=True,
+                    )
+            await asyncio.sleep(
+                max(
+                    manager.seconds_until_expiry() - margin,
+                    BaseHttpClient._MIN_RENEWAL_INTERVAL_SECONDS,
+                )
+            )
+
+    def _ensure_cache_sweeper_started(self) -> None:
+        if (
+            self._response_cache is None
+            or self._cache_limits is None
+            or self._cache_limits.sweep_interval is None
+            or self._cache_sweeper_task is not None
+        ):
+            return
+        self._cache_sweeper_task = asyncio.create_task(
+            self._sweep_cache_periodically(
+                self._cache_limits.sweep_interval
+            )
+        )
+
+    async def _sweep_cache_periodically(
+        self, interval: float
+    ) -> None:
+        while True:
+            try:
+                await self._sweep_cache()
+            except Exception:
+                LOGGER.warning("Cache sweep failed", exc_info=True)
+            await asyncio.sleep(interval)
+
+    async def _sweep_cache(self) -> None:
+        if self._response_cache is not None:
+            await self._response_cache.sweep()
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        return self._response_cache
+
+    @property
+    def learned_cache_ttls(self) -> Dict[str, float]:
+        if self._response_cache is None:
+            return {}
+        return self._response_cache.learned_ttls
+
+    async def invalidate(
+        self, endpoint: str, params: Dict = {}
+    ) -> None:
+        """
+        Drops the cached response to a GET of `endpoint` with `params`.
+        """
+        if self._response_cache is not None:
+            await self._response_cache.invalidate(endpoint, params)
+
+    async def invalidate_all(self) -> None:
+        if self._response_cache is not None:
+            await self._response_cache.clear()
+
+    @property
+    def cache_footprint(self) -> Optional[CacheFootprint]:
+        """
+        Size of the bounded response cache, `None` when unbounded.
+        """
+        if self._response_cache is None:
+            return None
+        return self._response_cache.footprint
+
+    async def _refresh_access_token(
+        self, session: TenantSession
+    ) -> None:
+        manager = session.token_manager
+        async with manager.exclusive_refresh():
+            # another process may have refreshed it while we waited;
+            # storage nobody else writes holds nothing newer
+            if manager.shares_storage and await asyncio.to_thread(
+                manager.reload_token
+            ):
+                assert (token := manager.access_token) is not None
+                session.headers[
+                    BaseHttpClient._ACCESS_TOKEN_HEADER_KEY
+                ] = token
+                return
+            resp = await self._send_with_retries(
+                self._auth_endpoint,
+                lambda: self._unauthenticated_post(
+                    self._auth_endpoint,
+                    headers=BaseHttpClient._request_headers(
+                        session,
+                        {
+                            BaseHttpClient._REFRESH_TOKEN_HEADER_KEY: session.refresh_token
+                        },
+                    ),
+                ),
+                session,
+            )
+
+            if resp.status_code.is_success:
+                data = resp.get_json_as(dict)
+                token = data["access_token"]
+                self._update_auth_token(session, token)
+                if manager.shares_storage:
+                    # others read it as soon as the lock is released
+                    await self._flush_token_writes(session)
+            else:
+                raise TokenRefreshError(
+                    "Failed to refresh access token", resp
+                )
+
+    @property
+    def retry_budget(self) -> RetryBudget:
+        return self._retry_budget
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self._rate_limiter
+
+    @property
+    def concurrency_limiter(
+        self,
+    ) -> Optional[AdaptiveConcurrencyLimiter]:
+        return self._concurrency_limiter
+
+    @property
+    def concurrency_metrics(self) -> Optional[ConcurrencyMetrics]:
+        if self._concurrency_limiter is None:
+            return None
+        return self._concurrency_limiter.metrics
+
+    @property
+    def pool_metrics(self) -> Optional[PoolMetrics]:
+        """
+        Connection pool gauges, `None` when the transport keeps no
+        pool.
+        """
+        return None
+
+    @property
+    def thread_pool_metrics(self) -> Optional[ThreadPoolMetrics]:
+        """
+        Worker thread gauges, `None` when the transport needs no
+        threads.
+        """
+        return None
+
+    def _pause(self, seconds: float) -> None:
+        self._paused_until = max(
+            self._paused_until, time.monotonic() + seconds
+        )
+
+    async def _wait_until_unpaused(self) -> None:
+        delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _may_retry(
+        self, policy: RetryPolicy, retries: int, delay: float
+    ) -> bool:
+        if retries >= policy.max_retries:
+            return False
+        remaining = remaining_seconds()
+        if remaining is not None and delay >= remaining:
+            LOGGER.debug("Deadline too close, not retrying")
+            return False
+        if not self._retry_budget.try_acquire_retry():
+            LOGGER.warning("Retry budget exhausted, not retrying")
+            return False
+        return True
+
+    def _attempt_timeouts(
+        self,
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Connect and read timeouts for the next attempt, shortened to
+        what is left of the current deadline.
+        """
+        remaining = remaining_seconds()
+        if remaining is None:
+            return self._connect_timeout, self._read_timeout
+        return (
+            min(self._connect_timeout or remaining, remaining),
+            min(self._read_timeout or remaining, remaining),
+        )
+
+    async def _send_once(
+        self, send: Callable[[], Awaitable[HttpResponse]]
+    ) -> HttpResponse:
+        try:
+            return await send()
+        except self._TIMEOUT_EXCEPTIONS as exc:
+            raise TimeoutError(f"Request timed out: {exc}") from exc
+
+    @staticmethod
+    def _is_overload(status_code: HTTPStatus) -> bool:
+        return (
+            status_code == HTTPStatus.TOO_MANY_REQUESTS
+            or status_code.is_server_error
+        )
+
+    async def _attempt(
+        self, send: Callable[[], Awaitable[HttpResponse]]
+    ) -> HttpResponse:
+        limiter = self._concurrency_limiter
+        if limiter is None:
+            return await self._send_once(send)
+
+        started_at = await limiter.acquire()
+        overloaded: Optional[bool] = None
+        try:
+            resp = await self._send_once(send)
+            overloaded = BaseHttpClient._is_overload(resp.status_code)
+            return resp
+        except (TimeoutError,) + self._RETRYABLE_EXCEPTIONS:
+            overloaded = True
+            raise
+        finally:
+            limiter.release(started_at, overloaded)
+
+    async def _send_with_retries(
+        self,
+        endpoint: str,
+        send: Callable[[], Awaitable[HttpResponse]],
+        session: TenantSession,
+    ) -> HttpResponse:
+        """
+        Sends via `send` and retries transient failures according to the
+        endpoint's policy. Backoff waits on the event loop, so no worker
+        thread is held while waiting, and is skipped when it would
+        outlast the current deadline.
+
+        A `Retry-After` on a retryable response pauses the whole client,
+        not only the request that received it.
+        """
+        policy = self._retry_policies.for_endpoint(endpoint)
+        limiters = BaseHttpClient._rate_limiters(
+            session, self._rate_limiter
+        )
+        self._retry_budget.record_request()
+        retries = 0
+        while True:
+            await self._wait_until_unpaused()
+            for limiter in limiters:
+                await limiter.acquire(endpoint)
+            sent_at = time.monotonic()
+            try:
+                resp = await self._attempt(send)
+            except (TimeoutError,) + self._RETRYABLE_EXCEPTIONS:
+                delay = policy.backoff(retries)
+                if not self._may_retry(policy, retries, delay):
+                    raise
+                LOGGER.debug(
+                    "Request to %s failed, retrying in %.2fs",
+                    endpoint,
+                    delay,
+                    exc_info=True,
+                )
+            else:
+                retry_after = parse_retry_after(resp.headers)
+                if (
+                    resp.status_code == HTTPStatus.TOO_MANY_REQUESTS
+                    or retry_after is not None
+                ):
+                    for limiter in limiters:
+                        limiter.throttle(endpoint, sent_at)
+                elif resp.status_code.is_success:
+                    for limiter in limiters:
+                        limiter.recover(endpoint)
+                if resp.status_code not in policy.retry_statuses:
+                    return resp.with_attempts(retries + 1)
+                if retry_after is not None:
+                    self._pause(
+                        min(retry_after, policy.max_retry_after)
+                    )
+                    if retry_after > policy.max_retry_after:
+                        return resp.with_attempts(retries + 1)
+                delay = (
+                    policy.backoff(retries)
+                    if retry_after is None
+                    else retry_after
+                )
+                if not self._may_retry(policy, retries, delay):
+                    return resp.with_attempts(retries + 1)
+                LOGGER.debug(
+                    "%s returned %s, retrying in %.2fs",
+                    endpoint,
+                    resp.status_code,
+                    delay,
+                )
+            retries += 1
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _rate_limiters(
+        session: TenantSession, shared: RateLimiter
+    ) -> Tuple[RateLimiter, ...]:
+        # the tenant's budget is taken first, so waiting on it does
+        # not hold up the client's shared one
+        if session.rate_limiter is None:
+            return (shared,)
+        return (session.rate_limiter, shared)
+
+    @property
+    def coalescing_stats(self) -> SingleFlightStats:
+        return self._get_flight.stats
+
+    @staticmethod
+    def _request_key(
+        endpoint: str, params: Dict, headers: Dict
+    ) -> Tuple[str, Hashable, Hashable]:
+        return (
+            endpoint,
+            tuple(
+                sorted((str(k), str(v)) for k, v in params.items())
+            ),
+            tuple(
+                sorted((str(k), str(v)) for k, v in headers.items())
+            ),
+        )
+
     async def get(
-        self, endpoint: str, params: Dict = {}, headers: Dict = {}
+        self,
+        endpoint: str,
+        params: Dict = {},
+        headers: Dict = {},
+        cache_mode: CacheMode = CacheMode.DEFAULT,
     ) -> HttpResponse:
+        """
+        With `CacheMode.ONLY_IF_CACHED`, a cache miss is answered with
+        `504 Gateway Timeout` without contacting the server.
+        """
         LOGGER.debug(f"GET {endpoint} with params {params}")
-        await self._ensure_refresh_token()
-        resp = await self._unauthenticated_get(
-            endpoint, params, headers
+        self._check_tenant()
+        self._ensure_cache_sweeper_started()
+
+        cache = self._response_cache
+
+        async def cached_get() -> HttpResponse:
+            # hits need no token, so they skip the refresh too
+            if (
+                cache is not None
+                and cache_mode.reads
+                and (hit := await cache.lookup(endpoint, params))
+            ):
+                # `ONLY_IF_CACHED` must not reach the server, even in
+                # the background
+                if hit.stale and cache_mode.writes:
+                    self._revalidate_in_background(
+                        endpoint, params, headers
+                    )
+                return hit.response
+            if cache_mode == CacheMode.ONLY_IF_CACHED:
+                return HttpResponse(
+                    status_code=HTTPStatus.GATEWAY_TIMEOUT
+                )
+            if cache is None or not cache_mode.reads:
+                return await self._fetch_and_cache(
+                    endpoint, params, headers, store=cache_mode.writes
+                )
+            async with cache.filling(endpoint, params) as recheck:
+                if recheck and (
+                    filled := await cache.get(endpoint, params)
+                ):
+                    return filled
+                return await self._fetch_and_cache(
+                    endpoint, params, headers
+                )
+
+        # identical GETs already in flight share one upstream call; it
+        # runs without a deadline, so each caller's deadline only bounds
+        # its own wait
+        resp = await self._get_flight.do(
+            (
+                cache_mode,
+                current_tenant(),
+                BaseHttpClient._request_key(
+                    endpoint, params, headers
+                ),
+            ),
+            cached_get,
+            context=tenant_context(),
         )
-        LOGGER.debug(f"Response: {resp}")
+        LOGGER.debug("Response: %s", resp)
         return resp
 
+    async def _fetch_and_cache(
+        self,
+        endpoint: str,
+        params: Dict,
+        headers: Dict,
+        store: bool = True,
+    ) -> HttpResponse:
+        async with self._session_in_use() as session:
+            await self._ensure_refresh_token(session)
+            started = time.monotonic()
+            resp = await self._send_with_retries(
+                endpoint,
+                lambda: self._unauthenticated_get(
+                    endpoint,
+                    params,
+                    BaseHttpClient._request_headers(session, headers),
+                ),
+                session,
+            )
+        if self._response_cache is not None and store:
+            expires_at = await self._response_cache.store(
+                endpoint,
+                params,
+                resp,
+                fetch_time=time.monotonic() - started,
+            )
+            if expires_at is not None:
+                resp = resp.with_expires_at(expires_at)
+        return resp
+
+    def _revalidate_in_background(
+        self, endpoint: str, params: Dict, headers: Dict
+    ) -> None:
+        assert self._response_cache is not None
+        key = self._response_cache.key(endpoint, params)
+        if key in self._revalidations:
+            return
+        # a fresh context, so the caller's deadline does not apply
+        task = asyncio.create_task(
+            self._revalidate(endpoint, dict(params), dict(headers)),
+            context=tenant_context(),
+        )
+        self._revalidations[key] = task
+        task.add_done_callback(
+            lambda _: self._revalidations.pop(key, None)
+        )
+
+    async def _revalidate(
+        self, endpoint: str, params: Dict, headers: Dict
+    ) -> None:
+        try:
+            await self._fetch_and_cache(endpoint, params, headers)
+        except Exception:
+            LOGGER.warning(
+                "Background refresh of %s failed",
+                endpoint,
+                exc_info=True,
+            )
+
     async def post(
         self, endpoint: str, data: Dict = {}, headers: Dict = {}
     ) -> HttpResponse:
         LOGGER.debug(f"POST {endpoint} with data {data}")
-        await self._ensure_refresh_token()
-        resp = await self._unauthenticated_post(
-            endpoint, data, headers
-        )
-        LOGGER.debug(f"Response: {resp}")
+        self._check_tenant()
+        async with self._session_in_use() as session:
+            await self._ensure_refresh_token(session)
+            resp = await self._send_with_retries(
+                endpoint,
+                lambda: self._unauthenticated_post(
+                    endpoint,
+                    data,
+                    BaseHttpClient._request_headers(session, headers),
+                ),
+                session,
+            )
+        LOGGER.debug("Response: %s", resp)
         return resp
 
+    async def warmup(self, connections: int = 1) -> None:
+        """
+        Does up front what the first request would otherwise wait for:
+        refreshes the access token if needed, opens the response cache
+        and `connections` keep-alive connections to `base_url`. Token
+        refresh errors are raised; connections that fail to open are
+        only logged.
+        """
+        self._check_tenant()
+        session = await self._load_tenant_session()
+        await asyncio.gather(
+            self._ensure_refresh_token(session),
+            self._open_cache(),
+            self._open_connections(connections),
+        )
+
+    async def _open_cache(self) -> None:
+        if self._response_cache is not None:
+            await self._response_cache.open()
+
+    async def _open_connections(self, count: int) -> None:
+        # concurrent, so each one needs a connection of its own
+        results = await asyncio.gather(
+            *(self._open_connection() for _ in range(count)),
+            return_exceptions=True,
+        )
+        failed = sum(
+            isinstance(result, Exception) for result in results
+        )
+        if failed:
+            LOGGER.warning(
+                "Failed to open %d of %d connections", failed, count
+            )
+
+    async def _open_connection(self) -> None:
+        """
+        Leaves one more idle keep-alive connection to `base_url` in the
+        pool. Transports without a pool have nothing to open.
+        """
+        pass
+
+    async def aclose(self) -> None:
+        sessions = [
+            self._own_session,
+            *self._tenant_sessions.values(),
+        ]
+        for session in sessions:
+            session.stop_renewal()
+        if self._cache_sweeper_task is not None:
+            self._cache_sweeper_task.cancel()
+            self._cache_sweeper_task = None
+        for task in list(self._revalidations.values()):
+            task.cancel()
+        # the next run should find the latest tokens
+        for session in sessions:
+            await self._flush_token_writes(session)
+        if self._response_cache is not None:
+            await self._response_cache.close()
+
     @abstractmethod
     async def _unauthenticated_get(
         self, endpoint: str, params: Dict = {}, headers: Dict = {}
@@ -110,3 +1007,9 @@ class BaseHttpClient(ABC):
         self, endpoint: str, data: Dict = {}, headers: Dict = {}
     ) -> HttpResponse:
         pass
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        after_in_child=BaseHttpClient._reset_instances_after_fork
+    )
@@ -0,0 +1,72 @@
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AdaptiveTtl:
+    """
+    Settings for learning each endpoint's cache lifetime from how often
+    its responses change. Starting from the configured TTL, a refetch
+    that finds the same body multiplies the TTL by `increase_factor`,
+    one that finds a changed body by `decrease_factor`, always within
+    `min_ttl` and `max_ttl` seconds. At most `max_tracked` endpoints
+    are remembered.
+    """
+
+    min_ttl: float = 5.0
+    max_ttl: float = 60 * 60
+    increase_factor: float = 1.5
+    decrease_factor: float = 0.5
+    max_tracked: int = 10_000
+
+
+class TtlLearner:
+    """
+    Tracks a fingerprint of the last response per endpoint together
+    with the TTL learned for it.
+    """
+
+    def __init__(self, settings: AdaptiveTtl = AdaptiveTtl()) -> None:
+        self._settings = settings
+        self._states: OrderedDict[str, Tuple[bytes, float]] = (
+            OrderedDict()
+        )
+
+    @property
+    def learned(self) -> Dict[str, float]:
+        return {key: ttl for key, (_, ttl) in self._states.items()}
+
+    def ttl(self, key: str) -> Optional[float]:
+        state = self._states.get(key)
+        return state[1] if state is not None else None
+
+    def observe(
+        self, key: str, content: bytes, default_ttl: float
+    ) -> float:
+        """
+        Records a freshly fetched body and returns the TTL to cache it
+        for.
+        """
+        settings = self._settings
+        fingerprint = hashlib.blake2b(
+            content, digest_size=16
+        ).digest()
+        state = self._states.get(key)
+        if state is None:
+            ttl = default_ttl
+        elif state[0] == fingerprint:
+            ttl = state[1] * settings.increase_factor
+        else:
+            ttl = state[1] * settings.decrease_factor
+        ttl = min(settings.max_ttl, max(settings.min_ttl, ttl))
+        LOGGER.debug("Caching %s for %.1fs", key, ttl)
+        self._states[key] = (fingerprint, ttl)
+        self._states.move_to_end(key)
+        while len(self._states) > settings.max_tracked:
+            self._states.popitem(last=False)
+        return ttl
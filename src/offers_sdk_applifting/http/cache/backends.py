@@ -0,0 +1,377 @@
+import asyncio
+import os
+import sqlite3
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Sequence
+
+from offers_sdk_applifting.http.cache.serialization import (
+    BinaryCacheSerializer,
+    CacheEntry,
+    CacheSerializer,
+)
+
+
+class CacheBackendType(StrEnum):
+    MEMORY = "memory"
+    SQLITE = "sqlite"
+    FILESYSTEM = "filesystem"
+
+
+@dataclass(frozen=True)
+class CacheRecord:
+    """
+    What a backend knows about a stored entry without loading it.
+    """
+
+    key: str
+    size: int
+    accessed_at: float
+
+
+class CacheBackend(ABC):
+    """
+    Storage for cache entries. Keys are filename-safe strings.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, entry: CacheEntry) -> int:
+        """
+        Stores `entry` and returns the number of bytes it occupies.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, keys: Iterable[str]) -> None:
+        pass
+
+    @abstractmethod
+    async def delete_expired(self, before: float) -> List[str]:
+        """
+        Deletes entries that expired at or before `before` and returns
+        their keys.
+        """
+        pass
+
+    @abstractmethod
+    async def scan(self) -> List[CacheRecord]:
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        pass
+
+    async def open(self) -> None:
+        """
+        Opens files and connections up front rather than on first use.
+        """
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    def after_fork(self) -> None:
+        """
+        Called in a forked child to drop state it must not share with
+        its parent, such as open connections.
+        """
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Process-local LRU store holding at most `max_entries` entries.
+    """
+
+    def __init__(self, max_entries: Optional[int] = 1024) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> int:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if self._max_entries is not None:
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return len(entry.content)
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def delete_expired(self, before: float) -> List[str]:
+        expired = [
+            key
+            for key, entry in self._entries.items()
+            if entry.expires_at <= before
+        ]
+        await self.delete(expired)
+        return expired
+
+    async def scan(self) -> List[CacheRecord]:
+        return [
+            CacheRecord(key, len(entry.content), entry.stored_at)
+            for key, entry in self._entries.items()
+        ]
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Single-file store in WAL mode, so readers never block the writer
+    and several clients (or processes) can share one cache.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        serializer: CacheSerializer = BinaryCacheSerializer(),
+    ) -> None:
+        self._path = path
+        self._serializer = serializer
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._connection is None:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(
+                    self._path,
+                    check_same_thread=False,
+                    isolation_level=None,
+                    timeout=30,
+                )
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                    "stored_at REAL NOT NULL, expires_at REAL NOT NULL)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS responses_expires_at "
+                    "ON responses (expires_at)"
+                )
+                self._connection = connection
+            return self._connection
+
+    def _execute(
+        self, sql: str, parameters: Sequence[Any] = ()
+    ) -> List[Any]:
+        with self._lock:
+            return self._connect().execute(sql, parameters).fetchall()
+
+    def _execute_many(
+        self, sql: str, parameters: Iterable[Sequence[Any]]
+    ) -> None:
+        with self._lock:
+            self._connect().executemany(sql, parameters)
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        rows = await asyncio.to_thread(
+            self._execute,
+            "SELECT value FROM responses WHERE key = ?",
+            (key,),
+        )
+        if not rows:
+            return None
+        try:
+            return self._serializer.loads(rows[0][0])
+        except ValueError:
+            # e.g. written in another format, as good as a miss
+            await self.delete([key])
+            return None
+
+    async def set(self, key: str, entry: CacheEntry) -> int:
+        data = self._serializer.dumps(entry)
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+            (key, data, entry.stored_at, entry.expires_at),
+        )
+        return len(data)
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        await asyncio.to_thread(
+            self._execute_many,
+            "DELETE FROM responses WHERE key = ?",
+            [(key,) for key in keys],
+        )
+
+    async def delete_expired(self, before: float) -> List[str]:
+        rows = await asyncio.to_thread(
+            self._execute,
+            "DELETE FROM responses WHERE expires_at <= ? RETURNING key",
+            (before,),
+        )
+        return [key for (key,) in rows]
+
+    async def scan(self) -> List[CacheRecord]:
+        rows = await asyncio.to_thread(
+            self._execute,
+            "SELECT key, length(value), stored_at FROM responses",
+        )
+        return [CacheRecord(*row) for row in rows]
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(
+            self._execute, "DELETE FROM responses"
+        )
+
+    async def open(self) -> None:
+        await asyncio.to_thread(self._connect)
+
+    async def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def after_fork(self) -> None:
+        # the parent's connection (and possibly its held lock) must not
+        # be used here; it is left open for the parent to close
+        self._lock = threading.RLock()
+        self._connection = None
+
+
+class FileSystemCacheBackend(CacheBackend):
+    """
+    One file per entry, written atomically via rename. A file's mtime
+    holds its expiry, so sweeping only needs `stat` calls.
+    """
+
+    _SUFFIX = ".cache"
+
+    def __init__(
+        self,
+        directory: Path,
+        serializer: CacheSerializer = BinaryCacheSerializer(),
+    ) -> None:
+        self._directory = directory
+        self._serializer = serializer
+
+    def _path(self, key: str) -> Path:
+        return (
+            self._directory / f"{key}{FileSystemCacheBackend._SUFFIX}"
+        )
+
+    def _paths(self) -> List[Path]:
+        return list(
+            self._directory.glob(f"*{FileSystemCacheBackend._SUFFIX}")
+        )
+
+    def _read(self, key: str) -> Optional[CacheEntry]:
+        try:
+            return self._serializer.loads(
+                self._path(key).read_bytes()
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # a corrupt file is as good as a miss
+            self._unlink([key])
+            return None
+
+    def _write(self, key: str, entry: CacheEntry) -> int:
+        data = self._serializer.dumps(entry)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self._directory, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.utime(tmp_path, (entry.stored_at, entry.expires_at))
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        return len(data)
+
+    def _unlink(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._path(key).unlink(missing_ok=True)
+
+    def _delete_expired(self, before: float) -> List[str]:
+        expired: List[str] = []
+        for path in self._paths():
+            try:
+                if path.stat().st_mtime <= before:
+                    path.unlink(missing_ok=True)
+                    expired.append(path.stem)
+            except FileNotFoundError:  # pragma: no cover
+                continue
+        return expired
+
+    def _scan(self) -> List[CacheRecord]:
+        records: List[CacheRecord] = []
+        for path in self._paths():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # pragma: no cover
+                continue
+            records.append(
+                CacheRecord(path.stem, stat.st_size, stat.st_atime)
+            )
+        return records
+
+    async def open(self) -> None:
+        await asyncio.to_thread(
+            self._directory.mkdir, parents=True, exist_ok=True
+        )
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(self, key: str, entry: CacheEntry) -> int:
+        return await asyncio.to_thread(self._write, key, entry)
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        await asyncio.to_thread(self._unlink, list(keys))
+
+    async def delete_expired(self, before: float) -> List[str]:
+        return await asyncio.to_thread(self._delete_expired, before)
+
+    async def scan(self) -> List[CacheRecord]:
+        return await asyncio.to_thread(self._scan)
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(
+            self._unlink, [path.stem for path in self._paths()]
+        )
+
+
+def create_cache_backend(
+    backend_type: CacheBackendType,
+    directory: Path,
+    serializer: CacheSerializer = BinaryCacheSerializer(),
+) -> CacheBackend:
+    match backend_type:
+        case CacheBackendType.MEMORY:
+            return MemoryCacheBackend()
+        case CacheBackendType.SQLITE:
+            return SQLiteCacheBackend(
+                directory / "responses.sqlite", serializer
+            )
+        case CacheBackendType.FILESYSTEM:
+            return FileSystemCacheBackend(
+                directory / "responses", serializer
+            )
@@ -0,0 +1,33 @@
+import math
+import random
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class EarlyExpiration:
+    """
+    Spreads out the refreshes of entries that were cached together.
+
+    Each stored TTL is shortened by a random fraction of up to
+    `jitter`. On lookup, an entry is also treated as expired early with
+    the probability used by XFetch, which grows as expiry approaches and
+    with how long the response took to fetch, scaled by `beta` (`0`
+    disables it).
+    """
+
+    jitter: float = 0.1
+    beta: float = 1.0
+
+    def jittered_ttl(self, ttl: float) -> float:
+        return ttl * (1.0 - self.jitter * random.random())
+
+    def expires_early(
+        self, now: float, expires_at: float, fetch_time: float
+    ) -> bool:
+        if self.beta <= 0 or fetch_time <= 0:
+            return False
+        # 1 - random() lies in (0, 1], so the log is always defined
+        gap = (
+            -fetch_time * self.beta * math.log(1.0 - random.random())
+        )
+        return now + gap >= expires_at
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import FrozenSet
+
+
+@dataclass(frozen=True)
+class NegativeCaching:
+    """
+    Caches responses that carry no data, so polling for something that
+    does not exist yet does not reach the server on every call.
+
+    Responses with one of `statuses` and, with `empty_lists`, successful
+    responses whose body is an empty JSON list are kept for `ttl`
+    seconds instead of the endpoint's regular TTL.
+    """
+
+    ttl: float = 30.0
+    statuses: FrozenSet[HTTPStatus] = frozenset(
+        {HTTPStatus.NOT_FOUND, HTTPStatus.GONE}
+    )
+    empty_lists: bool = True
+
+    def applies_to(self, status_code: int, content: bytes) -> bool:
+        if status_code in self.statuses:
+            return True
+        return (
+            self.empty_lists
+            and status_code == HTTPStatus.OK
+            and content.strip() == b"[]"
+        )
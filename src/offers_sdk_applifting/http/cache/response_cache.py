@@ -0,0 +1,418 @@
+import hashlib
+import json
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import StrEnum
+from http import HTTPStatus
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterable, Mapping, Optional
+
+from offers_sdk_applifting.http.cache.adaptive_ttl import (
+    AdaptiveTtl,
+    TtlLearner,
+)
+from offers_sdk_applifting.http.cache.backends import CacheBackend
+from offers_sdk_applifting.http.cache.early_expiration import (
+    EarlyExpiration,
+)
+from offers_sdk_applifting.http.cache.negative_caching import (
+    NegativeCaching,
+)
+from offers_sdk_applifting.http.cache.serialization import CacheEntry
+from offers_sdk_applifting.http.cache.usage import (
+    CacheFootprint,
+    CacheLimits,
+    CacheUsage,
+)
+from offers_sdk_applifting.http.endpoint_rules import EndpointRules
+from offers_sdk_applifting.http.file_lock import FileLock
+from offers_sdk_applifting.http.http_response import HttpResponse
+from offers_sdk_applifting.http.tenancy import current_tenant
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CACHE_TTL_SECONDS = 60 * 5
+
+
+class CacheMode(StrEnum):
+    """
+    How a single request uses the response cache, after the
+    `Cache-Control` request directives of the same names.
+
+    `DEFAULT` serves cached entries and stores responses, `REFRESH`
+    skips the lookup but stores the response, `BYPASS` neither reads
+    nor writes and `ONLY_IF_CACHED` never contacts the server.
+    """
+
+    DEFAULT = "default"
+    REFRESH = "refresh"
+    BYPASS = "bypass"
+    ONLY_IF_CACHED = "only-if-cached"
+
+    @property
+    def reads(self) -> bool:
+        return self in (CacheMode.DEFAULT, CacheMode.ONLY_IF_CACHED)
+
+    @property
+    def writes(self) -> bool:
+        return self in (CacheMode.DEFAULT, CacheMode.REFRESH)
+
+
+@dataclass(frozen=True)
+class CacheLookup:
+    response: HttpResponse
+    stale: bool
+
+
+class ResponseCache:
+    """
+    Caches successful GET responses in a `CacheBackend`.
+
+    Entries live for `ttl` seconds unless a glob pattern in
+    `endpoint_ttls` matches the endpoint; a `None` TTL disables caching
+    for it, as it always is for `excluded_endpoints`. Credentials never
+    reach the backend: keys ignore request headers and
+    `SENSITIVE_HEADERS` are dropped from stored responses. Each tenant
+    only sees the entries stored while acting for it.
+
+    Expired entries are kept for another `stale_while_revalidate`
+    seconds, during which lookups return them marked as stale.
+
+    With `adaptive_ttl`, the TTL of each endpoint starts at its
+    configured value and then follows how often its responses change.
+
+    With `early_expiration`, entries stored together expire at
+    different times and lookups may report a fresh entry as stale
+    shortly before it expires, so hot keys are refreshed one by one
+    rather than all at once.
+
+    Only `200 OK` responses are cached, unless `negative_caching` also
+    keeps not-found and empty results for a short while.
+
+    Processes sharing a backend pass the same `fill_lock_directory`, so
+    only one of them fetches a missing entry while the others wait for
+    it (for at most `FILL_LOCK_TIMEOUT_SECONDS`).
+    """
+
+    SENSITIVE_HEADERS = frozenset(
+        {"authorization", "bearer", "cookie", "set-cookie"}
+    )
+    FILL_LOCK_TIMEOUT_SECONDS = 30.0
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        *,
+        namespace: str = "",
+        ttl: Optional[float] = DEFAULT_CACHE_TTL_SECONDS,
+        endpoint_ttls: Mapping[str, Optional[float]] = {},
+        excluded_endpoints: Iterable[str] = (),
+        limits: Optional[CacheLimits] = None,
+        stale_while_revalidate: float = 0.0,
+        adaptive_ttl: Optional[AdaptiveTtl] = None,
+        early_expiration: Optional[EarlyExpiration] = None,
+        negative_caching: Optional[NegativeCaching] = None,
+        fill_lock_directory: Optional[Path] = None,
+    ) -> None:
+        self._backend = backend
+        self._stale_window = stale_while_revalidate
+        self._namespace = namespace
+        # exclusions come first so no TTL rule can override them
+        rules: Dict[str, Optional[float]] = dict.fromkeys(
+            excluded_endpoints
+        )
+        for pattern, pattern_ttl in endpoint_ttls.items():
+            rules.setdefault(pattern, pattern_ttl)
+        self._ttls = EndpointRules(ttl, rules)
+        self._usage: Optional[CacheUsage[str]] = (
+            CacheUsage(limits) if limits is not None else None
+        )
+        self._usage_loaded = False
+        self._ttl_learner = (
+            TtlLearner(adaptive_ttl)
+            if adaptive_ttl is not None
+            else None
+        )
+        self._early_expiration = early_expiration
+        self._negative_caching = negative_caching
+        self._fill_lock_directory = fill_lock_directory
+
+    @property
+    def backend(self) -> CacheBackend:
+        return self._backend
+
+    @property
+    def footprint(self) -> Optional[CacheFootprint]:
+        """
+        Size of the cache, `None` when it is unbounded.
+        """
+        if self._usage is None:
+            return None
+        return self._usage.footprint
+
+    @property
+    def learned_ttls(self) -> Dict[str, float]:
+        """
+        Adaptive TTLs by endpoint, empty unless `adaptive_ttl` is set.
+        """
+        if self._ttl_learner is None:
+            return {}
+        return self._ttl_learner.learned
+
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        return self._ttls.for_endpoint(endpoint)
+
+    def key(self, endpoint: str, params: Mapping) -> str:
+        parts = [
+            self._namespace,
+            endpoint.strip("/"),
+            sorted((str(k), str(v)) for k, v in params.items()),
+        ]
+        # the client's own entries keep the keys they had before tenants
+        if (tenant := current_tenant()) is not None:
+            parts.append(tenant)
+        raw = json.dumps(parts)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    async def get(
+        self, endpoint: str, params: Mapping = {}
+    ) -> Optional[HttpResponse]:
+        """
+        Returns the fresh cached response, if any.
+        """
+        hit = await self.lookup(endpoint, params)
+        if hit is None or hit.stale:
+            return None
+        return hit.response
+
+    async def lookup(
+        self, endpoint: str, params: Mapping = {}
+    ) -> Optional[CacheLookup]:
+        """
+        Returns the cached response, fresh or stale. A failing backend
+        counts as a miss rather than failing the request.
+        """
+        if self.ttl_for(endpoint) is None:
+            return None
+        try:
+            return await self._lookup(endpoint, params)
+        except Exception:
+            LOGGER.warning("Cache lookup failed", exc_info=True)
+            return None
+
+    async def store(
+        self,
+        endpoint: str,
+        params: Mapping,
+        resp: HttpResponse,
+        fetch_time: float = 0.0,
+    ) -> Optional[float]:
+        """
+        Stores `resp` if it is cacheable and returns when it expires.
+        `fetch_time` is how long the response took to fetch.
+        """
+        ttl = self.ttl_for(endpoint)
+        if (
+            ttl is None
+            or ttl <= 0
+            or ResponseCache._is_no_store(resp)
+        ):
+            return None
+        content = (
+            resp.content
+            if resp.content is not None
+            else json.dumps(resp.json).encode()
+        )
+        negative = self._negative_caching
+        if negative is not None and negative.applies_to(
+            resp.status_code, content
+        ):
+            # never kept longer than the endpoint's regular entries
+            ttl = min(ttl, negative.ttl)
+        elif resp.status_code != HTTPStatus.OK:
+            return None
+        elif self._ttl_learner is not None:
+            ttl = self._ttl_learner.observe(
+                endpoint.strip("/"), content, ttl
+            )
+        if self._early_expiration is not None:
+            ttl = self._early_expiration.jittered_ttl(ttl)
+        try:
+            return await self._store(
+                self.key(endpoint, params),
+                resp,
+                content,
+                ttl,
+                fetch_time,
+            )
+        except Exception:
+            LOGGER.warning("Cache store failed", exc_info=True)
+            return None
+
+    async def _lookup(
+        self, endpoint: str, params: Mapping
+    ) -> Optional[CacheLookup]:
+        await self._load_usage()
+        key = self.key(endpoint, params)
+        entry = await self._backend.get(key)
+        if entry is None:
+            # evicted behind our back, e.g. by another process
+            self._forget(key)
+            return None
+        now = time.time()
+        if entry.is_expired(now - self._stale_window):
+            await self._backend.delete([key])
+            self._forget(key, expired=True)
+            return None
+        if self._usage is not None:
+            self._usage.record_hit(key)
+        return CacheLookup(
+            response=HttpResponse(
+                status_code=HTTPStatus(entry.status_code),
+                content=entry.content,
+                from_cache=True,
+                headers=entry.headers,
+                expires_at=entry.expires_at,
+            ),
+            stale=self._is_stale(entry, now),
+        )
+
+    async def _store(
+        self,
+        key: str,
+        resp: HttpResponse,
+        content: bytes,
+        ttl: float,
+        fetch_time: float,
+    ) -> float:
+        await self._load_usage()
+        now = time.time()
+        expires_at = now + ttl
+        size = await self._backend.set(
+            key,
+            CacheEntry(
+                status_code=resp.status_code,
+                content=content,
+                expires_at=expires_at,
+                stored_at=now,
+                headers=ResponseCache._safe_headers(resp.headers),
+                fetch_time=fetch_time,
+            ),
+        )
+        if self._usage is not None:
+            self._usage.record_store(key, size, now)
+            await self._evict()
+        return expires_at
+
+    async def invalidate(
+        self, endpoint: str, params: Mapping = {}
+    ) -> None:
+        key = self.key(endpoint, params)
+        await self._backend.delete([key])
+        self._forget(key)
+
+    async def clear(self) -> None:
+        await self._backend.clear()
+        if self._usage is not None:
+            self._usage.clear()
+
+    async def sweep(self) -> None:
+        """
+        Removes expired entries from the backend.
+        """
+        expired = await self._backend.delete_expired(
+            time.time() - self._stale_window
+        )
+        if self._usage is not None:
+            self._usage.forget(expired, expired=True)
+        LOGGER.debug("Swept %d expired cache entries", len(expired))
+
+    @asynccontextmanager
+    async def filling(
+        self, endpoint: str, params: Mapping = {}
+    ) -> AsyncIterator[bool]:
+        """
+        Held while fetching a missing entry. Yields whether another
+        process may have stored it meanwhile, so it is worth looking it
+        up again.
+        """
+        if self._fill_lock_directory is None:
+            yield False
+            return
+        # one lock per key, so unrelated fills never wait on each
+        # other; the file goes away with the fill
+        key = self.key(endpoint, params)
+        lock = FileLock(
+            self._fill_lock_directory / f"{key}.lock",
+            remove_on_release=True,
+        )
+        async with lock.hold(
+            ResponseCache.FILL_LOCK_TIMEOUT_SECONDS
+        ) as acquired:
+            if not acquired:
+                LOGGER.warning(
+                    "Timed out waiting for another process to fetch %s",
+                    endpoint,
+                )
+            yield True
+
+    async def open(self) -> None:
+        """
+        Opens the backend and loads the usage of a bounded cache, which
+        the first lookup would otherwise wait for.
+        """
+        try:
+            await self._backend.open()
+            await self._load_usage()
+        except Exception:
+            LOGGER.warning("Opening the cache failed", exc_info=True)
+
+    async def close(self) -> None:
+        await self._backend.close()
+
+    def after_fork(self) -> None:
+        self._backend.after_fork()
+
+    async def _load_usage(self) -> None:
+        # entries left over from earlier runs count against the limits
+        if self._usage is None or self._usage_loaded:
+            return
+        self._usage_loaded = True
+        for record in await self._backend.scan():
+            self._usage.record_store(
+                record.key, record.size, record.accessed_at
+            )
+        await self._evict()
+
+    async def _evict(self) -> None:
+        assert self._usage is not None
+        if victims := self._usage.take_victims():
+            await self._backend.delete(victims)
+
+    def _forget(self, key: str, expired: bool = False) -> None:
+        if self._usage is not None:
+            self._usage.forget([key], expired=expired)
+
+    def _is_stale(self, entry: CacheEntry, now: float) -> bool:
+        early = self._early_expiration
+        return entry.is_expired(now) or (
+            early is not None
+            and early.expires_early(
+                now, entry.expires_at, entry.fetch_time
+            )
+        )
+
+    @staticmethod
+    def _is_no_store(resp: HttpResponse) -> bool:
+        cache_control = resp.headers.get("Cache-Control", "")
+        return "no-store" in cache_control.lower()
+
+    @staticmethod
+    def _safe_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+        return {
+            name: value
+            for name, value in headers.items()
+            if name.lower() not in ResponseCache.SENSITIVE_HEADERS
+        }
@@ -0,0 +1,155 @@
+import base64
+import json
+import struct
+import time
+import zlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Mapping, Optional
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """
+    A cached response. Times are wall-clock UNIX timestamps so entries
+    stay meaningful across processes and restarts; `fetch_time` is how
+    many seconds the response took to fetch.
+    """
+
+    status_code: int
+    content: bytes
+    expires_at: float
+    stored_at: float = field(default_factory=time.time)
+    headers: Mapping[str, str] = field(default_factory=dict)
+    fetch_time: float = 0.0
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        return (
+            now if now is not None else time.time()
+        ) >= self.expires_at
+
+
+class CacheSerializer(ABC):
+    @abstractmethod
+    def dumps(self, entry: CacheEntry) -> bytes:
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes) -> CacheEntry:
+        pass
+
+
+class JsonCacheSerializer(CacheSerializer):
+    def dumps(self, entry: CacheEntry) -> bytes:
+        return json.dumps(
+            {
+                "status_code": entry.status_code,
+                "content": base64.b64encode(entry.content).decode(),
+                "expires_at": entry.expires_at,
+                "stored_at": entry.stored_at,
+                "headers": dict(entry.headers),
+                "fetch_time": entry.fetch_time,
+            }
+        ).encode()
+
+    def loads(self, data: bytes) -> CacheEntry:
+        raw = json.loads(data)
+        return CacheEntry(
+            status_code=raw["status_code"],
+            content=base64.b64decode(raw["content"]),
+            expires_at=raw["expires_at"],
+            stored_at=raw["stored_at"],
+            headers=raw["headers"],
+            # absent from entries written by earlier versions
+            fetch_time=raw.get("fetch_time", 0.0),
+        )
+
+
+class BinaryCacheSerializer(CacheSerializer):
+    """
+    Fixed-size binary header followed by the headers as compact JSON and
+    the raw body, with no base64 or per-field names.
+
+    With a `compression_level`, payloads of at least
+    `min_compressed_size` bytes are compressed with zlib when that makes
+    them smaller. Level 1 already shrinks offer lists about threefold
+    but costs more CPU than it saves I/O on fast disks, so compression
+    is off by default; see `benchmarks/cache_serialization.py`.
+    """
+
+    _MAGIC = b"OC"
+    _VERSION = 1
+    _COMPRESSED = 0x01
+    # magic, version, flags, status code, expires_at, stored_at,
+    # fetch_time, length of the headers
+    _HEADER = struct.Struct("!2sBBHdddI")
+
+    def __init__(
+        self,
+        compression_level: Optional[int] = None,
+        min_compressed_size: int = 512,
+    ) -> None:
+        self._compression_level = compression_level
+        self._min_compressed_size = min_compressed_size
+
+    def dumps(self, entry: CacheEntry) -> bytes:
+        headers = json.dumps(
+            dict(entry.headers), separators=(",", ":")
+        ).encode()
+        payload = headers + entry.content
+        flags = 0
+        if (
+            self._compression_level is not None
+            and len(payload) >= self._min_compressed_size
+        ):
+            compressed = zlib.compress(
+                payload, self._compression_level
+            )
+            if len(compressed) < len(payload):
+                payload = compressed
+                flags |= BinaryCacheSerializer._COMPRESSED
+        return (
+            BinaryCacheSerializer._HEADER.pack(
+                BinaryCacheSerializer._MAGIC,
+                BinaryCacheSerializer._VERSION,
+                flags,
+                entry.status_code,
+                entry.expires_at,
+                entry.stored_at,
+                entry.fetch_time,
+                len(headers),
+            )
+            + payload
+        )
+
+    def loads(self, data: bytes) -> CacheEntry:
+        header = BinaryCacheSerializer._HEADER
+        try:
+            (
+                magic,
+                version,
+                flags,
+                status_code,
+                expires_at,
+                stored_at,
+                fetch_time,
+                headers_size,
+            ) = header.unpack_from(data)
+            if (
+                magic != BinaryCacheSerializer._MAGIC
+                or version != BinaryCacheSerializer._VERSION
+            ):
+                raise ValueError("Not a binary cache entry")
+            payload = data[header.size :]
+            if flags & BinaryCacheSerializer._COMPRESSED:
+                payload = zlib.decompress(payload)
+        except (struct.error, zlib.error) as e:
+            raise ValueError("Corrupt cache entry") from e
+        return CacheEntry(
+            status_code=status_code,
+            content=payload[headers_size:],
+            expires_at=expires_at,
+            stored_at=stored_at,
+            headers=json.loads(payload[:headers_size]),
+            fetch_time=fetch_time,
+        )
@@ -0,0 +1,167 @@
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+class EvictionPolicy(StrEnum):
+    LRU = "lru"
+    LFU = "lfu"
+
+
+@dataclass(frozen=True)
+class CacheLimits:
+    """
+    Bounds for a response cache. Entries are evicted by `eviction` once
+    the cache holds more than `max_entries` entries or `max_bytes` bytes;
+    expired entries are swept every `sweep_interval` seconds.
+    """
+
+    max_bytes: Optional[int] = None
+    max_entries: Optional[int] = None
+    eviction: EvictionPolicy = EvictionPolicy.LRU
+    sweep_interval: Optional[float] = 60.0
+
+
+@dataclass(frozen=True)
+class CacheFootprint:
+    entries: int
+    bytes: int
+    evictions: int
+    expired: int
+
+
+@dataclass
+class _Entry:
+    size: int
+    accessed_at: float
+    hits: int = 0
+    # identifies the entry's current item in the eviction heap
+    seq: int = 0
+
+
+class CacheUsage[K: Hashable]:
+    """
+    Thread-safe bookkeeping of cache entry sizes and accesses, used to
+    pick eviction victims without scanning the storage itself.
+
+    Victims come off a heap ordered by eviction rank. Stores and hits
+    push a new item rather than reordering the heap, and outdated items
+    are skipped when popped, so each eviction costs O(log n).
+    """
+
+    def __init__(self, limits: CacheLimits) -> None:
+        self._limits = limits
+        self._entries: Dict[K, _Entry] = {}
+        self._heap: List[Tuple[Tuple[float, ...], int, K]] = []
+        self._seq = itertools.count()
+        self._bytes = 0
+        self._evictions = 0
+        self._expired = 0
+        self._lock = threading.Lock()
+
+    @property
+    def limits(self) -> CacheLimits:
+        return self._limits
+
+    @property
+    def footprint(self) -> CacheFootprint:
+        with self._lock:
+            return CacheFootprint(
+                entries=len(self._entries),
+                bytes=self._bytes,
+                evictions=self._evictions,
+                expired=self._expired,
+            )
+
+    def record_store(
+        self, key: K, size: int, accessed_at: Optional[float] = None
+    ) -> None:
+        with self._lock:
+            self._drop(key)
+            entry = _Entry(
+                size=size,
+                accessed_at=accessed_at
+                if accessed_at is not None
+                else time.time(),
+            )
+            self._entries[key] = entry
+            self._bytes += size
+            self._push(key, entry)
+
+    def record_hit(self, key: K) -> None:
+        with self._lock:
+            if entry := self._entries.get(key):
+                entry.accessed_at = time.time()
+                entry.hits += 1
+                self._push(key, entry)
+
+    def forget(
+        self, keys: Iterable[K], expired: bool = False
+    ) -> None:
+        with self._lock:
+            for key in keys:
+                if self._drop(key) and expired:
+                    self._expired += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._heap.clear()
+            self._bytes = 0
+
+    def take_victims(self) -> List[K]:
+        """
+        Removes and returns the keys that must be evicted to get back
+        within the limits.
+        """
+        with self._lock:
+            victims: List[K] = []
+            while self._over_limits():
+                _, seq, key = heapq.heappop(self._heap)
+                entry = self._entries.get(key)
+                if entry is None or entry.seq != seq:
+                    # outdated by a later store, hit or removal
+                    continue
+                self._drop(key)
+                victims.append(key)
+            self._evictions += len(victims)
+            return victims
+
+    def _eviction_rank(self, entry: _Entry) -> Tuple[float, ...]:
+        if self._limits.eviction == EvictionPolicy.LFU:
+            return (entry.hits, entry.accessed_at)
+        return (entry.accessed_at,)
+
+    def _push(self, key: K, entry: _Entry) -> None:
+        entry.seq = next(self._seq)
+        heapq.heappush(
+            self._heap, (self._eviction_rank(entry), entry.seq, key)
+        )
+        # rebuild once outdated items outnumber live ones
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [
+                (self._eviction_rank(entry), entry.seq, key)
+                for key, entry in self._entries.items()
+            ]
+            heapq.heapify(self._heap)
+
+    def _over_limits(self) -> bool:
+        limits = self._limits
+        return (
+            limits.max_entries is not None
+            and len(self._entries) > limits.max_entries
+        ) or (
+            limits.max_bytes is not None
+            and self._bytes > limits.max_bytes
+        )
+
+    def _drop(self, key: K) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry.size
+        return True
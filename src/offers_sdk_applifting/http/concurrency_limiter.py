@@ -0,0 +1,194 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Deque, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AdaptiveConcurrency:
+    """
+    AIMD settings: the limit grows by `increase_step` once a full limit's
+    worth of requests completes healthily, and is multiplied by
+    `decrease_factor` on overload. A response slower than
+    `latency_tolerance` times the smoothed latency counts as overload.
+    """
+
+    initial_limit: int = 8
+    min_limit: int = 1
+    max_limit: int = 256
+    increase_step: int = 1
+    decrease_factor: float = 0.5
+    latency_tolerance: float = 2.0
+    latency_smoothing: float = 0.1
+    history_size: int = 100
+
+
+class LimitChangeReason(StrEnum):
+    HEALTHY = "healthy"
+    OVERLOAD = "overload"
+    LATENCY = "latency"
+
+
+@dataclass(frozen=True)
+class LimitChange:
+    timestamp: float
+    limit: int
+    reason: LimitChangeReason
+
+
+@dataclass(frozen=True)
+class ConcurrencyMetrics:
+    limit: int
+    in_flight: int
+    queued: int
+    latency_baseline: Optional[float]
+    history: Tuple[LimitChange, ...]
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Caps in-flight requests at a limit that adapts to how the server
+    copes: additive increase while latency and errors stay healthy,
+    multiplicative decrease on overload or latency spikes.
+
+    `acquire` returns a start time that must be handed back to
+    `release` together with the outcome.
+    """
+
+    def __init__(
+        self, settings: AdaptiveConcurrency = AdaptiveConcurrency()
+    ) -> None:
+        self._settings = settings
+        self._limit = settings.initial_limit
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future[None]] = deque()
+        self._healthy_since_change = 0
+        self._saturated = False
+        self._changed_at = -float("inf")
+        self._latency_baseline: Optional[float] = None
+        self._history: Deque[LimitChange] = deque(
+            maxlen=settings.history_size
+        )
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def metrics(self) -> ConcurrencyMetrics:
+        return ConcurrencyMetrics(
+            limit=self._limit,
+            in_flight=self._in_flight,
+            queued=len(self._waiters),
+            latency_baseline=self._latency_baseline,
+            history=tuple(self._history),
+        )
+
+    async def acquire(self) -> float:
+        while self._in_flight >= self._limit:
+            self._saturated = True
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                else:
+                    # pass the wake-up on to the next waiter
+                    self._wake_waiters()
+                raise
+        self._in_flight += 1
+        if self._in_flight >= self._limit:
+            self._saturated = True
+        return time.monotonic()
+
+    def release(
+        self, started_at: float, overloaded: Optional[bool]
+    ) -> None:
+        """
+        `overloaded` is `None` when the attempt ended without telling
+        anything about the server, e.g. it was cancelled.
+        """
+        self._in_flight -= 1
+        if overloaded is not None:
+            self._record(time.monotonic() - started_at, overloaded)
+        self._wake_waiters()
+
+    def _record(self, latency: float, overloaded: bool) -> None:
+        settings = self._settings
+        baseline = self._latency_baseline
+        if overloaded:
+            self._decrease(LimitChangeReason.OVERLOAD, latency)
+            return
+        if (
+            baseline is not None
+            and latency > baseline * settings.latency_tolerance
+        ):
+            self._decrease(LimitChangeReason.LATENCY, latency)
+            return
+
+        self._latency_baseline = (
+            latency
+            if baseline is None
+            else baseline
+            + settings.latency_smoothing * (latency - baseline)
+        )
+        self._healthy_since_change += 1
+        if (
+            self._saturated
+            and self._healthy_since_change >= self._limit
+            and self._limit < settings.max_limit
+        ):
+            self._change(
+                min(
+                    settings.max_limit,
+                    self._limit + settings.increase_step,
+                ),
+                LimitChangeReason.HEALTHY,
+            )
+
+    def _decrease(
+        self, reason: LimitChangeReason, latency: float
+    ) -> None:
+        # responses to requests sent before the last change describe
+        # the old limit, so they must not cut it again
+        if time.monotonic() - latency < self._changed_at:
+            return
+        self._change(
+            max(
+                self._settings.min_limit,
+                int(self._limit * self._settings.decrease_factor),
+            ),
+            reason,
+        )
+
+    def _change(self, limit: int, reason: LimitChangeReason) -> None:
+        LOGGER.debug(
+            "Concurrency limit %d -> %d (%s)",
+            self._limit,
+            limit,
+            reason,
+        )
+        self._limit = limit
+        self._healthy_since_change = 0
+        self._saturated = False
+        self._changed_at = time.monotonic()
+        self._history.append(
+            LimitChange(
+                timestamp=time.time(), limit=limit, reason=reason
+            )
+        )
+
+    def _wake_waiters(self) -> None:
+        free = self._limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
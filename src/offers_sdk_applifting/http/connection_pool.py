@@ -0,0 +1,61 @@
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class PoolLimits:
+    """
+    Each client keeps at most `max_connections` connections, at most
+    `max_connections_per_host` of them to any one host, and closes
+    connections idle for longer than `keepalive_expiry` seconds (`None`
+    keeps them until the server closes them). Requests beyond the limits
+    wait for a connection to free up instead of opening throwaway ones,
+    for at most the connect timeout and what is left of the deadline;
+    running out of either fails the attempt as a timeout.
+    """
+
+    max_connections: int = 100
+    max_connections_per_host: int = 20
+    keepalive_expiry: Optional[float] = 5.0
+
+
+@dataclass(frozen=True)
+class PoolMetrics:
+    """
+    Connections currently serving a request (`in_use`) or waiting for
+    the next one (`idle`), and how many were opened so far (`created`).
+    """
+
+    in_use: int
+    idle: int
+    created: int
+
+
+class PoolGauges:
+    """
+    Counts behind `PoolMetrics`, updated from any thread.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._created = 0
+
+    def connection_created(self) -> None:
+        with self._lock:
+            self._created += 1
+
+    def connection_acquired(self) -> None:
+        with self._lock:
+            self._in_use += 1
+
+    def connection_released(self) -> None:
+        with self._lock:
+            self._in_use -= 1
+
+    def metrics(self, idle: int) -> PoolMetrics:
+        with self._lock:
+            return PoolMetrics(
+                in_use=self._in_use, idle=idle, created=self._created
+            )
@@ -0,0 +1,43 @@
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Optional
+
+# absolute deadline in event loop time, inherited by spawned tasks
+_DEADLINE: ContextVar[Optional[float]] = ContextVar(
+    "offers_sdk_deadline", default=None
+)
+
+
+@asynccontextmanager
+async def deadline_after(
+    seconds: Optional[float],
+) -> AsyncIterator[None]:
+    """
+    Bounds everything awaited inside the block to `seconds`, raising
+    `TimeoutError` when it runs out. Nested scopes can only shorten an
+    enclosing deadline, never extend it.
+    """
+    if seconds is None:
+        yield
+        return
+
+    deadline = asyncio.get_running_loop().time() + seconds
+    if (outer := _DEADLINE.get()) is not None:
+        deadline = min(deadline, outer)
+    token = _DEADLINE.set(deadline)
+    try:
+        async with asyncio.timeout_at(deadline):
+            yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def remaining_seconds() -> Optional[float]:
+    """
+    Time left until the current deadline, or `None` without one.
+    """
+    deadline = _DEADLINE.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - asyncio.get_running_loop().time())
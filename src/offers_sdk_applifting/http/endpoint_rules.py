@@ -0,0 +1,36 @@
+from fnmatch import fnmatchcase
+from typing import Mapping, Optional
+
+
+class EndpointRules[T]:
+    """
+    Per-endpoint settings keyed by glob patterns such as
+    `"products/*/offers"`. The first matching pattern wins; endpoints
+    without a match get the default.
+    """
+
+    def __init__(
+        self, default: T, rules: Mapping[str, T] = {}
+    ) -> None:
+        self._default = default
+        self._rules = dict(rules)
+
+    @property
+    def default(self) -> T:
+        return self._default
+
+    def match(self, endpoint: str) -> Optional[str]:
+        """
+        Returns the first pattern matching `endpoint`, if any.
+        """
+        endpoint = endpoint.strip("/")
+        for pattern in self._rules:
+            if fnmatchcase(endpoint, pattern.strip("/")):
+                return pattern
+        return None
+
+    def for_endpoint(self, endpoint: str) -> T:
+        pattern = self.match(endpoint)
+        if pattern is None:
+            return self._default
+        return self._rules[pattern]
@@ -0,0 +1,97 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager, suppress
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    import msvcrt
+
+    fcntl = None  # type: ignore[assignment]
+
+
+class FileLock:
+    """
+    Exclusive advisory lock on a file, shared by every process on the
+    host. The OS releases it when the holding process dies.
+
+    Waiting polls a non-blocking attempt every `poll_interval` seconds,
+    so it never ties up a thread and cancellation applies while waiting.
+
+    With `remove_on_release` the holder deletes the file on release, so
+    short-lived locks leave no files behind.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        poll_interval: float = 0.02,
+        remove_on_release: bool = False,
+    ) -> None:
+        self._path = path
+        self._poll_interval = poll_interval
+        self._remove_on_release = remove_on_release
+        self._fd: Optional[int] = None
+
+    def try_acquire(self) -> bool:
+        assert self._fd is None, "lock is not reentrant"
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:  # pragma: no cover
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            os.close(fd)
+            return False
+        if self._remove_on_release and not self._is_current(fd):
+            # locked a file its holder removed meanwhile
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def _is_current(self, fd: int) -> bool:
+        try:
+            return os.stat(self._path).st_ino == os.fstat(fd).st_ino
+        except FileNotFoundError:
+            return False
+
+    def release(self) -> None:
+        if self._fd is not None:
+            if self._remove_on_release:
+                # before unlocking, so no one locks the removed file
+                # thinking it is current
+                with suppress(OSError):
+                    os.unlink(self._path)
+            # closing the descriptor drops the lock
+            os.close(self._fd)
+            self._fd = None
+
+    @asynccontextmanager
+    async def hold(
+        self, timeout: Optional[float] = None
+    ) -> AsyncIterator[bool]:
+        """
+        Holds the lock for the body of the `async with`, yielding
+        `False` if it could not be acquired within `timeout` seconds.
+        """
+        give_up_at = (
+            time.monotonic() + timeout
+            if timeout is not None
+            else None
+        )
+        acquired = self.try_acquire()
+        while not acquired and (
+            give_up_at is None or time.monotonic() < give_up_at
+        ):
+            await asyncio.sleep(self._poll_interval)
+            acquired = self.try_acquire()
+        try:
+            yield acquired
+        finally:
+            self.release()
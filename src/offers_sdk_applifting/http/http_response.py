@@ -1,6 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError
 from http import HTTPStatus
-from typing import List, Mapping, Type, TypeAlias
+from json import loads
+from typing import Any, List, Mapping, Optional, Type, TypeAlias
+
+from pydantic import TypeAdapter
 
 JSONType: TypeAlias = (
     Mapping[str, "JSONType"]
@@ -12,12 +15,74 @@ JSONType: TypeAlias = (
     | None
 )
 
+_UNDECODED: Any = object()
+
 
-@dataclass(frozen=True)
 class HttpResponse:
+    """
+    Immutable HTTP response whose JSON body is decoded lazily.
+
+    Transports hand over the raw `content` bytes, so the Python object
+    tree behind `json` is only built on first access, and typed callers
+    can skip it altogether with `validate_as`. Responses built from
+    already decoded data pass `json` instead.
+
+    `attempts` counts how many times the request was sent, including
+    retries. `headers` is the transport's (case-insensitive) header
+    mapping. `expires_at` is the UNIX time the response cache stops
+    treating this response as fresh, `None` when it is not cached.
+    """
+
+    __slots__ = (
+        "status_code",
+        "from_cache",
+        "content",
+        "attempts",
+        "headers",
+        "expires_at",
+        "_json",
+    )
+
     status_code: HTTPStatus
-    json: JSONType
-    from_cache: bool = False
+    from_cache: bool
+    content: Optional[bytes]
+    attempts: int
+    headers: Mapping[str, str]
+    expires_at: Optional[float]
+    _json: Any
+
+    def __init__(
+        self,
+        status_code: HTTPStatus,
+        json: JSONType = None,
+        from_cache: bool = False,
+        content: Optional[bytes] = None,
+        attempts: int = 1,
+        headers: Optional[Mapping[str, str]] = None,
+        expires_at: Optional[float] = None,
+    ) -> None:
+        object.__setattr__(self, "status_code", status_code)
+        object.__setattr__(self, "from_cache", from_cache)
+        object.__setattr__(self, "content", content)
+        object.__setattr__(self, "attempts", attempts)
+        object.__setattr__(
+            self, "headers", headers if headers is not None else {}
+        )
+        object.__setattr__(self, "expires_at", expires_at)
+        object.__setattr__(
+            self, "_json", _UNDECODED if content is not None else json
+        )
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    @property
+    def json(self) -> JSONType:
+        if self._json is _UNDECODED:
+            object.__setattr__(
+                self, "_json", loads(self.content or b"")
+            )
+        return self._json
 
     def get_json_as[T](self, _type: Type[T]) -> T:
         if isinstance(self.json, _type):
@@ -26,3 +91,59 @@ class HttpResponse:
             f"Response JSON is not a {_type.__name__}"
             f", but {type(self.json).__name__}"
         )
+
+    def validate_as[T](self, adapter: TypeAdapter[T]) -> T:
+        """
+        Validates the body straight from the raw bytes when available,
+        without materializing the intermediate JSON tree.
+        """
+        if self._json is _UNDECODED:
+            return adapter.validate_json(self.content or b"")
+        return adapter.validate_python(self.json)
+
+    def with_from_cache(
+        self, from_cache: bool = True
+    ) -> HttpResponse:
+        return self._replace(from_cache=from_cache)
+
+    def with_attempts(self, attempts: int) -> HttpResponse:
+        return self._replace(attempts=attempts)
+
+    def with_expires_at(self, expires_at: float) -> HttpResponse:
+        return self._replace(expires_at=expires_at)
+
+    def _replace(self, **changes: Any) -> HttpResponse:
+        copy = HttpResponse(
+            status_code=self.status_code,
+            from_cache=self.from_cache,
+            content=self.content,
+            attempts=self.attempts,
+            headers=self.headers,
+            expires_at=self.expires_at,
+        )
+        for name, value in changes.items():
+            object.__setattr__(copy, name, value)
+        # keep whatever was already decoded
+        object.__setattr__(copy, "_json", self._json)
+        return copy
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, HttpResponse):
+            return NotImplemented
+        return (self.status_code, self.json, self.from_cache) == (
+            other.status_code,
+            other.json,
+            other.from_cache,
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        try:
+            body = f"json={self.json!r}"
+        except ValueError:
+            body = f"content={self.content!r:.200}"
+        return (
+            f"HttpResponse(status_code={self.status_code!r}, "
+            f"{body}, from_cache={self.from_cache!r})"
+        )
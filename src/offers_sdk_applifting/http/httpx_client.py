@@ -0,0 +1,164 @@
+import asyncio
+from contextlib import asynccontextmanager
+from http import HTTPStatus
+from typing import Any, AsyncIterator, Dict, Mapping, Optional
+from urllib.parse import urljoin
+
+import httpx
+
+from offers_sdk_applifting.http.base_client import (
+    BaseHttpClient,
+    HttpResponse,
+)
+from offers_sdk_applifting.http.connection_pool import (
+    PoolGauges,
+    PoolLimits,
+    PoolMetrics,
+)
+
+
+class HttpxClient(BaseHttpClient):
+    """
+    Native asyncio transport on top of `httpx.AsyncClient`.
+
+    Requests are multiplexed over a keep-alive connection pool
+    driven by the event loop, so no worker thread is needed per
+    in-flight request. The pool is sized by `pool_limits`; httpx has no
+    per-host limit, so requests wait for one of the host's slots before
+    reaching it, for at most the connect timeout like for a pooled
+    connection. Remaining keyword arguments are forwarded to
+    `BaseHttpClient`.
+    """
+
+    _RETRYABLE_EXCEPTIONS = (httpx.TransportError,)
+    _TIMEOUT_EXCEPTIONS = (httpx.TimeoutException,)
+
+    def __init__(
+        self,
+        *,
+        pool_limits: PoolLimits = PoolLimits(),
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._pool_limits = pool_limits
+        self._limits = httpx.Limits(
+            max_connections=pool_limits.max_connections,
+            # idle connections are only closed by `keepalive_expiry`
+            max_keepalive_connections=pool_limits.max_connections,
+            keepalive_expiry=pool_limits.keepalive_expiry,
+        )
+        self._transport = transport
+        self._pool_gauges = PoolGauges()
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._client = self._new_client()
+
+    def _new_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            limits=self._limits,
+            transport=self._transport
+            or httpx.AsyncHTTPTransport(limits=self._limits),
+        )
+
+    @property
+    def pool_metrics(self) -> Optional[PoolMetrics]:
+        # only httpx's own transport pools connections
+        pool = getattr(self._client._transport, "_pool", None)
+        idle = (
+            sum(conn.is_idle() for conn in pool.connections)
+            if pool is not None
+            else 0
+        )
+        return self._pool_gauges.metrics(idle=idle)
+
+    def _after_fork(self) -> None:
+        super()._after_fork()
+        # pooled sockets are shared with the parent; leave them to it
+        self._pool_gauges = PoolGauges()
+        self._host_slots = {}
+        self._client = self._new_client()
+
+    async def aclose(self) -> None:
+        await super().aclose()
+        await self._client.aclose()
+
+    async def _send(
+        self, method: str, endpoint: str, **kwargs
+    ) -> HttpResponse:
+        connect_timeout, read_timeout = self._attempt_timeouts()
+        url = httpx.URL(urljoin(self._base_url, endpoint))
+        async with self._host_slot(url, connect_timeout):
+            self._pool_gauges.connection_acquired()
+            try:
+                response = await self._client.request(
+                    method,
+                    url,
+                    timeout=httpx.Timeout(
+                        connect=connect_timeout,
+                        read=read_timeout,
+                        write=read_timeout,
+                        pool=connect_timeout,
+                    ),
+                    extensions={"trace": self._trace},
+                    **kwargs,
+                )
+            finally:
+                self._pool_gauges.connection_released()
+        return HttpResponse(
+            status_code=HTTPStatus(response.status_code),
+            content=response.content,
+            headers=response.headers,
+        )
+
+    @asynccontextmanager
+    async def _host_slot(
+        self, url: httpx.URL, timeout: Optional[float]
+    ) -> AsyncIterator[None]:
+        host = f"{url.scheme}://{url.netloc.decode()}"
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(
+                self._pool_limits.max_connections_per_host
+            )
+        slot = self._host_slots[host]
+        try:
+            async with asyncio.timeout(timeout):
+                await slot.acquire()
+        except TimeoutError:
+            raise httpx.PoolTimeout(
+                f"No connection to {host} freed up in time; all "
+                f"{self._pool_limits.max_connections_per_host} "
+                "stayed busy"
+            ) from None
+        try:
+            yield
+        finally:
+            slot.release()
+
+    async def _trace(
+        self, event: str, info: Mapping[str, Any]
+    ) -> None:
+        if event == "connection.connect_tcp.complete":
+            self._pool_gauges.connection_created()
+
+    async def _open_connection(self) -> None:
+        await self._send("HEAD", self._base_url)
+
+    async def _unauthenticated_get(
+        self, endpoint: str, params: Dict = {}, headers: Dict = {}
+    ) -> HttpResponse:
+        return await self._send(
+            "GET",
+            endpoint,
+            params=params,
+            headers=headers,
+        )
+
+    async def _unauthenticated_post(
+        self, endpoint: str, data: Dict = {}, headers: Dict = {}
+    ) -> HttpResponse:
+        return await self._send(
+            "POST",
+            endpoint,
+            json=data,
+            headers=headers,
+        )
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+
+from offers_sdk_applifting.http.endpoint_rules import EndpointRules
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Sustained `rate` in requests per second with bursts of up to
+    `burst` requests.
+
+    When the server pushes back, the rate drops by `decrease_factor`
+    (never below `min_rate`) and then climbs back by `increase_step`
+    of the configured rate per successful request.
+    """
+
+    rate: float
+    burst: int = 1
+    min_rate: float = 0.1
+    decrease_factor: float = 0.5
+    increase_step: float = 0.01
+
+
+class TokenBucket:
+    """
+    Token bucket whose waiters are served in arrival order.
+
+    Each `acquire` reserves a token right away, letting the balance go
+    negative, and sleeps until that token has been refilled. Cancelled
+    waiters hand their reservation back.
+    """
+
+    def __init__(self, limit: RateLimit) -> None:
+        self._limit = limit
+        self._rate = limit.rate
+        self._tokens = float(limit.burst)
+        self._updated_at = time.monotonic()
+        self._decreased_at = -float("inf")
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    async def acquire(self) -> None:
+        self._refill()
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return
+        try:
+            await asyncio.sleep(-self._tokens / self._rate)
+        except asyncio.CancelledError:
+            self._tokens += 1
+            raise
+
+    def throttle(self, sent_at: float) -> None:
+        """
+        Lowers the rate after a request sent at `sent_at` was pushed
+        back. Requests that were already in flight at the previous
+        reduction do not lower it again.
+        """
+        if sent_at < self._decreased_at:
+            return
+        self._refill()
+        self._rate = max(
+            self._limit.min_rate,
+            self._rate * self._limit.decrease_factor,
+        )
+        self._decreased_at = time.monotonic()
+        LOGGER.info(
+            "Rate limited, slowing down to %.2f/s", self._rate
+        )
+
+    def recover(self) -> None:
+        if self._rate >= self._limit.rate:
+            return
+        self._refill()
+        self._rate = min(
+            self._limit.rate,
+            self._rate + self._limit.rate * self._limit.increase_step,
+        )
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            float(self._limit.burst),
+            self._tokens + (now - self._updated_at) * self._rate,
+        )
+        self._updated_at = now
+
+
+class RateLimiter:
+    """
+    Client-side rate limits keyed by endpoint glob pattern.
+
+    Endpoints matching the same pattern share one bucket; endpoints
+    matching none share the `default` bucket. Without a limit for an
+    endpoint, requests to it are not delayed.
+    """
+
+    def __init__(
+        self,
+        default: Optional[RateLimit] = None,
+        endpoint_limits: Mapping[str, RateLimit] = {},
+    ) -> None:
+        self._limits: EndpointRules[Optional[RateLimit]] = (
+            EndpointRules(default, endpoint_limits)
+        )
+        self._buckets: Dict[Optional[str], TokenBucket] = {}
+
+    def bucket(self, endpoint: str) -> Optional[TokenBucket]:
+        pattern = self._limits.match(endpoint)
+        if pattern not in self._buckets:
+            limit = self._limits.for_endpoint(endpoint)
+            if limit is None:
+                return None
+            self._buckets[pattern] = TokenBucket(limit)
+        return self._buckets[pattern]
+
+    async def acquire(self, endpoint: str) -> None:
+        if bucket := self.bucket(endpoint):
+            await bucket.acquire()
+
+    def throttle(self, endpoint: str, sent_at: float) -> None:
+        if bucket := self.bucket(endpoint):
+            bucket.throttle(sent_at)
+
+    def recover(self, endpoint: str) -> None:
+        if bucket := self.bucket(endpoint):
+            bucket.recover()
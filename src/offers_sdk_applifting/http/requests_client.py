@@ -1,122 +1,326 @@
 import asyncio
+import logging
+import time
+import weakref
 from http import HTTPStatus
-from typing import Dict
-from urllib.parse import urljoin
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from urllib.parse import urljoin, urlsplit
 
 import requests
-import requests_cache
 from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-
-from offers_sdk_applifting.http.auth_token.auth_token_manager import (
-    AuthTokenManager,
+from urllib3.connectionpool import (
+    HTTPConnectionPool,
+    HTTPSConnectionPool,
 )
+from urllib3.exceptions import EmptyPoolError
+from urllib3.poolmanager import PoolManager
+from urllib3.util.timeout import Timeout
+
 from offers_sdk_applifting.http.base_client import (
     BaseHttpClient,
     HttpResponse,
 )
+from offers_sdk_applifting.http.connection_pool import (
+    PoolGauges,
+    PoolLimits,
+    PoolMetrics,
+)
+from offers_sdk_applifting.http.thread_pool import (
+    BoundedThreadPool,
+    ThreadPoolLimits,
+    ThreadPoolMetrics,
+)
 
+if TYPE_CHECKING:
+    from urllib3._base_connection import BaseHTTPConnection
+    from urllib3.response import BaseHTTPResponse
 
-class RequestsClient(BaseHttpClient):
-    _ADAPTER: HTTPAdapter = HTTPAdapter(
-        max_retries=Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[
-                HTTPStatus.TOO_MANY_REQUESTS,
-                HTTPStatus.INTERNAL_SERVER_ERROR,
-                HTTPStatus.BAD_GATEWAY,
-                HTTPStatus.SERVICE_UNAVAILABLE,
-                HTTPStatus.GATEWAY_TIMEOUT,
-            ],
-            allowed_methods=["GET", "POST"],
+LOGGER = logging.getLogger(__name__)
+
+
+class _TrackedHTTPConnectionPool(HTTPConnectionPool):
+    """
+    Reports connections to `PoolGauges` and reconnects those that sat
+    idle for longer than `keepalive_expiry`. Waiting for a free
+    connection counts against the connect timeout.
+    """
+
+    def track(
+        self, gauges: PoolGauges, keepalive_expiry: Optional[float]
+    ) -> None:
+        self._gauges = gauges
+        self._keepalive_expiry = keepalive_expiry
+        self._idle_since: weakref.WeakKeyDictionary[
+            BaseHTTPConnection, float
+        ] = weakref.WeakKeyDictionary()
+
+    @property
+    def idle_connections(self) -> int:
+        if self.pool is None:
+            return 0
+        return sum(conn is not None for conn in list(self.pool.queue))
+
+    def urlopen(
+        self, method: str, url: str, *args: Any, **kwargs: Any
+    ) -> BaseHTTPResponse:
+        timeout = kwargs.get("timeout")
+        connect = (
+            timeout.connect_timeout
+            if isinstance(timeout, Timeout)
+            else None
         )
-    )
+        # the client caps the connect timeout at the deadline
+        if kwargs.get("pool_timeout") is None and isinstance(
+            connect, (int, float)
+        ):
+            kwargs["pool_timeout"] = connect
+        return super().urlopen(method, url, *args, **kwargs)
+
+    def _get_conn(
+        self, timeout: Optional[float] = None
+    ) -> BaseHTTPConnection:
+        conn = super()._get_conn(timeout)
+        idle_since = self._idle_since.pop(conn, None)
+        expiry = self._keepalive_expiry
+        if idle_since is None:
+            # never returned to the pool, so just opened
+            self._gauges.connection_created()
+        elif (
+            expiry is not None
+            and time.monotonic() - idle_since > expiry
+        ):
+            LOGGER.debug("Reconnecting after %.1fs idle", expiry)
+            # the next request on it opens a new socket
+            conn.close()
+            self._gauges.connection_created()
+        self._gauges.connection_acquired()
+        return conn
+
+    def _put_conn(self, conn: Optional[BaseHTTPConnection]) -> None:
+        self._gauges.connection_released()
+        if conn is not None:
+            self._idle_since[conn] = time.monotonic()
+        super()._put_conn(conn)
 
-    @staticmethod
-    def redact_auth_token_hook[**P](
-        resp: requests.Response, *args: P.args, **kwargs: P.kwargs
+
+class _TrackedHTTPSConnectionPool(
+    _TrackedHTTPConnectionPool, HTTPSConnectionPool
+):
+    pass
+
+
+class _TrackedPoolManager(PoolManager):
+    def __init__(
+        self,
+        gauges: PoolGauges,
+        keepalive_expiry: Optional[float],
+        **kwargs: Any,
     ) -> None:
-        headers_to_redact = {
-            BaseHttpClient._ACCESS_TOKEN_HEADER_KEY,
-            BaseHttpClient._REFRESH_TOKEN_HEADER_KEY,
+        super().__init__(**kwargs)
+        self._gauges = gauges
+        self._keepalive_expiry = keepalive_expiry
+        self._tracked: weakref.WeakSet[_TrackedHTTPConnectionPool] = (
+            weakref.WeakSet()
+        )
+        self.pool_classes_by_scheme = {
+            "http": _TrackedHTTPConnectionPool,
+            "https": _TrackedHTTPSConnectionPool,
         }
-        for header in headers_to_redact:
-            if header in resp.request.headers:
-                resp.request.headers[header] = "REDACTED"
 
-    def filter_out_auth_response(
-        self, resp: requests.Response
-    ) -> bool:
-        return not resp.url.endswith(self._auth_endpoint)
+    @property
+    def idle_connections(self) -> int:
+        return sum(
+            pool.idle_connections for pool in list(self._tracked)
+        )
+
+    def _new_pool(
+        self,
+        scheme: str,
+        host: str,
+        port: int,
+        request_context: Optional[Dict[str, Any]] = None,
+    ) -> HTTPConnectionPool:
+        pool = super()._new_pool(scheme, host, port, request_context)
+        assert isinstance(pool, _TrackedHTTPConnectionPool)
+        pool.track(self._gauges, self._keepalive_expiry)
+        self._tracked.add(pool)
+        return pool
+
+
+class _PoolAdapter(HTTPAdapter):
+    """
+    Blocking per-host pools sized by `PoolLimits`. Pools for
+    `max_connections // max_connections_per_host` hosts are kept.
+    """
+
+    def __init__(
+        self, limits: PoolLimits, gauges: PoolGauges
+    ) -> None:
+        self._limits = limits
+        self._gauges = gauges
+        # retries are handled by BaseHttpClient, off the worker thread
+        super().__init__(
+            pool_connections=max(
+                1,
+                limits.max_connections
+                // limits.max_connections_per_host,
+            ),
+            pool_maxsize=limits.max_connections_per_host,
+            pool_block=True,
+            max_retries=0,
+        )
+
+    def init_poolmanager(
+        self,
+        connections: int,
+        maxsize: int,
+        block: bool = False,
+        **pool_kwargs: Any,
+    ) -> None:
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _TrackedPoolManager(
+            self._gauges,
+            self._limits.keepalive_expiry,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs,
+        )
+
+    @property
+    def idle_connections(self) -> int:
+        assert isinstance(self.poolmanager, _TrackedPoolManager)
+        return self.poolmanager.idle_connections
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> requests.Response:
+        try:
+            return super().send(request, *args, **kwargs)
+        except EmptyPoolError as exc:
+            host = urlsplit(request.url).netloc
+            raise requests.ConnectTimeout(
+                f"No connection to {host} freed up in time; all "
+                f"{self._limits.max_connections_per_host} stayed busy",
+                request=request,
+            ) from exc
+
+
+class RequestsClient(BaseHttpClient):
+    """
+    Runs `requests` calls on worker threads. Each client has its own
+    connection pools, sized by `pool_limits`, and its own threads,
+    sized by `thread_pool`. Remaining keyword arguments are forwarded
+    to `BaseHttpClient`.
+    """
+
+    _RETRYABLE_EXCEPTIONS = (requests.ConnectionError,)
+    _TIMEOUT_EXCEPTIONS = (requests.Timeout,)
 
     def __init__(
         self,
         *,
-        base_url: str,
-        refresh_token: str,
-        auth_endpoint: str,
-        token_manager: AuthTokenManager,
-        backend: str = "filesystem",
+        pool_limits: PoolLimits = PoolLimits(),
+        thread_pool: ThreadPoolLimits = ThreadPoolLimits(),
+        **kwargs: Any,
     ) -> None:
-        super().__init__(
-            base_url=base_url,
-            refresh_token=refresh_token,
-            auth_endpoint=auth_endpoint,
-            token_manager=token_manager,
+        super().__init__(**kwargs)
+        self._pool_limits = pool_limits
+        self._pool_gauges = PoolGauges()
+        self._session = self._new_session()
+        self._thread_pool_limits = thread_pool
+        self._thread_pool = BoundedThreadPool(thread_pool)
+
+    def _new_session(self) -> requests.Session:
+        self._adapter = _PoolAdapter(
+            self._pool_limits, self._pool_gauges
         )
-        self._session = requests_cache.CachedSession(
-            cache_name=BaseHttpClient._CACHE_PATH / "requests_cache",
-            backend=backend,
-            cache_control=True,
-            expire_after=60 * 5,
-            ignored_params=[
-                BaseHttpClient._ACCESS_TOKEN_HEADER_KEY,
-                BaseHttpClient._REFRESH_TOKEN_HEADER_KEY,
-            ],
-            allowable_methods=["GET"],
-            serializer="json",
-            filter_fn=self.filter_out_auth_response,
+        session = requests.Session()
+        # plain http too, e.g. for local stand-ins of the API
+        session.mount("http://", self._adapter)
+        session.mount("https://", self._adapter)
+        return session
+
+    @property
+    def pool_metrics(self) -> Optional[PoolMetrics]:
+        return self._pool_gauges.metrics(
+            idle=self._adapter.idle_connections
+        )
+
+    @property
+    def thread_pool_metrics(self) -> ThreadPoolMetrics:
+        return self._thread_pool.metrics
+
+    def _after_fork(self) -> None:
+        super()._after_fork()
+        # pooled sockets are shared with the parent; leave them to it
+        self._pool_gauges = PoolGauges()
+        self._session = self._new_session()
+        # the parent's worker threads do not exist here
+        self._thread_pool = BoundedThreadPool(
+            self._thread_pool_limits
         )
-        self._session.mount("https://", RequestsClient._ADAPTER)
+
+    async def aclose(self) -> None:
+        await super().aclose()
+        # let running requests finish before their sockets close
+        await asyncio.to_thread(self._thread_pool.shutdown)
+        self._session.close()
+
+    async def _open_connection(self) -> None:
+        timeout = self._attempt_timeouts()
+
+        def sync_head():
+            # closing the response returns its connection to the pool
+            self._session.head(
+                self._base_url, timeout=timeout
+            ).close()
+
+        await self._thread_pool.run(sync_head)
 
     async def _unauthenticated_get(
         self, endpoint: str, params: Dict = {}, headers: Dict = {}
     ) -> HttpResponse:
-        await self._ensure_refresh_token()
+        timeout = self._attempt_timeouts()
 
         def sync_get():
             url = urljoin(self._base_url, endpoint)
             response = self._session.get(
                 url,
                 params=params,
-                headers=headers | self._default_headers,
-                hooks={
-                    "response": RequestsClient.redact_auth_token_hook
-                },
+                headers=headers,
+                timeout=timeout,
             )
             return HttpResponse(
                 status_code=HTTPStatus(response.status_code),
-                json=response.json(),
-                from_cache=response.from_cache,
+                content=response.content,
+                headers=response.headers,
             )
 
-        return await asyncio.to_thread(sync_get)
+        return await self._thread_pool.run(sync_get)
 
     async def _unauthenticated_post(
         self, endpoint: str, data: Dict = {}, headers: Dict = {}
     ) -> HttpResponse:
+        timeout = self._attempt_timeouts()
+
         def sync_post():
             url = urljoin(self._base_url, endpoint)
             response = self._session.post(
                 url,
                 json=data,
-                headers=headers | self._default_headers,
+                headers=headers,
+                timeout=timeout,
             )
             return HttpResponse(
                 status_code=HTTPStatus(response.status_code),
-                json=response.json(),
-                from_cache=response.from_cache,
+                content=response.content,
+                headers=response.headers,
             )
 
-        return await asyncio.to_thread(sync_post)
+        return await self._thread_pool.run(sync_post)
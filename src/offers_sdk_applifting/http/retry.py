@@ -0,0 +1,117 @@
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import FrozenSet, Mapping, Optional
+
+RETRY_AFTER_HEADER = "Retry-After"
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry schedule for one endpoint.
+
+    Backoff uses "full jitter": the n-th retry sleeps a random time
+    between zero and `min(backoff_cap, backoff_base * 2**n)` seconds,
+    unless the server asked for a specific delay via `Retry-After`.
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 1.0
+    backoff_cap: float = 30.0
+    retry_statuses: FrozenSet[HTTPStatus] = field(
+        default_factory=lambda: frozenset(
+            {
+                HTTPStatus.TOO_MANY_REQUESTS,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                HTTPStatus.BAD_GATEWAY,
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                HTTPStatus.GATEWAY_TIMEOUT,
+            }
+        )
+    )
+    max_retry_after: float = 60.0
+
+    def backoff(self, retry_number: int) -> float:
+        ceiling = min(
+            self.backoff_cap, self.backoff_base * 2**retry_number
+        )
+        return random.uniform(0, ceiling)
+
+
+NO_RETRY = RetryPolicy(max_retries=0)
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the request volume.
+
+    Every request deposits `ratio` tokens and every retry withdraws one,
+    so a failing upstream sees at most `ratio` extra load instead of a
+    multiple of it. A trickle of `min_per_second` tokens keeps retries
+    possible at low traffic.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 1.0,
+        max_balance: float = 10.0,
+    ) -> None:
+        self._ratio = ratio
+        self._min_per_second = min_per_second
+        self._max_balance = max_balance
+        self._balance = max_balance
+        self._updated_at = time.monotonic()
+
+    @property
+    def balance(self) -> float:
+        self._refill()
+        return self._balance
+
+    def record_request(self) -> None:
+        self._refill()
+        self._balance = min(
+            self._max_balance, self._balance + self._ratio
+        )
+
+    def try_acquire_retry(self) -> bool:
+        self._refill()
+        if self._balance < 1:
+            return False
+        self._balance -= 1
+        return True
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._balance = min(
+            self._max_balance,
+            self._balance
+            + (now - self._updated_at) * self._min_per_second,
+        )
+        self._updated_at = now
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Returns the delay in seconds requested by a `Retry-After` header,
+    which holds either a number of seconds or an HTTP date.
+    """
+    value = headers.get(RETRY_AFTER_HEADER)
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(
+        0.0, (retry_at - datetime.now(timezone.utc)).total_seconds()
+    )
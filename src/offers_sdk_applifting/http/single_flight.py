@@ -0,0 +1,66 @@
+import asyncio
+import contextvars
+from dataclasses import dataclass
+from typing import Any, Callable, Coroutine, Dict, Hashable, Optional
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    calls: int
+    coalesced: int
+
+    @property
+    def executed(self) -> int:
+        return self.calls - self.coalesced
+
+
+class SingleFlight[K: Hashable, T]:
+    """
+    Coalesces concurrent calls for the same key into one in-flight call
+    whose result (or exception) is shared by every waiter.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[K, asyncio.Future[T]] = {}
+        self._calls = 0
+        self._coalesced = 0
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        return SingleFlightStats(
+            calls=self._calls, coalesced=self._coalesced
+        )
+
+    def is_in_flight(self, key: K) -> bool:
+        return key in self._in_flight
+
+    async def do(
+        self,
+        key: K,
+        func: Callable[[], Coroutine[Any, Any, T]],
+        context: Optional[contextvars.Context] = None,
+    ) -> T:
+        """
+        Runs `func` in `context` (a copy of the caller's by default)
+        unless a call for `key` is already in flight.
+        """
+        self._calls += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(func(), context=context)
+            self._in_flight[key] = task
+            task.add_done_callback(
+                lambda done: self._forget(key, done)
+            )
+        else:
+            self._coalesced += 1
+        # a cancelled waiter must not cancel the call shared by others
+        return await asyncio.shield(task)
+
+    def _forget(self, key: K, task: asyncio.Future[T]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # retrieved here too, since every waiter may have given up
+        # before the call failed
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,110 @@
+import asyncio
+import contextvars
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, Optional
+
+from offers_sdk_applifting.http.auth_token.auth_token_manager import (
+    AuthTokenManager,
+)
+from offers_sdk_applifting.http.rate_limiter import (
+    RateLimit,
+    RateLimiter,
+)
+from offers_sdk_applifting.http.single_flight import SingleFlight
+
+DEFAULT_MAX_ACTIVE_TENANTS = 1024
+
+# tenant the current call acts for, inherited by spawned tasks
+_TENANT: ContextVar[Optional[str]] = ContextVar(
+    "offers_sdk_tenant", default=None
+)
+
+
+@contextmanager
+def acting_for(tenant_id: Optional[str]) -> Iterator[None]:
+    """
+    Requests made inside the block use the token and rate budget of
+    `tenant_id` and only see its cache entries. `None` keeps the
+    enclosing tenant.
+    """
+    if tenant_id is None:
+        yield
+        return
+
+    token = _TENANT.set(tenant_id)
+    try:
+        yield
+    finally:
+        _TENANT.reset(token)
+
+
+def current_tenant() -> Optional[str]:
+    """
+    The tenant of the current call, `None` for the client's own account.
+    """
+    return _TENANT.get()
+
+
+def tenant_context() -> contextvars.Context:
+    """
+    A fresh context for background work that keeps acting for the
+    current tenant but is not bound by the caller's deadline.
+    """
+    context = contextvars.Context()
+    context.run(_TENANT.set, _TENANT.get())
+    return context
+
+
+@dataclass(frozen=True)
+class Tenant:
+    """
+    An account a client acts for besides its own. `token_manager` is
+    only called on the tenant's first request, so idle tenants cost no
+    storage reads. `rate_limit` is the tenant's own budget, on top of
+    the client's limits.
+    """
+
+    refresh_token: str = field(repr=False)
+    token_manager: Callable[[], AuthTokenManager]
+    rate_limit: Optional[RateLimit] = None
+
+
+class TenantSession:
+    """
+    Token state of one account: the access token, its refresh and
+    renewal, and the tenant's rate budget.
+    """
+
+    def __init__(
+        self,
+        refresh_token: str,
+        token_manager: AuthTokenManager,
+        rate_limit: Optional[RateLimit] = None,
+    ) -> None:
+        self.refresh_token = refresh_token
+        self.token_manager = token_manager
+        self.headers: Dict[str, str] = {}
+        # requests using the session, which keep it from being evicted
+        self.in_flight = 0
+        self.token_refresh: SingleFlight[None, None] = SingleFlight()
+        self.token_renewal_task: Optional[asyncio.Task[None]] = None
+        self.pending_token: Optional[str] = None
+        self.token_writer: Optional[asyncio.Task[None]] = None
+        self.rate_limiter = (
+            RateLimiter(rate_limit)
+            if rate_limit is not None
+            else None
+        )
+
+    def stop_renewal(self) -> None:
+        if self.token_renewal_task is not None:
+            self.token_renewal_task.cancel()
+            self.token_renewal_task = None
+
+    def after_fork(self) -> None:
+        self.token_refresh = SingleFlight()
+        self.token_renewal_task = None
+        self.pending_token = None
+        self.token_writer = None
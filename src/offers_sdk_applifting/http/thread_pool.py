@@ -0,0 +1,170 @@
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from offers_sdk_applifting.exceptions import ThreadPoolSaturatedError
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ThreadPoolLimits:
+    """
+    `max_workers` threads run blocking calls and at most `max_queued`
+    more wait for one. Further calls wait for room in the queue, or
+    fail with `ThreadPoolSaturatedError` once they waited
+    `queue_timeout` seconds (`0` rejects right away, `None` waits as
+    long as the call's deadline allows).
+    """
+
+    max_workers: int = 20
+    max_queued: int = 100
+    queue_timeout: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class ThreadPoolMetrics:
+    """
+    Calls running on a worker (`busy`) or waiting for one (`queued`),
+    calls turned away so far (`rejected`), and how long calls waited
+    for a worker on average and at most, in seconds.
+    """
+
+    workers: int
+    busy: int
+    queued: int
+    rejected: int
+    mean_wait: float
+    max_wait: float
+
+
+class BoundedThreadPool:
+    """
+    A thread pool of its own with a bounded queue, so blocking I/O
+    neither waits behind nor crowds out other users of the event
+    loop's default executor.
+    """
+
+    def __init__(
+        self,
+        limits: ThreadPoolLimits = ThreadPoolLimits(),
+        thread_name_prefix: str = "offers-sdk",
+    ) -> None:
+        self._limits = limits
+        self._executor = ThreadPoolExecutor(
+            max_workers=limits.max_workers,
+            thread_name_prefix=thread_name_prefix,
+        )
+        self._slots = asyncio.Semaphore(
+            limits.max_workers + limits.max_queued
+        )
+        self._lock = threading.Lock()
+        self._busy = 0
+        self._queued = 0
+        self._rejected = 0
+        self._started = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def metrics(self) -> ThreadPoolMetrics:
+        with self._lock:
+            return ThreadPoolMetrics(
+                workers=self._limits.max_workers,
+                busy=self._busy,
+                queued=self._queued,
+                rejected=self._rejected,
+                mean_wait=self._total_wait / self._started
+                if self._started
+                else 0.0,
+                max_wait=self._max_wait,
+            )
+
+    async def run[T](self, func: Callable[[], T]) -> T:
+        """
+        Runs `func` on a worker thread in the caller's context.
+        """
+        await self._acquire_slot()
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        queued_at = time.monotonic()
+
+        def work() -> T:
+            waited = time.monotonic() - queued_at
+            with self._lock:
+                self._queued -= 1
+                self._busy += 1
+                self._started += 1
+                self._total_wait += waited
+                self._max_wait = max(self._max_wait, waited)
+            try:
+                return context.run(func)
+            finally:
+                with self._lock:
+                    self._busy -= 1
+
+        with self._lock:
+            self._queued += 1
+        try:
+            future = self._executor.submit(work)
+        except RuntimeError:
+            # shut down
+            with self._lock:
+                self._queued -= 1
+            self._slots.release()
+            raise
+
+        def done(future: Future[T]) -> None:
+            if future.cancelled():
+                with self._lock:
+                    self._queued -= 1
+            # the loop may be gone when a call outlives it
+            with suppress(RuntimeError):
+                loop.call_soon_threadsafe(self._slots.release)
+
+        # keeps the slot taken until the thread is done, even when
+        # the caller stops waiting
+        future.add_done_callback(done)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            task = asyncio.current_task()
+            if future.cancelled() and not (
+                task and task.cancelling()
+            ):
+                raise RuntimeError("Thread pool shut down") from None
+            raise
+
+    async def _acquire_slot(self) -> None:
+        timeout = self._limits.queue_timeout
+        # `wait_for` gives up on a zero timeout even with slots free
+        if timeout is None or not self._slots.locked():
+            await self._slots.acquire()
+            return
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except TimeoutError:
+            with self._lock:
+                self._rejected += 1
+            LOGGER.warning(
+                "Thread pool saturated: %d calls queued",
+                self._limits.max_queued,
+            )
+            raise ThreadPoolSaturatedError(
+                f"{self._limits.max_workers} workers busy and "
+                f"{self._limits.max_queued} calls queued"
+            ) from None
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Cancels queued calls and, with `wait`, blocks until running
+        ones finish. Later calls raise `RuntimeError`.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
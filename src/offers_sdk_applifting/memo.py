@@ -0,0 +1,53 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class MemoLimits:
+    """
+    At most `max_entries` values, each kept for at most `ttl` seconds.
+    """
+
+    max_entries: int = 1024
+    ttl: float = 60 * 5
+
+
+class ExpiringMemo[K: Hashable, V]:
+    """
+    In-process LRU memo whose entries expire at a wall-clock time, so
+    they can share the expiry of the HTTP cache entry they were built
+    from.
+    """
+
+    def __init__(self, limits: MemoLimits = MemoLimits()) -> None:
+        self._limits = limits
+        self._entries: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+        expires_at, value = cached
+        if time.time() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V, expires_at: float) -> None:
+        expires_at = min(expires_at, time.time() + self._limits.ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._limits.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
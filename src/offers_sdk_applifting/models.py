@@ -23,3 +23,6 @@ class Product(BaseModel):
 class ProductID(BaseModel):
     model_config = ConfigDict(frozen=True)
     product_id: str = Field(alias="id")
+
+
+ProductIDAdapter = TypeAdapter(ProductID)
@@ -0,0 +1,36 @@
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Dict, List
+from uuid import UUID
+
+
+class RegistrationStatus(StrEnum):
+    SUCCEEDED = "succeeded"
+    CONFLICTED = "conflicted"
+
+
+@dataclass(frozen=True)
+class RegistrationReport:
+    """
+    Outcome of a bulk registration, keyed by product ID.
+    """
+
+    succeeded: List[UUID] = field(default_factory=list)
+    conflicted: List[UUID] = field(default_factory=list)
+    failed: Dict[UUID, Exception] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def total(self) -> int:
+        return (
+            len(self.succeeded)
+            + len(self.conflicted)
+            + len(self.failed)
+        )
+
+    @property
+    def throughput(self) -> float:
+        """Products processed per second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.total / self.elapsed_seconds
@@ -1,4 +1,7 @@
-from typing import Callable, Dict
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator
 
 import pytest
 from pytest_mock import MockerFixture
@@ -75,3 +78,39 @@ def offers_sdk(
     api_config: ApiConfig, http_client_stub: HttpClientStub
 ) -> OffersClient:
     return OffersClient(api_config, http_client=http_client_stub)
+
+
+class LocalHandler(BaseHTTPRequestHandler):
+    """
+    Answers every GET with an empty JSON list over keep-alive
+    connections. Paths ending in `/slow` wait for `release` first.
+    """
+
+    protocol_version = "HTTP/1.1"
+    release = threading.Event()
+
+    def do_GET(self) -> None:
+        if self.path.endswith("/slow"):
+            self.release.wait(timeout=5)
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"[]")
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def local_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LocalHandler)
+    thread = threading.Thread(
+        target=server.serve_forever, daemon=True
+    )
+    thread.start()
+    LocalHandler.release.clear()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    LocalHandler.release.set()
+    server.shutdown()
+    server.server_close()
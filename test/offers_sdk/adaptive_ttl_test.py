@@ -0,0 +1,61 @@
+import pytest
+
+from offers_sdk_applifting.http.cache.adaptive_ttl import (
+    AdaptiveTtl,
+    TtlLearner,
+)
+
+
+@pytest.fixture
+def learner() -> TtlLearner:
+    return TtlLearner(
+        AdaptiveTtl(
+            min_ttl=10.0,
+            max_ttl=100.0,
+            increase_factor=2.0,
+            decrease_factor=0.5,
+        )
+    )
+
+
+def test_first_fetch_uses_default_ttl_within_bounds(
+    learner: TtlLearner,
+):
+    assert learner.observe("a", b"x", default_ttl=30.0) == 30.0
+    assert learner.observe("b", b"x", default_ttl=1.0) == 10.0
+    assert learner.observe("c", b"x", default_ttl=500.0) == 100.0
+    assert learner.ttl("a") == 30.0
+    assert learner.ttl("missing") is None
+
+
+def test_unchanged_bodies_grow_ttl_up_to_max(learner: TtlLearner):
+    ttls = [
+        learner.observe("a", b"same", default_ttl=30.0)
+        for _ in range(4)
+    ]
+
+    assert ttls == [30.0, 60.0, 100.0, 100.0]
+
+
+def test_changed_bodies_shrink_ttl_down_to_min(learner: TtlLearner):
+    ttls = [
+        learner.observe("a", str(i).encode(), default_ttl=30.0)
+        for i in range(4)
+    ]
+
+    assert ttls == [30.0, 15.0, 10.0, 10.0]
+    assert learner.learned == {"a": 10.0}
+
+
+def test_only_recent_endpoints_are_tracked():
+    # Arrange
+    learner = TtlLearner(AdaptiveTtl(max_tracked=2))
+    learner.observe("a", b"", default_ttl=30.0)
+    learner.observe("b", b"", default_ttl=30.0)
+    learner.observe("a", b"", default_ttl=30.0)
+
+    # Act
+    learner.observe("c", b"", default_ttl=30.0)
+
+    # Assert
+    assert set(learner.learned) == {"a", "c"}
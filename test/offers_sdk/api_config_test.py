@@ -3,7 +3,11 @@ from typing import Dict
 import pytest
 from pytest import MonkeyPatch
 
-from offers_sdk_applifting.config import ApiConfig
+from offers_sdk_applifting.config import (
+    ApiConfig,
+    HttpTransport,
+    TokenStore,
+)
 
 
 @pytest.fixture
@@ -50,3 +54,43 @@ def test_from_env_raises_error_for_missing_variable(
         ApiConfig.from_env()
 
     assert missing_var in str(exc_info.value)
+
+
+def test_from_env_defaults_to_requests_transport(
+    monkeypatch: MonkeyPatch, env_vars: Dict
+):
+    for key, value in env_vars.items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.delenv(
+        ApiConfig.HTTP_TRANSPORT_ENV_KEY, raising=False
+    )
+
+    config = ApiConfig.from_env()
+
+    assert config.http_transport == HttpTransport.REQUESTS
+
+
+def test_from_env_loads_http_transport(
+    monkeypatch: MonkeyPatch, env_vars: Dict
+):
+    for key, value in env_vars.items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.setenv(ApiConfig.HTTP_TRANSPORT_ENV_KEY, "httpx")
+
+    config = ApiConfig.from_env()
+
+    assert config.http_transport == HttpTransport.HTTPX
+
+
+def test_from_env_reads_token_store(
+    monkeypatch: MonkeyPatch, env_vars: Dict
+):
+    for key, value in env_vars.items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.setenv(ApiConfig.TOKEN_STORE_ENV_KEY, "file")
+    monkeypatch.setenv(ApiConfig.TOKEN_ENCRYPTION_KEY_ENV_KEY, "key")
+
+    config = ApiConfig.from_env()
+
+    assert config.token_store == TokenStore.FILE
+    assert config.token_encryption_key == "key"
@@ -1,8 +1,11 @@
+import math
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Callable
+from typing import Callable, Optional
 
 import jwt
 import pytest
+from pytest_mock import MockerFixture
 
 from offers_sdk_applifting.http.auth_token.auth_token_manager import (
     AuthTokenManager,
@@ -54,3 +57,82 @@ def test_token_not_expired_when_given_valid_token(
 ) -> None:
     token_manager = token_manager_stub_factory(future_jwt_token)
     assert not token_manager.is_current_token_expired()
+
+
+def test_seconds_until_expiry_for_valid_token(
+    future_jwt_token: str,
+    token_manager_stub_factory: Callable[[str], AuthTokenManager],
+) -> None:
+    token_manager = token_manager_stub_factory(future_jwt_token)
+
+    remaining = token_manager.seconds_until_expiry()
+
+    assert 3500 < remaining <= 3600
+
+
+def test_seconds_until_expiry_without_token(
+    token_manager_stub_factory: Callable[[str], AuthTokenManager],
+) -> None:
+    token_manager = token_manager_stub_factory("invalid.token.string")
+
+    assert token_manager.seconds_until_expiry() == -math.inf
+
+
+def test_expiry_is_checked_against_monotonic_clock(
+    mocker: MockerFixture,
+    future_jwt_token: str,
+    token_manager_stub_factory: Callable[[str], AuthTokenManager],
+) -> None:
+    # Arrange
+    token_manager = token_manager_stub_factory(future_jwt_token)
+    two_hours_later = time.monotonic() + 2 * 60 * 60
+
+    # Act
+    mocker.patch.object(
+        time, time.monotonic.__name__, return_value=two_hours_later
+    )
+
+    # Assert
+    assert token_manager.is_current_token_expired()
+
+
+@pytest.mark.parametrize(
+    "stored_expires_in,expected",
+    [
+        (timedelta(hours=2), True),
+        (timedelta(minutes=30), False),
+        (timedelta(hours=-1), False),
+        (None, False),
+    ],
+)
+def test_reload_adopts_stored_token_that_outlives_current(
+    future_jwt_token: str,
+    token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    stored_expires_in: Optional[timedelta],
+    expected: bool,
+) -> None:
+    # Arrange
+    token_manager = token_manager_stub_factory(future_jwt_token)
+    stored = (
+        jwt.encode(
+            {
+                "expires": (
+                    datetime.now(timezone.utc) + stored_expires_in
+                ).timestamp()
+            },
+            _SECRET_REFRESH_TOKEN,
+            algorithm="HS256",
+        )
+        if stored_expires_in is not None
+        else future_jwt_token
+    )
+    token_manager._fake_get_token = stored  # type: ignore[attr-defined]
+
+    # Act
+    reloaded = token_manager.reload_token()
+
+    # Assert
+    assert reloaded == expected
+    assert token_manager._access_token == (
+        stored if expected else future_jwt_token
+    )
@@ -0,0 +1,327 @@
+import sqlite3
+from pathlib import Path
+from random import Random
+from typing import Callable, Optional
+
+import pytest
+
+from offers_sdk_applifting.http.cache.backends import (
+    CacheBackend,
+    CacheBackendType,
+    FileSystemCacheBackend,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+    create_cache_backend,
+)
+from offers_sdk_applifting.http.cache.serialization import (
+    BinaryCacheSerializer,
+    CacheEntry,
+    CacheSerializer,
+    JsonCacheSerializer,
+)
+
+BackendFactory = Callable[[Path], CacheBackend]
+
+_BACKENDS = [
+    pytest.param(lambda _: MemoryCacheBackend(), id="memory"),
+    pytest.param(
+        lambda path: SQLiteCacheBackend(path / "cache.sqlite"),
+        id="sqlite",
+    ),
+    pytest.param(
+        lambda path: FileSystemCacheBackend(path / "responses"),
+        id="filesystem",
+    ),
+]
+
+
+def _entry(
+    content: bytes = b"{}", expires_at: float = 2e9
+) -> CacheEntry:
+    return CacheEntry(
+        status_code=200,
+        content=content,
+        expires_at=expires_at,
+        stored_at=1e9,
+        headers={"Content-Type": "application/json"},
+    )
+
+
+@pytest.mark.parametrize(
+    "serializer",
+    [
+        JsonCacheSerializer(),
+        BinaryCacheSerializer(),
+        BinaryCacheSerializer(compression_level=1),
+    ],
+)
+@pytest.mark.parametrize(
+    "content",
+    [b"", b"\x00\xff", b"[1]" * 500],
+    ids=["empty", "raw", "long"],
+)
+def test_serializers_round_trip(
+    serializer: CacheSerializer, content: bytes
+):
+    entry = _entry(content=content)
+
+    assert serializer.loads(serializer.dumps(entry)) == entry
+
+
+@pytest.mark.parametrize(
+    "content,compression_level,compressed",
+    [
+        (b"[1]" * 500, 1, True),
+        (b"[1]" * 500, None, False),
+        (b"[1]" * 10, 1, False),
+        (Random(0).randbytes(2048), 9, False),
+    ],
+    ids=["repetitive", "disabled", "small", "incompressible"],
+)
+def test_binary_serializer_compresses_only_when_worthwhile(
+    content: bytes, compression_level: Optional[int], compressed: bool
+):
+    serializer = BinaryCacheSerializer(
+        compression_level=compression_level
+    )
+
+    data = serializer.dumps(_entry(content=content))
+
+    assert (len(data) < len(content)) == compressed
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"short",
+        JsonCacheSerializer().dumps(_entry()),
+        BinaryCacheSerializer(compression_level=1).dumps(
+            _entry(content=b"[1]" * 500)
+        )[:-10],
+    ],
+)
+def test_binary_serializer_rejects_other_data(data: bytes):
+    with pytest.raises(ValueError):
+        BinaryCacheSerializer().loads(data)
+
+
+def test_json_serializer_reads_entries_without_fetch_time():
+    serializer = JsonCacheSerializer()
+    data = serializer.dumps(_entry()).replace(
+        b', "fetch_time": 0.0', b""
+    )
+
+    assert serializer.loads(data) == _entry()
+
+
+def test_entry_expiry():
+    entry = _entry(expires_at=100.0)
+
+    assert not entry.is_expired(now=99.0)
+    assert entry.is_expired(now=100.0)
+    assert entry.is_expired()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("factory", _BACKENDS)
+async def test_stores_reads_and_deletes(
+    tmp_path: Path, factory: BackendFactory
+):
+    # Arrange
+    backend = factory(tmp_path)
+    entry = _entry()
+
+    # Act
+    size = await backend.set("a", entry)
+    stored = await backend.get("a")
+    await backend.delete(["a", "missing"])
+
+    # Assert
+    assert size > 0
+    assert stored == entry
+    assert await backend.get("a") is None
+    await backend.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("factory", _BACKENDS)
+async def test_delete_expired_returns_removed_keys(
+    tmp_path: Path, factory: BackendFactory
+):
+    # Arrange
+    backend = factory(tmp_path)
+    await backend.set("old", _entry(expires_at=100.0))
+    await backend.set("new", _entry(expires_at=300.0))
+
+    # Act
+    expired = await backend.delete_expired(200.0)
+
+    # Assert
+    assert expired == ["old"]
+    assert [record.key for record in await backend.scan()] == ["new"]
+    await backend.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("factory", _BACKENDS)
+async def test_scan_and_clear(
+    tmp_path: Path, factory: BackendFactory
+):
+    # Arrange
+    backend = factory(tmp_path)
+    sizes = {
+        key: await backend.set(key, _entry(content=key.encode() * 10))
+        for key in ("a", "b")
+    }
+
+    # Act
+    records = await backend.scan()
+    await backend.clear()
+
+    # Assert
+    assert {record.key: record.size for record in records} == sizes
+    assert await backend.scan() == []
+    await backend.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("factory", _BACKENDS)
+async def test_open_creates_storage_up_front(
+    tmp_path: Path, factory: BackendFactory
+):
+    backend = factory(tmp_path)
+
+    await backend.open()
+
+    created = {path.name for path in tmp_path.iterdir()}
+    assert bool(created) != isinstance(backend, MemoryCacheBackend)
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_keeps_most_recently_used():
+    # Arrange
+    backend = MemoryCacheBackend(max_entries=2)
+    await backend.set("a", _entry())
+    await backend.set("b", _entry())
+    await backend.get("a")
+
+    # Act
+    await backend.set("c", _entry())
+
+    # Assert
+    assert await backend.get("b") is None
+    assert await backend.get("a") is not None
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_persists_across_connections(
+    tmp_path: Path,
+):
+    # Arrange
+    path = tmp_path / "cache.sqlite"
+    writer = SQLiteCacheBackend(path)
+    await writer.set("a", _entry())
+    await writer.close()
+
+    reader = SQLiteCacheBackend(path)
+
+    # Act
+    stored = await reader.get("a")
+
+    # Assert
+    assert stored == _entry()
+    await reader.close()
+    with sqlite3.connect(path) as connection:
+        (mode,) = connection.execute("PRAGMA journal_mode").fetchone()
+    assert mode == "wal"
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_drops_entries_it_cannot_read(
+    tmp_path: Path,
+):
+    # Arrange
+    path = tmp_path / "cache.sqlite"
+    writer = SQLiteCacheBackend(path, JsonCacheSerializer())
+    await writer.set("a", _entry())
+    await writer.close()
+    backend = SQLiteCacheBackend(path)
+
+    # Act
+    stored = await backend.get("a")
+
+    # Assert
+    assert stored is None
+    assert await backend.scan() == []
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_reconnects_after_fork(tmp_path: Path):
+    # Arrange
+    backend = SQLiteCacheBackend(tmp_path / "cache.sqlite")
+    await backend.set("a", _entry())
+    parent_connection = backend._connection
+
+    # Act
+    backend.after_fork()
+    stored = await backend.get("a")
+
+    # Assert
+    assert stored == _entry()
+    assert backend._connection is not parent_connection
+    assert parent_connection is not None
+    parent_connection.close()
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_filesystem_backend_drops_corrupt_entries(
+    tmp_path: Path,
+):
+    # Arrange
+    backend = FileSystemCacheBackend(tmp_path)
+    await backend.set("a", _entry())
+    (tmp_path / "a.cache").write_bytes(b"not json")
+
+    # Act
+    stored = await backend.get("a")
+
+    # Assert
+    assert stored is None
+    assert not (tmp_path / "a.cache").exists()
+    assert await backend.delete_expired(float("inf")) == []
+
+
+@pytest.mark.asyncio
+async def test_filesystem_backend_cleans_up_failed_writes(
+    tmp_path: Path,
+):
+    # Arrange
+    backend = FileSystemCacheBackend(tmp_path)
+
+    # Act
+    with pytest.raises(ValueError):
+        await backend.set("a", _entry(expires_at=float("nan")))
+
+    # Assert
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    "backend_type,expected",
+    [
+        (CacheBackendType.MEMORY, MemoryCacheBackend),
+        (CacheBackendType.SQLITE, SQLiteCacheBackend),
+        (CacheBackendType.FILESYSTEM, FileSystemCacheBackend),
+    ],
+)
+def test_create_cache_backend(
+    tmp_path: Path,
+    backend_type: CacheBackendType,
+    expected: type[CacheBackend],
+):
+    assert isinstance(
+        create_cache_backend(backend_type, tmp_path), expected
+    )
@@ -0,0 +1,130 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from offers_sdk_applifting.http.cache import usage
+from offers_sdk_applifting.http.cache.usage import (
+    CacheFootprint,
+    CacheLimits,
+    CacheUsage,
+    EvictionPolicy,
+)
+
+
+@pytest.fixture(autouse=True)
+def clock(mocker: MockerFixture) -> None:
+    ticks = iter(range(1000))
+    mocker.patch.object(usage, "time").time.side_effect = (
+        lambda: next(ticks)
+    )
+
+
+def test_lru_evicts_least_recently_used():
+    # Arrange
+    cache_usage: CacheUsage[str] = CacheUsage(
+        CacheLimits(max_entries=2)
+    )
+    cache_usage.record_store("a", 10)
+    cache_usage.record_store("b", 10)
+    cache_usage.record_hit("a")
+
+    # Act
+    cache_usage.record_store("c", 10)
+    victims = cache_usage.take_victims()
+
+    # Assert
+    assert victims == ["b"]
+    assert cache_usage.footprint == CacheFootprint(
+        entries=2, bytes=20, evictions=1, expired=0
+    )
+
+
+def test_lfu_evicts_least_frequently_used():
+    # Arrange
+    cache_usage: CacheUsage[str] = CacheUsage(
+        CacheLimits(max_entries=2, eviction=EvictionPolicy.LFU)
+    )
+    cache_usage.record_store("a", 10)
+    cache_usage.record_store("b", 10)
+    for _ in range(3):
+        cache_usage.record_hit("a")
+    # most recent, but least used
+    cache_usage.record_hit("b")
+
+    # Act
+    cache_usage.record_store("c", 10)
+    cache_usage.record_hit("c")
+    cache_usage.record_hit("c")
+    victims = cache_usage.take_victims()
+
+    # Assert
+    assert victims == ["b"]
+
+
+def test_frequent_hits_keep_eviction_order_and_bounded_bookkeeping():
+    # Arrange
+    cache_usage: CacheUsage[str] = CacheUsage(
+        CacheLimits(max_entries=2)
+    )
+    cache_usage.record_store("a", 10)
+    cache_usage.record_store("b", 10)
+
+    # Act
+    for _ in range(200):
+        cache_usage.record_hit("b")
+        cache_usage.record_hit("a")
+    cache_usage.record_store("c", 10)
+    victims = cache_usage.take_victims()
+
+    # Assert
+    assert victims == ["b"]
+    assert len(cache_usage._heap) <= 2 * 2 + 64 + 1
+
+
+def test_evicts_until_under_byte_limit():
+    # Arrange
+    cache_usage: CacheUsage[str] = CacheUsage(
+        CacheLimits(max_bytes=100)
+    )
+    for key, size in [("a", 40), ("b", 40), ("c", 40), ("d", 90)]:
+        cache_usage.record_store(key, size)
+
+    # Act
+    victims = cache_usage.take_victims()
+
+    # Assert
+    assert victims == ["a", "b", "c"]
+    assert cache_usage.footprint.bytes == 90
+
+
+def test_within_limits_evicts_nothing():
+    cache_usage: CacheUsage[str] = CacheUsage(CacheLimits())
+    cache_usage.record_store("a", 10**9)
+
+    assert cache_usage.take_victims() == []
+
+
+def test_restoring_a_key_replaces_its_size():
+    cache_usage: CacheUsage[str] = CacheUsage(CacheLimits())
+    cache_usage.record_store("a", 10)
+    cache_usage.record_store("a", 25, accessed_at=0.0)
+
+    assert cache_usage.footprint.bytes == 25
+    assert cache_usage.footprint.entries == 1
+
+
+def test_forget_counts_expired_entries():
+    # Arrange
+    cache_usage: CacheUsage[str] = CacheUsage(CacheLimits())
+    cache_usage.record_store("a", 10)
+    cache_usage.record_store("b", 10)
+
+    # Act
+    cache_usage.forget(["a", "unknown"], expired=True)
+    cache_usage.forget(["b"])
+    cache_usage.record_hit("b")
+
+    # Assert
+    assert cache_usage.footprint == CacheFootprint(
+        entries=0, bytes=0, evictions=0, expired=1
+    )
+    assert cache_usage.limits == CacheLimits()
@@ -0,0 +1,180 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from offers_sdk_applifting.http import concurrency_limiter
+from offers_sdk_applifting.http.concurrency_limiter import (
+    AdaptiveConcurrency,
+    AdaptiveConcurrencyLimiter,
+    LimitChangeReason,
+)
+
+
+@pytest.fixture
+def clock(mocker: MockerFixture) -> Mock:
+    clock = mocker.patch.object(concurrency_limiter, "time")
+    clock.monotonic.return_value = 0.0
+    clock.time.return_value = 1_700_000_000.0
+    return clock
+
+
+@pytest.mark.asyncio
+async def test_waiters_queue_until_a_slot_frees_up():
+    # Arrange
+    limiter = AdaptiveConcurrencyLimiter(
+        AdaptiveConcurrency(initial_limit=2)
+    )
+    first = await limiter.acquire()
+    await limiter.acquire()
+
+    # Act
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    queued = limiter.metrics.queued
+    limiter.release(first, overloaded=None)
+    await waiting
+
+    # Assert
+    assert queued == 1
+    assert limiter.metrics.in_flight == 2
+    assert limiter.metrics.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_grows_additively_while_saturated_and_healthy(
+    clock: Mock,
+):
+    # Arrange
+    limiter = AdaptiveConcurrencyLimiter(
+        AdaptiveConcurrency(initial_limit=2, max_limit=3)
+    )
+
+    # Act
+    for _ in range(3):
+        started = [
+            await limiter.acquire() for _ in range(limiter.limit)
+        ]
+        for started_at in started:
+            limiter.release(started_at, overloaded=False)
+
+    # Assert
+    assert limiter.limit == 3
+    assert [(c.limit, c.reason) for c in limiter.metrics.history] == [
+        (3, LimitChangeReason.HEALTHY)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_does_not_grow_when_limit_is_not_used(clock: Mock):
+    # Arrange
+    limiter = AdaptiveConcurrencyLimiter(
+        AdaptiveConcurrency(initial_limit=4)
+    )
+
+    # Act
+    for _ in range(20):
+        limiter.release(await limiter.acquire(), overloaded=False)
+
+    # Assert
+    assert limiter.limit == 4
+    assert limiter.metrics.history == ()
+
+
+@pytest.mark.asyncio
+async def test_overload_cuts_limit_once_per_change(clock: Mock):
+    # Arrange
+    limiter = AdaptiveConcurrencyLimiter(
+        AdaptiveConcurrency(initial_limit=8, min_limit=3)
+    )
+    in_flight = [await limiter.acquire() for _ in range(3)]
+    clock.monotonic.return_value = 1.0
+
+    # Act
+    limiter.release(in_flight[0], overloaded=True)
+    # sent before the cut, already accounted for
+    limiter.release(in_flight[1], overloaded=True)
+    after_first_cut = limiter.limit
+    clock.monotonic.return_value = 2.0
+    limiter.release(await limiter.acquire(), overloaded=True)
+
+    # Assert
+    assert after_first_cut == 4
+    assert limiter.limit == 3
+    assert [c.reason for c in limiter.metrics.history] == [
+        LimitChangeReason.OVERLOAD,
+        LimitChangeReason.OVERLOAD,
+    ]
+    limiter.release(in_flight[2], overloaded=None)
+
+
+@pytest.mark.asyncio
+async def test_latency_spike_cuts_limit(clock: Mock):
+    # Arrange
+    limiter = AdaptiveConcurrencyLimiter(
+        AdaptiveConcurrency(initial_limit=8, latency_tolerance=2)
+    )
+
+    async def complete(sent: float, latency: float) -> None:
+        clock.monotonic.return_value = sent
+        started_at = await limiter.acquire()
+        clock.monotonic.return_value = sent + latency
+        limiter.release(started_at, overloaded=False)
+
+    await complete(sent=0.0, latency=0.1)
+    await complete(sent=1.0, latency=0.1)
+
+    # Act
+    await complete(sent=2.0, latency=1.0)
+
+    # Assert
+    assert limiter.limit == 4
+    assert limiter.metrics.latency_baseline == pytest.approx(0.1)
+    assert limiter.metrics.history[-1].reason == (
+        LimitChangeReason.LATENCY
+    )
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+    # Arrange
+    limiter = AdaptiveConcurrencyLimiter(
+        AdaptiveConcurrency(initial_limit=1)
+    )
+    started_at = await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    # Act
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    # Assert
+    assert limiter.metrics.queued == 0
+    limiter.release(started_at, overloaded=None)
+    assert limiter.metrics.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_woken_waiter_cancelled_passes_slot_on():
+    # Arrange
+    limiter = AdaptiveConcurrencyLimiter(
+        AdaptiveConcurrency(initial_limit=1)
+    )
+    started_at = await limiter.acquire()
+    first = asyncio.create_task(limiter.acquire())
+    second = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    # Act
+    limiter.release(started_at, overloaded=None)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    await second
+
+    # Assert
+    assert limiter.metrics.in_flight == 1
+    assert limiter.metrics.queued == 0
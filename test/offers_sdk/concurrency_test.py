@@ -0,0 +1,139 @@
+import asyncio
+from typing import AsyncIterator, List
+
+import pytest
+
+from offers_sdk_applifting.concurrency import bounded_as_completed
+
+
+@pytest.mark.asyncio
+async def test_in_flight_work_is_bounded():
+    # Arrange
+    in_flight = 0
+    peak = 0
+
+    async def work(item: int) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return item * 2
+
+    # Act
+    results = [
+        pair
+        async for pair in bounded_as_completed(
+            range(50), work, max_concurrency=4
+        )
+    ]
+
+    # Assert
+    assert sorted(results) == [(i, i * 2) for i in range(50)]
+    assert peak == 4
+
+
+@pytest.mark.asyncio
+async def test_errors_are_yielded_per_item():
+    # Arrange
+    async def work(item: int) -> int:
+        if item % 2:
+            raise ValueError(f"odd {item}")
+        return item
+
+    # Act
+    results = dict(
+        [pair async for pair in bounded_as_completed(range(4), work)]
+    )
+
+    # Assert
+    assert results[0] == 0 and results[2] == 2
+    assert isinstance(results[1], ValueError)
+    assert isinstance(results[3], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_accepts_async_iterable_and_pulls_lazily():
+    # Arrange
+    pulled: List[int] = []
+
+    async def source() -> AsyncIterator[int]:
+        for i in range(100):
+            pulled.append(i)
+            yield i
+
+    async def work(item: int) -> int:
+        return item
+
+    # Act
+    batch = bounded_as_completed(source(), work, max_concurrency=2)
+    first = await anext(batch)
+    await batch.aclose()
+
+    # Assert
+    assert first[0] in (0, 1)
+    assert len(pulled) == 2
+
+
+@pytest.mark.asyncio
+async def test_stopping_early_cancels_pending_work():
+    # Arrange
+    started: List[asyncio.Future] = []
+
+    async def work(item: int) -> int:
+        if item == 0:
+            return item
+        future = asyncio.get_running_loop().create_future()
+        started.append(future)
+        return await future
+
+    # Act
+    batch = bounded_as_completed(range(3), work, max_concurrency=3)
+    assert await anext(batch) == (0, 0)
+    await batch.aclose()
+    await asyncio.sleep(0)
+
+    # Assert
+    assert len(started) == 2
+    assert all(future.cancelled() for future in started)
+
+
+@pytest.mark.asyncio
+async def test_rejects_non_positive_concurrency():
+    async def work(item: int) -> int:
+        return item  # pragma: no cover
+
+    with pytest.raises(ValueError):
+        await anext(
+            bounded_as_completed([1], work, max_concurrency=0)
+        )
+
+
+@pytest.mark.asyncio
+async def test_callable_limit_is_reread_as_slots_free_up():
+    # Arrange
+    limit = 1
+    in_flight = 0
+    peak = []
+
+    async def work(item: int) -> int:
+        nonlocal in_flight, limit
+        in_flight += 1
+        peak.append(in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        limit = 3
+        return item
+
+    # Act
+    results = [
+        item
+        async for item, _ in bounded_as_completed(
+            range(7), work, lambda: limit
+        )
+    ]
+
+    # Assert
+    assert sorted(results) == list(range(7))
+    assert peak[0] == 1
+    assert max(peak) == 3
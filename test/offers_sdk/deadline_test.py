@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from offers_sdk_applifting.http.deadline import (
+    deadline_after,
+    remaining_seconds,
+)
+
+
+@pytest.mark.asyncio
+async def test_no_deadline_by_default():
+    async with deadline_after(None):
+        assert remaining_seconds() is None
+
+
+@pytest.mark.asyncio
+async def test_remaining_seconds_counts_down():
+    async with deadline_after(10):
+        remaining = remaining_seconds()
+
+    assert remaining is not None
+    assert 9 < remaining <= 10
+    assert remaining_seconds() is None
+
+
+@pytest.mark.asyncio
+async def test_nested_deadline_cannot_extend_outer():
+    async with deadline_after(1):
+        async with deadline_after(60):
+            remaining = remaining_seconds()
+
+    assert remaining is not None
+    assert remaining <= 1
+
+
+@pytest.mark.asyncio
+async def test_raises_timeout_error_when_exceeded():
+    with pytest.raises(TimeoutError):
+        async with deadline_after(0.01):
+            await asyncio.sleep(1)
+
+
+@pytest.mark.asyncio
+async def test_deadline_is_inherited_by_spawned_tasks():
+    async with deadline_after(5):
+        remaining = await asyncio.create_task(_remaining())
+
+    assert remaining is not None
+    assert remaining <= 5
+
+
+async def _remaining() -> float | None:
+    return remaining_seconds()
@@ -0,0 +1,50 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from offers_sdk_applifting.http.cache import early_expiration
+from offers_sdk_applifting.http.cache.early_expiration import (
+    EarlyExpiration,
+)
+
+
+@pytest.mark.parametrize("draw,expected", [(0.0, 100.0), (1.0, 80.0)])
+def test_jitter_shortens_ttl_by_at_most_its_fraction(
+    mocker: MockerFixture, draw: float, expected: float
+):
+    mocker.patch.object(
+        early_expiration, "random"
+    ).random.return_value = draw
+
+    assert EarlyExpiration(jitter=0.2).jittered_ttl(100.0) == (
+        pytest.approx(expected)
+    )
+
+
+@pytest.mark.parametrize(
+    "now,fetch_time,beta,expected",
+    [
+        (90.0, 1.0, 1.0, False),
+        (99.0, 1.0, 1.0, True),
+        (95.0, 1.0, 5.0, True),
+        (99.0, 0.0, 1.0, False),
+        (99.9, 1.0, 0.0, False),
+    ],
+)
+def test_expires_early_near_expiry_of_slow_fetches(
+    mocker: MockerFixture,
+    now: float,
+    fetch_time: float,
+    beta: float,
+    expected: bool,
+):
+    # Arrange: -log(1 - draw) == 1
+    mocker.patch.object(
+        early_expiration, "random"
+    ).random.return_value = 0.6321205588285577
+    policy = EarlyExpiration(beta=beta)
+
+    # Act
+    early = policy.expires_early(now, 100.0, fetch_time)
+
+    # Assert
+    assert early == expected
@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from cryptography.fernet import Fernet
+
+from offers_sdk_applifting.http.auth_token.encrypted_file_token_manager import (
+    EncryptedFileTokenManager,
+)
+
+
+def test_token_is_stored_encrypted(tmp_path: Path):
+    # Arrange
+    path = tmp_path / "token"
+    key = Fernet.generate_key()
+
+    # Act
+    EncryptedFileTokenManager(path, key).set_token("secret-token")
+
+    # Assert
+    assert b"secret-token" not in path.read_bytes()
+    assert (
+        EncryptedFileTokenManager(path, key).get_token()
+        == "secret-token"
+    )
+
+
+def test_token_encrypted_with_another_key_is_ignored(tmp_path: Path):
+    # Arrange
+    path = tmp_path / "token"
+    EncryptedFileTokenManager(path, Fernet.generate_key()).set_token(
+        "secret-token"
+    )
+
+    # Act
+    manager = EncryptedFileTokenManager(path, Fernet.generate_key())
+
+    # Assert
+    assert manager.get_token() is None
+    assert manager.is_current_token_expired()
@@ -0,0 +1,33 @@
+import pytest
+
+from offers_sdk_applifting.http.endpoint_rules import EndpointRules
+
+
+@pytest.mark.parametrize(
+    "endpoint,expected",
+    [
+        ("products/register", "register"),
+        ("/products/register/", "register"),
+        ("products/123/offers", "offers"),
+        ("auth", "default"),
+    ],
+)
+def test_first_matching_pattern_wins(endpoint: str, expected: str):
+    rules = EndpointRules(
+        "default",
+        {
+            "products/register": "register",
+            "products/*": "offers",
+            "/products/*/offers": "unreachable",
+        },
+    )
+
+    assert rules.for_endpoint(endpoint) == expected
+    assert rules.default == "default"
+
+
+def test_match_returns_pattern():
+    rules = EndpointRules(0, {"products/*/offers": 1})
+
+    assert rules.match("products/42/offers") == "products/*/offers"
+    assert rules.match("auth") is None
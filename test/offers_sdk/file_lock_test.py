@@ -0,0 +1,86 @@
+import asyncio
+import fcntl
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from offers_sdk_applifting.http.file_lock import FileLock
+
+
+def test_lock_is_exclusive_until_released(tmp_path: Path):
+    # Arrange
+    path = tmp_path / "locks" / "a.lock"
+    holder, contender = FileLock(path), FileLock(path)
+
+    # Act
+    acquired = holder.try_acquire()
+    blocked = not contender.try_acquire()
+    holder.release()
+    holder.release()
+
+    # Assert
+    assert acquired and blocked
+    assert contender.try_acquire()
+    contender.release()
+
+
+@pytest.mark.asyncio
+async def test_hold_waits_for_release(tmp_path: Path):
+    # Arrange
+    path = tmp_path / "a.lock"
+    holder = FileLock(path)
+    holder.try_acquire()
+    asyncio.get_running_loop().call_later(0.05, holder.release)
+
+    # Act
+    async with FileLock(path, poll_interval=0.01).hold() as acquired:
+        # Assert
+        assert acquired
+        assert not FileLock(path).try_acquire()
+
+
+@pytest.mark.asyncio
+async def test_hold_gives_up_after_timeout(tmp_path: Path):
+    # Arrange
+    path = tmp_path / "a.lock"
+    holder = FileLock(path)
+    holder.try_acquire()
+
+    # Act
+    async with FileLock(path, poll_interval=0.01).hold(
+        timeout=0.03
+    ) as acquired:
+        # Assert
+        assert not acquired
+    holder.release()
+
+
+def test_removed_lock_file_is_not_mistaken_for_current(
+    mocker: MockerFixture, tmp_path: Path
+):
+    # Arrange
+    path = tmp_path / "a.lock"
+    holder = FileLock(path, remove_on_release=True)
+    contender = FileLock(path, remove_on_release=True)
+    holder.try_acquire()
+    flock = fcntl.flock
+
+    def flock_after_release(fd: int, operation: int) -> None:
+        # the holder finishes between our open and our lock
+        holder.release()
+        flock(fd, operation)
+
+    patched = mocker.patch.object(
+        fcntl, fcntl.flock.__name__, side_effect=flock_after_release
+    )
+
+    # Act
+    raced = contender.try_acquire()
+    mocker.stop(patched)
+    retried = contender.try_acquire()
+    contender.release()
+
+    # Assert
+    assert not raced and retried
+    assert not path.exists()
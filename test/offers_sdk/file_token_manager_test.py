@@ -0,0 +1,86 @@
+import asyncio
+import os
+import stat
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import jwt
+import pytest
+from pytest_mock import MockerFixture
+
+from offers_sdk_applifting.http.auth_token.file_token_manager import (
+    FileTokenManager,
+)
+
+
+def _token(expires_in: timedelta) -> str:
+    return jwt.encode(
+        {
+            "expires": (
+                datetime.now(timezone.utc) + expires_in
+            ).timestamp()
+        },
+        "secret",
+        algorithm="HS256",
+    )
+
+
+def test_token_is_shared_through_owner_only_file(tmp_path: Path):
+    # Arrange
+    path = tmp_path / "tokens" / "default"
+    writer = FileTokenManager(path)
+    token = _token(timedelta(hours=1))
+
+    # Act
+    writer.update_auth_token(token, save=True)
+    reader = FileTokenManager(path)
+
+    # Assert
+    assert reader.get_token() == token
+    assert not reader.is_current_token_expired()
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert [p.name for p in path.parent.iterdir()] == ["default"]
+
+
+def test_missing_file_means_no_token(tmp_path: Path):
+    manager = FileTokenManager(tmp_path / "token")
+
+    assert manager.get_token() is None
+    assert manager.is_current_token_expired()
+
+
+@pytest.mark.asyncio
+async def test_refreshes_are_exclusive_across_managers(
+    tmp_path: Path,
+):
+    # Arrange
+    path = tmp_path / "token"
+    first, second = FileTokenManager(path), FileTokenManager(path)
+    order = []
+
+    async def refresh(manager: FileTokenManager, name: str) -> None:
+        async with manager.exclusive_refresh():
+            order.append(f"{name} start")
+            await asyncio.sleep(0.05)
+            order.append(f"{name} end")
+
+    # Act
+    await asyncio.gather(refresh(first, "a"), refresh(second, "b"))
+
+    # Assert
+    assert order == ["a start", "a end", "b start", "b end"]
+
+
+def test_failed_write_leaves_no_temporary_file(
+    mocker: MockerFixture, tmp_path: Path
+):
+    # Arrange
+    manager = FileTokenManager(tmp_path / "token")
+    mocker.patch.object(os, os.replace.__name__, side_effect=OSError)
+
+    # Act
+    with pytest.raises(OSError):
+        manager.set_token("token")
+
+    # Assert
+    assert list(tmp_path.iterdir()) == []
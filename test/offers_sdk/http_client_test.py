@@ -1,19 +1,61 @@
+import asyncio
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
-from typing import Callable
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from unittest.mock import AsyncMock
 
 import jwt
 import pytest
 from pytest_mock import MockerFixture
 
+from offers_sdk_applifting.exceptions import UnknownTenantError
 from offers_sdk_applifting.http.auth_token.auth_token_manager import (
     AuthTokenManager,
 )
+from offers_sdk_applifting.http.auth_token.file_token_manager import (
+    FileTokenManager,
+)
 from offers_sdk_applifting.http.base_client import (
     BaseHttpClient,
     HttpResponse,
     TokenRefreshError,
 )
+from offers_sdk_applifting.http.cache.backends import (
+    MemoryCacheBackend,
+)
+from offers_sdk_applifting.http.cache import response_cache
+from offers_sdk_applifting.http.cache.early_expiration import (
+    EarlyExpiration,
+)
+from offers_sdk_applifting.http.cache.negative_caching import (
+    NegativeCaching,
+)
+from offers_sdk_applifting.http.cache.response_cache import CacheMode
+from offers_sdk_applifting.http.cache.usage import (
+    CacheFootprint,
+    CacheLimits,
+)
+from offers_sdk_applifting.http.concurrency_limiter import (
+    AdaptiveConcurrency,
+    LimitChangeReason,
+)
+from offers_sdk_applifting.http.deadline import (
+    deadline_after,
+    remaining_seconds,
+)
+from offers_sdk_applifting.http.rate_limiter import RateLimit
+from offers_sdk_applifting.http.retry import (
+    NO_RETRY,
+    RetryBudget,
+    RetryPolicy,
+)
+from offers_sdk_applifting.http.tenancy import (
+    Tenant,
+    acting_for,
+)
 
 _VALID_REFRESH_TOKEN = "secret_refresh_token"
 
@@ -47,14 +89,17 @@ class MockClient(BaseHttpClient):
         auth_endpoint: str,
         future_token: str,
         token_manager: AuthTokenManager,
+        token_renewal_margin: Optional[float] = None,
     ):
         super().__init__(
             base_url="http://testserver",
             refresh_token=refresh_token,
             auth_endpoint=auth_endpoint,
             token_manager=token_manager,
+            token_renewal_margin=token_renewal_margin,
         )
         self._future_token = future_token
+        self.auth_calls = 0
 
     async def _unauthenticated_get(
         self, endpoint: str, params: dict = {}, headers: dict = {}
@@ -71,6 +116,8 @@ class MockClient(BaseHttpClient):
         self, endpoint: str, data: dict = {}, headers: dict = {}
     ) -> HttpResponse:
         # auth only post
+        self.auth_calls += 1
+        await asyncio.sleep(0)
         if endpoint != self._auth_endpoint:
             return HttpResponse(  # pragma: no cover
                 status_code=HTTPStatus.NOT_FOUND, json={}
@@ -107,6 +154,35 @@ class TestHttpClientTokenRefresh:
         # Assert
         assert data.status_code == HTTPStatus.OK
 
+    @pytest.mark.asyncio
+    async def test_refresh_does_not_read_unshared_storage(
+        self,
+        mocker: MockerFixture,
+        future_expiry_token: str,
+        expired_token: str,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        token_manager = token_manager_stub_factory(expired_token)
+        client = MockClient(
+            refresh_token=_VALID_REFRESH_TOKEN,
+            auth_endpoint="auth",
+            future_token=future_expiry_token,
+            token_manager=token_manager,
+        )
+        storage_read = mocker.spy(
+            token_manager, token_manager.get_token.__name__
+        )
+
+        # Act
+        await client.get("data")
+
+        # Assert
+        storage_read.assert_not_called()
+        assert client._default_headers == {
+            BaseHttpClient._ACCESS_TOKEN_HEADER_KEY: future_expiry_token
+        }
+
     @pytest.mark.asyncio
     async def test_should_refresh_expired_auth_token(
         self,
@@ -178,3 +254,1812 @@ class TestHttpClientTokenRefresh:
             await client.get("data")
 
         assert "Failed to refresh access token" in str(exc_info.value)
+
+
+class TestHttpClientSingleFlightRefresh:
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_refresh(
+        self,
+        future_expiry_token: str,
+        expired_token: str,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        token_manager = token_manager_stub_factory(expired_token)
+        client = MockClient(
+            refresh_token=_VALID_REFRESH_TOKEN,
+            auth_endpoint="auth",
+            future_token=future_expiry_token,
+            token_manager=token_manager,
+        )
+
+        # Act
+        responses = await asyncio.gather(
+            *(client.get("data") for _ in range(50))
+        )
+
+        # Assert
+        assert all(r.status_code == HTTPStatus.OK for r in responses)
+        assert client.auth_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_failure_is_shared_by_waiters(
+        self,
+        future_expiry_token: str,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        token_manager = token_manager_stub_factory("")
+        client = MockClient(
+            refresh_token="invalid_refresh_token",
+            auth_endpoint="auth",
+            future_token=future_expiry_token,
+            token_manager=token_manager,
+        )
+
+        # Act
+        results = await asyncio.gather(
+            *(client.get("data") for _ in range(10)),
+            return_exceptions=True,
+        )
+
+        # Assert
+        assert all(isinstance(r, TokenRefreshError) for r in results)
+        assert client.auth_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_clients_sharing_a_token_file_refresh_once(
+        self, tmp_path: Path, future_expiry_token: str
+    ):
+        # Arrange
+        clients = [
+            MockClient(
+                refresh_token=_VALID_REFRESH_TOKEN,
+                auth_endpoint="auth",
+                future_token=future_expiry_token,
+                token_manager=FileTokenManager(tmp_path / "token"),
+            )
+            for _ in range(3)
+        ]
+
+        # Act
+        responses = await asyncio.gather(
+            *(client.get("data") for client in clients)
+        )
+
+        # Assert
+        assert all(r.status_code == HTTPStatus.OK for r in responses)
+        assert sum(client.auth_calls for client in clients) == 1
+        assert all(
+            client._default_headers == {"Bearer": future_expiry_token}
+            for client in clients
+        )
+
+
+class TestHttpClientTokenPersistence:
+    @pytest.mark.asyncio
+    async def test_refresh_does_not_wait_for_token_storage(
+        self,
+        mocker: MockerFixture,
+        future_expiry_token: str,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        token_manager = token_manager_stub_factory("")
+        stored = threading.Event()
+        set_token = mocker.patch.object(
+            token_manager,
+            AuthTokenManager.set_token.__name__,
+            side_effect=lambda _: stored.wait(1),
+        )
+        client = MockClient(
+            refresh_token=_VALID_REFRESH_TOKEN,
+            auth_endpoint="auth",
+            future_token=future_expiry_token,
+            token_manager=token_manager,
+        )
+
+        # Act
+        resp = await client.get("data")
+        writing = client._tenant_session().token_writer is not None
+        stored.set()
+        await client.aclose()
+
+        # Assert
+        assert resp.status_code == HTTPStatus.OK
+        assert writing
+        set_token.assert_called_once_with(future_expiry_token)
+        assert client._tenant_session().token_writer is None
+
+    @pytest.mark.asyncio
+    async def test_only_the_latest_token_is_stored(
+        self,
+        mocker: MockerFixture,
+        future_expiry_token: str,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        token_manager = token_manager_stub_factory("")
+        set_token = mocker.patch.object(
+            token_manager, AuthTokenManager.set_token.__name__
+        )
+        client = MockClient(
+            refresh_token=_VALID_REFRESH_TOKEN,
+            auth_endpoint="auth",
+            future_token=future_expiry_token,
+            token_manager=token_manager,
+        )
+
+        # Act
+        session = client._tenant_session()
+        client._save_token_behind(session, "first")
+        client._save_token_behind(session, "second")
+        await client._flush_token_writes(session)
+
+        # Assert
+        set_token.assert_called_once_with("second")
+
+    @pytest.mark.asyncio
+    async def test_failed_storage_does_not_fail_requests(
+        self,
+        mocker: MockerFixture,
+        caplog: pytest.LogCaptureFixture,
+        future_expiry_token: str,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        token_manager = token_manager_stub_factory("")
+        mocker.patch.object(
+            token_manager,
+            AuthTokenManager.set_token.__name__,
+            side_effect=OSError("read-only"),
+        )
+        client = MockClient(
+            refresh_token=_VALID_REFRESH_TOKEN,
+            auth_endpoint="auth",
+            future_token=future_expiry_token,
+            token_manager=token_manager,
+        )
+
+        # Act
+        resp = await client.get("data")
+        await client.aclose()
+
+        # Assert
+        assert resp.status_code == HTTPStatus.OK
+        assert "Storing the access token failed" in caplog.text
+
+
+class TestHttpClientBackgroundRenewal:
+    @pytest.mark.asyncio
+    async def test_renews_token_within_margin(
+        self,
+        future_expiry_token: str,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        token_manager = token_manager_stub_factory(
+            future_expiry_token
+        )
+        client = MockClient(
+            refresh_token=_VALID_REFRESH_TOKEN,
+            auth_endpoint="auth",
+            future_token=future_expiry_token,
+            token_manager=token_manager,
+            token_renewal_margin=2 * 60 * 60,
+        )
+
+        # Act
+        await client.get("data")
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        # Assert
+        assert client.auth_calls == 1
+        await client.aclose()
+        assert client._tenant_session().token_renewal_task is None
+
+    @pytest.mark.asyncio
+    async def test_no_renewal_outside_margin(
+        self,
+        future_expiry_token: str,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        token_manager = token_manager_stub_factory(
+            future_expiry_token
+        )
+        client = MockClient(
+            refresh_token=_VALID_REFRESH_TOKEN,
+            auth_endpoint="auth",
+            future_token=future_expiry_token,
+            token_manager=token_manager,
+            token_renewal_margin=60,
+        )
+
+        # Act
+        await client.get("data")
+        await asyncio.sleep(0)
+
+        # Assert
+        assert client.auth_calls == 0
+        assert client._tenant_session().token_renewal_task is not None
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_failed_renewal_keeps_task_alive(
+        self,
+        future_expiry_token: str,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        token_manager = token_manager_stub_factory(
+            future_expiry_token
+        )
+        client = MockClient(
+            refresh_token="invalid_refresh_token",
+            auth_endpoint="auth",
+            future_token=future_expiry_token,
+            token_manager=token_manager,
+            token_renewal_margin=2 * 60 * 60,
+        )
+
+        # Act
+        await client.get("data")
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        # Assert
+        assert client.auth_calls == 1
+        assert client._tenant_session().token_renewal_task is not None
+        assert not client._tenant_session().token_renewal_task.done()
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_renewal_survives_transport_errors(
+        self,
+        mocker: MockerFixture,
+        caplog: pytest.LogCaptureFixture,
+        future_expiry_token: str,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        client = MockClient(
+            refresh_token=_VALID_REFRESH_TOKEN,
+            auth_endpoint="auth",
+            future_token=future_expiry_token,
+            token_manager=token_manager_stub_factory(
+                future_expiry_token
+            ),
+            token_renewal_margin=2 * 60 * 60,
+        )
+        mocker.patch.object(
+            client,
+            client._unauthenticated_post.__name__,
+            side_effect=ConnectionError("reset"),
+        )
+
+        # Act
+        await client.get("data")
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        # Assert
+        renewal = client._tenant_session().token_renewal_task
+        assert renewal is not None and not renewal.done()
+        assert "Background token renewal failed" in caplog.text
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_renewal_and_refresh_outlive_callers_deadline(
+        self,
+        mocker: MockerFixture,
+        expired_token: str,
+        future_expiry_token: str,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        client = MockClient(
+            refresh_token=_VALID_REFRESH_TOKEN,
+            auth_endpoint="auth",
+            future_token=future_expiry_token,
+            token_manager=token_manager_stub_factory(expired_token),
+            token_renewal_margin=60,
+        )
+        post = client._unauthenticated_post
+        deadlines: List[Optional[float]] = []
+
+        async def recording_post(
+            *args: Any, **kwargs: Any
+        ) -> HttpResponse:
+            deadlines.append(remaining_seconds())
+            return await post(*args, **kwargs)
+
+        mocker.patch.object(
+            client,
+            client._unauthenticated_post.__name__,
+            side_effect=recording_post,
+        )
+
+        # Act
+        async with deadline_after(60):
+            await client.get("data")
+
+        # Assert
+        renewal = client._tenant_session().token_renewal_task
+        assert renewal is not None
+        assert renewal.get_context().run(remaining_seconds) is None
+        assert deadlines == [None]
+        await client.aclose()
+
+
+class TestHttpClientRequestCoalescing:
+    @pytest.mark.asyncio
+    async def test_identical_gets_share_one_upstream_call(
+        self,
+        mocker: MockerFixture,
+        future_expiry_token: str,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        client = MockClient(
+            refresh_token=_VALID_REFRESH_TOKEN,
+            auth_endpoint="auth",
+            future_token=future_expiry_token,
+            token_manager=token_manager_stub_factory(
+                future_expiry_token
+            ),
+        )
+
+        async def slow_get(*args: object) -> HttpResponse:
+            await asyncio.sleep(0)
+            return HttpResponse(status_code=HTTPStatus.OK, json=[])
+
+        upstream_get = mocker.patch.object(
+            client,
+            client._unauthenticated_get.__name__,
+            side_effect=slow_get,
+        )
+
+        # Act
+        responses = await asyncio.gather(
+            *(client.get("data", params={"q": 1}) for _ in range(20)),
+            client.get("data", params={"q": 2}),
+        )
+
+        # Assert
+        assert upstream_get.call_count == 2
+        assert len({id(r) for r in responses[:20]}) == 1
+        assert client.coalescing_stats.calls == 21
+        assert client.coalescing_stats.coalesced == 19
+
+    @pytest.mark.asyncio
+    async def test_gets_with_different_deadlines_share_one_call(
+        self,
+        mocker: MockerFixture,
+        future_expiry_token: str,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        client = MockClient(
+            refresh_token=_VALID_REFRESH_TOKEN,
+            auth_endpoint="auth",
+            future_token=future_expiry_token,
+            token_manager=token_manager_stub_factory(
+                future_expiry_token
+            ),
+        )
+        release = asyncio.Event()
+        deadlines: List[Optional[float]] = []
+
+        async def held_get(*args: object) -> HttpResponse:
+            deadlines.append(remaining_seconds())
+            await release.wait()
+            return HttpResponse(status_code=HTTPStatus.OK, json=[])
+
+        mocker.patch.object(
+            client,
+            client._unauthenticated_get.__name__,
+            side_effect=held_get,
+        )
+
+        async def bounded_get() -> HttpResponse:
+            async with deadline_after(0.05):
+                return await client.get("data")
+
+        bounded = asyncio.create_task(bounded_get())
+        await asyncio.sleep(0)
+
+        # Act
+        unbounded = asyncio.create_task(client.get("data"))
+        with pytest.raises(TimeoutError):
+            await bounded
+        release.set()
+
+        # Assert
+        assert (await unbounded).status_code == HTTPStatus.OK
+        assert deadlines == [None]
+        assert client.coalescing_stats.coalesced == 1
+
+
+class TransportTimeout(Exception):
+    pass
+
+
+class ScriptedClient(BaseHttpClient):
+    """
+    Replays `outcomes` one send at a time; exceptions are raised.
+    """
+
+    _RETRYABLE_EXCEPTIONS = (ConnectionError,)
+    _TIMEOUT_EXCEPTIONS = (TransportTimeout,)
+
+    def __init__(
+        self,
+        outcomes: List[HttpResponse | Exception],
+        token_manager: AuthTokenManager,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(
+            base_url="http://testserver",
+            refresh_token=_VALID_REFRESH_TOKEN,
+            auth_endpoint="auth",
+            token_manager=token_manager,
+            **kwargs,
+        )
+        self._outcomes = outcomes
+        self.sent = 0
+
+    async def _send(self) -> HttpResponse:
+        self.sent += 1
+        outcome = self._outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def _unauthenticated_get(
+        self, endpoint: str, params: dict = {}, headers: dict = {}
+    ) -> HttpResponse:
+        return await self._send()
+
+    async def _unauthenticated_post(
+        self, endpoint: str, data: dict = {}, headers: dict = {}
+    ) -> HttpResponse:
+        return await self._send()
+
+
+def _response(
+    status_code: HTTPStatus, headers: Dict[str, str] = {}
+) -> HttpResponse:
+    return HttpResponse(
+        status_code=status_code, json={}, headers=headers
+    )
+
+
+class TestHttpClientRetries:
+    @pytest.fixture
+    def mocked_sleep(self, mocker: MockerFixture) -> AsyncMock:
+        return mocker.patch.object(asyncio, asyncio.sleep.__name__)
+
+    @pytest.fixture
+    def client_factory(
+        self,
+        future_expiry_token: str,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ) -> Callable[..., ScriptedClient]:
+        def _factory(
+            outcomes: List[HttpResponse | Exception], **kwargs: Any
+        ) -> ScriptedClient:
+            return ScriptedClient(
+                outcomes,
+                token_manager_stub_factory(future_expiry_token),
+                **kwargs,
+            )
+
+        return _factory
+
+    @pytest.mark.asyncio
+    async def test_retries_retryable_statuses_with_jittered_backoff(
+        self,
+        mocked_sleep: AsyncMock,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory(
+            [
+                _response(HTTPStatus.SERVICE_UNAVAILABLE),
+                _response(HTTPStatus.BAD_GATEWAY),
+                _response(HTTPStatus.OK),
+            ],
+            retry_policy=RetryPolicy(backoff_base=1, backoff_cap=3),
+        )
+
+        # Act
+        resp = await client.get("data")
+
+        # Assert
+        assert resp.status_code == HTTPStatus.OK
+        assert resp.attempts == 3
+        delays = [
+            call.args[0] for call in mocked_sleep.await_args_list
+        ]
+        assert len(delays) == 2
+        assert 0 <= delays[0] <= 1
+        assert 0 <= delays[1] <= 2
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_other_statuses(
+        self,
+        mocked_sleep: AsyncMock,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory([_response(HTTPStatus.NOT_FOUND)])
+
+        # Act
+        resp = await client.post("products")
+
+        # Assert
+        assert resp.status_code == HTTPStatus.NOT_FOUND
+        assert resp.attempts == 1
+        mocked_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_honors_retry_after_and_pauses_client(
+        self,
+        mocked_sleep: AsyncMock,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory(
+            [
+                _response(
+                    HTTPStatus.TOO_MANY_REQUESTS, {"Retry-After": "7"}
+                ),
+                _response(HTTPStatus.OK),
+                _response(HTTPStatus.OK),
+            ]
+        )
+
+        # Act
+        await client.get("data")
+        await client.get("other")
+
+        # Assert
+        assert mocked_sleep.await_args_list[0].args == (7.0,)
+        # sleep is mocked, so the pause is still in effect
+        assert mocked_sleep.await_args_list[-1].args[0] == (
+            pytest.approx(7.0, abs=1)
+        )
+
+    @pytest.mark.asyncio
+    async def test_gives_up_when_retry_after_exceeds_limit(
+        self,
+        mocked_sleep: AsyncMock,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory(
+            [
+                _response(
+                    HTTPStatus.SERVICE_UNAVAILABLE,
+                    {"Retry-After": "3600"},
+                )
+            ],
+            retry_policy=RetryPolicy(max_retry_after=10),
+        )
+
+        # Act
+        resp = await client.get("data")
+
+        # Assert
+        assert resp.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+        assert client.sent == 1
+        assert client._paused_until > 0
+
+    @pytest.mark.asyncio
+    async def test_retries_transport_errors_until_exhausted(
+        self,
+        mocked_sleep: AsyncMock,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory(
+            [ConnectionError("boom") for _ in range(3)],
+            retry_policy=RetryPolicy(max_retries=2),
+        )
+
+        # Act / Assert
+        with pytest.raises(ConnectionError):
+            await client.get("data")
+        assert client.sent == 3
+
+    @pytest.mark.asyncio
+    async def test_uses_endpoint_specific_policy(
+        self,
+        mocked_sleep: AsyncMock,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory(
+            [
+                _response(HTTPStatus.BAD_GATEWAY),
+                _response(HTTPStatus.BAD_GATEWAY),
+                _response(HTTPStatus.OK),
+            ],
+            endpoint_retry_policies={"products/*": NO_RETRY},
+        )
+
+        # Act
+        no_retry = await client.post("products/register")
+        retried = await client.get("products")
+
+        # Assert
+        assert no_retry.status_code == HTTPStatus.BAD_GATEWAY
+        assert retried.status_code == HTTPStatus.OK
+        assert retried.attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_stops_retrying_when_budget_is_spent(
+        self,
+        mocked_sleep: AsyncMock,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory(
+            [_response(HTTPStatus.SERVICE_UNAVAILABLE)] * 4,
+            retry_budget=RetryBudget(
+                ratio=0, min_per_second=0, max_balance=1
+            ),
+        )
+
+        # Act
+        resp = await client.get("data")
+
+        # Assert
+        assert resp.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+        assert client.sent == 2
+        assert client.retry_budget.balance == 0
+
+    @pytest.mark.asyncio
+    async def test_does_not_back_off_past_deadline(
+        self,
+        mocked_sleep: AsyncMock,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory(
+            [
+                _response(
+                    HTTPStatus.SERVICE_UNAVAILABLE,
+                    {"Retry-After": "5"},
+                )
+            ]
+        )
+
+        # Act
+        async with deadline_after(1):
+            resp = await client.post("data")
+
+        # Assert
+        assert resp.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+        assert client.sent == 1
+
+    @pytest.mark.asyncio
+    async def test_transport_timeouts_surface_as_timeout_error(
+        self,
+        mocked_sleep: AsyncMock,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory(
+            [TransportTimeout(), _response(HTTPStatus.OK)]
+            + [TransportTimeout() for _ in range(2)],
+            retry_policy=RetryPolicy(max_retries=1),
+        )
+
+        # Act
+        retried = await client.get("data")
+        with pytest.raises(TimeoutError) as exc_info:
+            await client.get("other")
+
+        # Assert
+        assert retried.attempts == 2
+        assert isinstance(exc_info.value.__cause__, TransportTimeout)
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_paces_attempts_and_slows_on_429(
+        self,
+        mocked_sleep: AsyncMock,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory(
+            [
+                _response(HTTPStatus.OK),
+                _response(HTTPStatus.TOO_MANY_REQUESTS),
+                _response(HTTPStatus.OK),
+            ],
+            rate_limit=RateLimit(rate=10, increase_step=0.1),
+        )
+        bucket = client.rate_limiter.bucket("data")
+        assert bucket is not None
+
+        # Act
+        await client.get("data")
+        await client.get("data")
+
+        # Assert
+        assert client.sent == 3
+        assert bucket.rate == pytest.approx(6)
+
+    @pytest.mark.asyncio
+    async def test_adaptive_concurrency_backs_off_on_overload(
+        self,
+        mocked_sleep: AsyncMock,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory(
+            [
+                _response(HTTPStatus.SERVICE_UNAVAILABLE),
+                ConnectionError("reset"),
+                _response(HTTPStatus.OK),
+            ],
+            adaptive_concurrency=AdaptiveConcurrency(initial_limit=8),
+        )
+
+        # Act
+        resp = await client.get("data")
+
+        # Assert
+        metrics = client.concurrency_metrics
+        assert resp.status_code == HTTPStatus.OK
+        assert metrics is not None
+        assert metrics.in_flight == 0
+        # the retry was sent after the first cut, so it counts again
+        assert [(c.limit, c.reason) for c in metrics.history] == [
+            (4, LimitChangeReason.OVERLOAD),
+            (2, LimitChangeReason.OVERLOAD),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_attempt_releases_slot_without_signal(
+        self,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory(
+            [], adaptive_concurrency=AdaptiveConcurrency()
+        )
+
+        async def hang() -> HttpResponse:
+            await asyncio.Event().wait()
+            raise AssertionError("unreachable")  # pragma: no cover
+
+        # Act
+        with pytest.raises(TimeoutError):
+            async with deadline_after(0.01):
+                await client._attempt(hang)
+
+        # Assert
+        metrics = client.concurrency_metrics
+        assert metrics is not None
+        assert metrics.in_flight == 0
+        assert metrics.history == ()
+
+    def test_adaptive_concurrency_is_off_by_default(
+        self, client_factory: Callable[..., ScriptedClient]
+    ):
+        client = client_factory([])
+
+        assert client.concurrency_limiter is None
+        assert client.concurrency_metrics is None
+        assert client.pool_metrics is None
+        assert client.thread_pool_metrics is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "connect,read,deadline,expected",
+    [
+        (5.0, 30.0, None, (5.0, 30.0)),
+        (None, None, None, (None, None)),
+        (5.0, 30.0, 10.0, (5.0, 10.0)),
+        (None, None, 10.0, (10.0, 10.0)),
+    ],
+)
+async def test_attempt_timeouts_are_capped_by_deadline(
+    future_expiry_token: str,
+    token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    connect: Optional[float],
+    read: Optional[float],
+    deadline: Optional[float],
+    expected: Tuple[Optional[float], Optional[float]],
+):
+    # Arrange
+    client = ScriptedClient(
+        [],
+        token_manager_stub_factory(future_expiry_token),
+        connect_timeout=connect,
+        read_timeout=read,
+    )
+
+    # Act
+    async with deadline_after(deadline):
+        timeouts = client._attempt_timeouts()
+
+    # Assert
+    assert timeouts == pytest.approx(expected, abs=0.1)
+
+
+class TestHttpClientCacheSweeper:
+    @pytest.mark.asyncio
+    async def test_sweeper_runs_periodically_and_survives_errors(
+        self,
+        mocker: MockerFixture,
+        future_expiry_token: str,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        client = ScriptedClient(
+            [_response(HTTPStatus.OK)],
+            token_manager_stub_factory(future_expiry_token),
+            cache_backend=MemoryCacheBackend(),
+            cache_limits=CacheLimits(sweep_interval=0),
+        )
+        sweep = mocker.patch.object(
+            client,
+            client._sweep_cache.__name__,
+            side_effect=[OSError("disk"), None, None],
+        )
+
+        # Act
+        await client.get("data")
+        for _ in range(5):
+            await asyncio.sleep(0)
+        task = client._cache_sweeper_task
+        await client.aclose()
+
+        # Assert
+        assert sweep.await_count >= 2
+        assert task is not None and task.cancelling()
+        assert client._cache_sweeper_task is None
+
+    @pytest.mark.asyncio
+    async def test_no_sweeper_without_limits(
+        self,
+        future_expiry_token: str,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        client = ScriptedClient(
+            [_response(HTTPStatus.OK)],
+            token_manager_stub_factory(future_expiry_token),
+        )
+
+        # Act
+        await client.get("data")
+        await client._sweep_cache()
+
+        # Assert
+        assert client._cache_sweeper_task is None
+        assert client.cache_footprint is None
+
+
+def _hold_refreshes(
+    mocker: MockerFixture, client: ScriptedClient
+) -> asyncio.Event:
+    """
+    Makes sends wait until the returned event is set.
+    """
+    release = asyncio.Event()
+    send = client._send
+
+    async def held_send() -> HttpResponse:
+        await release.wait()
+        return await send()
+
+    mocker.patch.object(client, client._send.__name__, held_send)
+    return release
+
+
+class TestHttpClientResponseCache:
+    @pytest.fixture
+    def client_factory(
+        self,
+        future_expiry_token: str,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ) -> Callable[..., ScriptedClient]:
+        def _factory(
+            outcomes: List[HttpResponse | Exception], **kwargs: Any
+        ) -> ScriptedClient:
+            kwargs.setdefault("cache_backend", MemoryCacheBackend())
+            return ScriptedClient(
+                outcomes,
+                token_manager_stub_factory(future_expiry_token),
+                **kwargs,
+            )
+
+        return _factory
+
+    @pytest.mark.asyncio
+    async def test_hits_skip_transport_and_token_refresh(
+        self,
+        mocker: MockerFixture,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory([_response(HTTPStatus.OK)])
+        fetched = await client.get("data", params={"page": 1})
+        ensure_token = mocker.patch.object(
+            client, client._ensure_refresh_token.__name__
+        )
+
+        # Act
+        resp = await client.get("data", params={"page": "1"})
+
+        # Assert
+        assert resp.from_cache is True
+        assert resp.expires_at is not None
+        assert resp.expires_at == fetched.expires_at
+        assert client.sent == 1
+        ensure_token.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "endpoint,resp,endpoint_ttls",
+        [
+            ("data", _response(HTTPStatus.NOT_FOUND), {}),
+            (
+                "data",
+                _response(
+                    HTTPStatus.OK, {"Cache-Control": "no-store"}
+                ),
+                {},
+            ),
+            ("auth", _response(HTTPStatus.OK), {"*": 60.0}),
+            ("live/1", _response(HTTPStatus.OK), {"live/*": None}),
+        ],
+    )
+    async def test_uncacheable_responses_are_refetched(
+        self,
+        client_factory: Callable[..., ScriptedClient],
+        endpoint: str,
+        resp: HttpResponse,
+        endpoint_ttls: Dict[str, Optional[float]],
+    ):
+        # Arrange
+        client = client_factory(
+            [resp, resp], endpoint_cache_ttls=endpoint_ttls
+        )
+
+        # Act
+        await client.get(endpoint)
+        second = await client.get(endpoint)
+
+        # Assert
+        assert second.from_cache is False
+        assert client.sent == 2
+
+    @pytest.mark.asyncio
+    async def test_negative_caching_serves_not_found_from_cache(
+        self,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory(
+            [_response(HTTPStatus.NOT_FOUND)],
+            negative_caching=NegativeCaching(ttl=5.0),
+        )
+        await client.get("data")
+
+        # Act
+        resp = await client.get("data")
+
+        # Assert
+        assert resp.status_code == HTTPStatus.NOT_FOUND
+        assert resp.from_cache
+        assert client.sent == 1
+
+    @pytest.mark.asyncio
+    async def test_clients_sharing_a_cache_fetch_each_entry_once(
+        self,
+        mocker: MockerFixture,
+        tmp_path: Path,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        backend = MemoryCacheBackend()
+        clients = [
+            client_factory(
+                [_response(HTTPStatus.OK)],
+                cache_backend=backend,
+                cache_fill_lock_directory=tmp_path,
+            )
+            for _ in range(3)
+        ]
+        release = _hold_refreshes(mocker, clients[0])
+
+        # Act
+        gets = [
+            asyncio.create_task(client.get("data"))
+            for client in clients
+        ]
+        await asyncio.sleep(0.05)
+        release.set()
+        responses = await asyncio.gather(*gets)
+
+        # Assert
+        assert sum(client.sent for client in clients) == 1
+        assert sum(resp.from_cache for resp in responses) == 2
+
+    @pytest.mark.asyncio
+    async def test_footprint_and_sweep_use_the_cache(
+        self,
+        mocker: MockerFixture,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory(
+            [_response(HTTPStatus.OK)],
+            cache_ttl=10.0,
+            cache_limits=CacheLimits(sweep_interval=None),
+        )
+        await client.get("data")
+        clock = mocker.patch.object(response_cache, "time")
+        clock.time.return_value = time.time() + 11
+
+        # Act
+        await client._sweep_cache()
+
+        # Assert
+        assert client.cache_footprint == CacheFootprint(
+            entries=0, bytes=0, evictions=0, expired=1
+        )
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_the_backend(
+        self,
+        mocker: MockerFixture,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        backend = MemoryCacheBackend()
+        close = mocker.patch.object(backend, backend.close.__name__)
+        client = client_factory([], cache_backend=backend)
+
+        # Act
+        await client.aclose()
+
+        # Assert
+        close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stale_hit_is_served_while_one_refresh_runs(
+        self,
+        mocker: MockerFixture,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory(
+            [
+                HttpResponse(status_code=HTTPStatus.OK, json="old"),
+                HttpResponse(status_code=HTTPStatus.OK, json="new"),
+            ],
+            cache_ttl=10.0,
+            cache_stale_while_revalidate=60.0,
+        )
+        clock = mocker.patch.object(response_cache, "time")
+        clock.time.return_value = 0.0
+        await client.get("data")
+        clock.time.return_value = 20.0
+        release = _hold_refreshes(mocker, client)
+
+        # Act
+        stale = [await client.get("data") for _ in range(3)]
+        refreshes = list(client._revalidations.values())
+        release.set()
+        await asyncio.gather(*refreshes)
+        fresh = await client.get("data")
+
+        # Assert
+        assert [resp.json for resp in stale] == ["old"] * 3
+        assert all(resp.from_cache for resp in stale)
+        assert len(refreshes) == 1
+        assert client.sent == 2
+        assert fresh.json == "new" and fresh.from_cache
+        assert client._revalidations == {}
+
+    @pytest.mark.asyncio
+    async def test_only_if_cached_stale_hit_is_not_refreshed(
+        self,
+        mocker: MockerFixture,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory(
+            [HttpResponse(status_code=HTTPStatus.OK, json="old")],
+            cache_ttl=10.0,
+            cache_stale_while_revalidate=60.0,
+        )
+        clock = mocker.patch.object(response_cache, "time")
+        clock.time.return_value = 0.0
+        await client.get("data")
+        clock.time.return_value = 20.0
+
+        # Act
+        stale = await client.get(
+            "data", cache_mode=CacheMode.ONLY_IF_CACHED
+        )
+
+        # Assert
+        assert stale.json == "old" and stale.from_cache
+        assert client._revalidations == {}
+        assert client.sent == 1
+
+    @pytest.mark.asyncio
+    async def test_early_expired_hit_is_refreshed_in_background(
+        self,
+        mocker: MockerFixture,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory(
+            [
+                HttpResponse(status_code=HTTPStatus.OK, json="old"),
+                HttpResponse(status_code=HTTPStatus.OK, json="new"),
+            ],
+            cache_early_expiration=EarlyExpiration(jitter=0.0),
+        )
+        await client.get("data")
+        early = mocker.patch.object(
+            EarlyExpiration,
+            EarlyExpiration.expires_early.__name__,
+            return_value=True,
+        )
+
+        # Act
+        served = await client.get("data")
+        await asyncio.gather(*client._revalidations.values())
+
+        # Assert
+        assert served.json == "old" and served.from_cache
+        assert client.sent == 2
+        (_, _, fetch_time), _ = early.call_args
+        assert fetch_time > 0
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_serving_stale(
+        self,
+        mocker: MockerFixture,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory(
+            [_response(HTTPStatus.OK)],
+            cache_ttl=10.0,
+            cache_stale_while_revalidate=60.0,
+        )
+        clock = mocker.patch.object(response_cache, "time")
+        clock.time.return_value = 0.0
+        await client.get("data")
+        clock.time.return_value = 20.0
+        fetch = mocker.patch.object(
+            client,
+            client._fetch_and_cache.__name__,
+            side_effect=ConnectionError("down"),
+        )
+
+        # Act
+        await client.get("data")
+        await asyncio.gather(*client._revalidations.values())
+        resp = await client.get("data")
+
+        # Assert
+        assert resp.from_cache
+        # a failed refresh is retried by the next stale read
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_pending_refreshes(
+        self,
+        mocker: MockerFixture,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory(
+            [_response(HTTPStatus.OK)],
+            cache_ttl=10.0,
+            cache_stale_while_revalidate=60.0,
+        )
+        clock = mocker.patch.object(response_cache, "time")
+        clock.time.return_value = 0.0
+        await client.get("data")
+        clock.time.return_value = 20.0
+        _hold_refreshes(mocker, client)
+        await client.get("data")
+        (refresh,) = client._revalidations.values()
+
+        # Act
+        await client.aclose()
+
+        # Assert
+        assert refresh.cancelling()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "cache_mode,reads,writes",
+        [
+            (CacheMode.DEFAULT, True, True),
+            (CacheMode.REFRESH, False, True),
+            (CacheMode.BYPASS, False, False),
+        ],
+    )
+    async def test_cache_modes(
+        self,
+        client_factory: Callable[..., ScriptedClient],
+        cache_mode: CacheMode,
+        reads: bool,
+        writes: bool,
+    ):
+        # Arrange
+        client = client_factory([_response(HTTPStatus.OK)] * 3)
+        await client.get("cached")
+
+        # Act
+        cached = await client.get("cached", cache_mode=cache_mode)
+        await client.get("new", cache_mode=cache_mode)
+        stored = await client.get(
+            "new", cache_mode=CacheMode.ONLY_IF_CACHED
+        )
+
+        # Assert
+        assert cached.from_cache is reads
+        assert (stored.status_code == HTTPStatus.OK) is writes
+
+    @pytest.mark.asyncio
+    async def test_only_if_cached_miss_is_a_gateway_timeout(
+        self,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        client = client_factory([])
+
+        resp = await client.get(
+            "data", cache_mode=CacheMode.ONLY_IF_CACHED
+        )
+
+        assert resp.status_code == HTTPStatus.GATEWAY_TIMEOUT
+        assert client.sent == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidate(
+        self,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        # Arrange
+        client = client_factory(
+            [_response(HTTPStatus.OK)] * 3,
+            cache_limits=CacheLimits(sweep_interval=None),
+        )
+        await client.get("a")
+        await client.get("b")
+
+        # Act
+        await client.invalidate("a")
+        a = await client.get("a")
+        b = await client.get("b")
+        await client.invalidate_all()
+        footprint = client.cache_footprint
+
+        # Assert
+        assert not a.from_cache and b.from_cache
+        assert client.sent == 3
+        assert client.learned_cache_ttls == {}
+        assert footprint is not None and footprint.entries == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidate_without_cache_is_a_no_op(
+        self,
+        client_factory: Callable[..., ScriptedClient],
+    ):
+        client = client_factory([], cache_backend=None)
+
+        await client.invalidate("a")
+        await client.invalidate_all()
+
+        assert client.response_cache is None
+        assert client.learned_cache_ttls == {}
+
+
+class TestHttpClientWarmup:
+    @pytest.mark.asyncio
+    async def test_warmup_refreshes_token_and_opens_cache_and_connections(
+        self,
+        mocker: MockerFixture,
+        future_expiry_token: str,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        backend = MemoryCacheBackend()
+        open_cache = mocker.spy(backend, backend.open.__name__)
+        client = ScriptedClient(
+            [
+                HttpResponse(
+                    status_code=HTTPStatus.CREATED,
+                    json={"access_token": future_expiry_token},
+                )
+            ],
+            token_manager_stub_factory(""),
+            cache_backend=backend,
+        )
+        open_connection = mocker.patch.object(
+            client, client._open_connection.__name__
+        )
+
+        # Act
+        await client.warmup(connections=3)
+
+        # Assert
+        assert client.sent == 1
+        assert client._default_headers == {
+            "Bearer": future_expiry_token
+        }
+        open_cache.assert_awaited_once()
+        assert open_connection.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_connections_failing_to_open_are_logged(
+        self,
+        mocker: MockerFixture,
+        caplog: pytest.LogCaptureFixture,
+        future_expiry_token: str,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        client = ScriptedClient(
+            [], token_manager_stub_factory(future_expiry_token)
+        )
+        mocker.patch.object(
+            client,
+            client._open_connection.__name__,
+            side_effect=[None, ConnectionError("refused")],
+        )
+
+        # Act
+        await client.warmup(connections=2)
+        await ScriptedClient(
+            [], token_manager_stub_factory(future_expiry_token)
+        ).warmup()
+
+        # Assert
+        assert "Failed to open 1 of 2 connections" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_warmup_raises_token_refresh_errors(
+        self,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        client = ScriptedClient(
+            [_response(HTTPStatus.UNAUTHORIZED)],
+            token_manager_stub_factory(""),
+            retry_policy=NO_RETRY,
+        )
+
+        with pytest.raises(TokenRefreshError):
+            await client.warmup()
+
+
+def _token_for(refresh_token: str) -> str:
+    expiry = datetime.now(timezone.utc) + timedelta(hours=1)
+    return jwt.encode(
+        {"expires": expiry.timestamp(), "sub": refresh_token},
+        _VALID_REFRESH_TOKEN,
+        algorithm="HS256",
+    )
+
+
+class StoredTokenManager(AuthTokenManager):
+    """
+    Serves `token` from storage and records the threads reading it.
+    """
+
+    def __init__(
+        self, token: str, reads: List[threading.Thread]
+    ) -> None:
+        self._token = token
+        self._reads = reads
+        super().__init__()
+
+    def get_token(self) -> str:
+        self._reads.append(threading.current_thread())
+        return self._token
+
+    def set_token(self, token: str) -> None:
+        pass  # pragma: no cover
+
+
+class TenantClient(BaseHttpClient):
+    """
+    Issues each refresh token its own access token and echoes the
+    access token a GET was sent with.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(
+            base_url="http://testserver",
+            refresh_token="own",
+            auth_endpoint="auth",
+            **kwargs,
+        )
+        self.status = HTTPStatus.OK
+        self.refreshed: List[str] = []
+        self.sending = asyncio.Event()
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def _unauthenticated_get(
+        self, endpoint: str, params: dict = {}, headers: dict = {}
+    ) -> HttpResponse:
+        self.sending.set()
+        await self.release.wait()
+        return HttpResponse(
+            status_code=self.status,
+            json={"bearer": headers["Bearer"]},
+        )
+
+    async def _unauthenticated_post(
+        self, endpoint: str, data: dict = {}, headers: dict = {}
+    ) -> HttpResponse:
+        self.refreshed.append(headers["Bearer"])
+        return HttpResponse(
+            status_code=HTTPStatus.CREATED,
+            json={"access_token": _token_for(headers["Bearer"])},
+        )
+
+
+class TestHttpClientTenants:
+    @pytest.fixture
+    def client_factory(
+        self,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ) -> Callable[..., TenantClient]:
+        def _factory(*tenants: str, **kwargs: Any) -> TenantClient:
+            client = TenantClient(
+                token_manager=token_manager_stub_factory(""),
+                **kwargs,
+            )
+            for tenant_id in tenants:
+                client.add_tenant(
+                    tenant_id,
+                    Tenant(
+                        refresh_token=tenant_id,
+                        token_manager=lambda: token_manager_stub_factory(
+                            ""
+                        ),
+                    ),
+                )
+            return client
+
+        return _factory
+
+    @pytest.mark.asyncio
+    async def test_tenants_use_their_own_tokens_and_cache_entries(
+        self,
+        client_factory: Callable[..., TenantClient],
+    ):
+        # Arrange
+        client = client_factory(
+            "acme", "beta", cache_backend=MemoryCacheBackend()
+        )
+
+        # Act
+        own = await client.get("data")
+        with acting_for("acme"):
+            acme = await client.get("data")
+            cached = await client.get("data")
+        with acting_for("beta"):
+            beta = await client.get("data")
+
+        # Assert
+        assert client.refreshed == ["own", "acme", "beta"]
+        assert [
+            jwt.decode(
+                resp.get_json_as(dict)["bearer"],
+                options={"verify_signature": False},
+            )["sub"]
+            for resp in (own, acme, beta)
+        ] == ["own", "acme", "beta"]
+        assert cached.from_cache and cached.json == acme.json
+
+    @pytest.mark.asyncio
+    async def test_unknown_tenant_is_rejected(
+        self,
+        client_factory: Callable[..., TenantClient],
+    ):
+        client = client_factory()
+
+        with acting_for("nobody"), pytest.raises(UnknownTenantError):
+            await client.get("data")
+        with acting_for("nobody"), pytest.raises(UnknownTenantError):
+            await client.post("data")
+
+    @pytest.mark.asyncio
+    async def test_only_recently_active_tenants_are_kept(
+        self,
+        client_factory: Callable[..., TenantClient],
+    ):
+        # Arrange
+        client = client_factory(
+            "acme",
+            "beta",
+            max_active_tenants=1,
+            token_renewal_margin=60,
+        )
+        with acting_for("acme"):
+            await client.get("data")
+            await client.get("data")
+            renewal = client._tenant_session().token_renewal_task
+
+        # Act
+        with acting_for("beta"):
+            await client.get("data")
+        await asyncio.sleep(0)
+
+        # Assert
+        assert list(client._tenant_sessions) == ["beta"]
+        assert renewal is not None and renewal.cancelled()
+        assert client.refreshed == ["acme", "beta"]
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_new_tenant_reads_storage_once_off_the_loop(
+        self,
+        client_factory: Callable[..., TenantClient],
+    ):
+        # Arrange
+        client = client_factory()
+        stored = _token_for("acme")
+        reads: List[threading.Thread] = []
+        client.add_tenant(
+            "acme",
+            Tenant(
+                refresh_token="acme",
+                token_manager=lambda: StoredTokenManager(
+                    stored, reads
+                ),
+            ),
+        )
+
+        # Act
+        with acting_for("acme"):
+            responses = await asyncio.gather(
+                client.get("data"), client.get("other")
+            )
+
+        # Assert
+        assert len(reads) == 1
+        assert reads[0] is not threading.current_thread()
+        assert responses[0].get_json_as(dict)["bearer"] == stored
+        assert client.refreshed == []
+
+    @pytest.mark.asyncio
+    async def test_tenant_replaced_while_loading_starts_over(
+        self,
+        client_factory: Callable[..., TenantClient],
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        client = client_factory()
+        loading = threading.Event()
+        release = threading.Event()
+
+        def slow_token_manager() -> AuthTokenManager:
+            loading.set()
+            release.wait(timeout=5)
+            return token_manager_stub_factory("")
+
+        client.add_tenant(
+            "acme",
+            Tenant(
+                refresh_token="old", token_manager=slow_token_manager
+            ),
+        )
+        with acting_for("acme"):
+            request = asyncio.create_task(client.get("data"))
+        await asyncio.to_thread(loading.wait, 5)
+
+        # Act
+        client.add_tenant(
+            "acme",
+            Tenant(
+                refresh_token="new",
+                token_manager=lambda: token_manager_stub_factory(""),
+            ),
+        )
+        release.set()
+        await request
+        with acting_for("acme"):
+            await client.get("data")
+
+        # Assert
+        assert client.refreshed == ["old", "new"]
+
+    @pytest.mark.asyncio
+    async def test_busy_tenants_are_not_evicted(
+        self,
+        client_factory: Callable[..., TenantClient],
+    ):
+        # Arrange
+        client = client_factory("acme", "beta", max_active_tenants=1)
+        client.release.clear()
+        with acting_for("acme"):
+            acme = asyncio.create_task(client.get("data"))
+        await client.sending.wait()
+
+        # Act
+        with acting_for("beta"):
+            beta = asyncio.create_task(client.get("data"))
+        await asyncio.sleep(0.01)
+        busy = list(client._tenant_sessions)
+        client.release.set()
+        responses = await asyncio.gather(acme, beta)
+
+        # Assert
+        assert busy == ["acme", "beta"]
+        assert [
+            jwt.decode(
+                resp.get_json_as(dict)["bearer"],
+                options={"verify_signature": False},
+            )["sub"]
+            for resp in responses
+        ] == ["acme", "beta"]
+        assert client.refreshed == ["acme", "beta"]
+
+    @pytest.mark.asyncio
+    async def test_replaced_tenant_starts_over(
+        self,
+        client_factory: Callable[..., TenantClient],
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        client = client_factory("acme", token_renewal_margin=60)
+        with acting_for("acme"):
+            await client.get("data")
+            renewal = client._tenant_session().token_renewal_task
+
+        # Act
+        client.add_tenant(
+            "acme",
+            Tenant(
+                refresh_token="acme-rotated",
+                token_manager=lambda: token_manager_stub_factory(""),
+            ),
+        )
+        with acting_for("acme"):
+            await client.get("data")
+        await asyncio.sleep(0)
+
+        # Assert
+        assert client.refreshed == ["acme", "acme-rotated"]
+        assert renewal is not None and renewal.cancelled()
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_tenant_rate_limit_applies_on_top_of_the_clients(
+        self,
+        token_manager_stub_factory: Callable[[str], AuthTokenManager],
+    ):
+        # Arrange
+        client = TenantClient(
+            token_manager=token_manager_stub_factory(
+                _token_for("own")
+            ),
+            rate_limit=RateLimit(rate=100.0, burst=10),
+            retry_policy=NO_RETRY,
+        )
+        client.add_tenant(
+            "acme",
+            Tenant(
+                refresh_token="acme",
+                token_manager=lambda: token_manager_stub_factory(
+                    _token_for("acme")
+                ),
+                rate_limit=RateLimit(rate=10.0, burst=10),
+            ),
+        )
+        client.status = HTTPStatus.TOO_MANY_REQUESTS
+
+        # Act
+        with acting_for("acme"):
+            await client.get("data")
+            tenant_limiter = client._tenant_session().rate_limiter
+        await client.get("data")
+
+        # Assert
+        assert tenant_limiter is not None
+        tenant_bucket = tenant_limiter.bucket("data")
+        client_bucket = client.rate_limiter.bucket("data")
+        assert tenant_bucket is not None and tenant_bucket.rate == 5.0
+        assert (
+            client_bucket is not None and client_bucket.rate == 25.0
+        )
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_acts_for_the_same_tenant(
+        self,
+        mocker: MockerFixture,
+        client_factory: Callable[..., TenantClient],
+    ):
+        # Arrange
+        client = client_factory(
+            "acme",
+            cache_backend=MemoryCacheBackend(),
+            cache_ttl=10.0,
+            cache_stale_while_revalidate=60.0,
+        )
+        clock = mocker.patch.object(response_cache, "time")
+        clock.time.return_value = 0.0
+        with acting_for("acme"):
+            await client.get("data")
+        clock.time.return_value = 20.0
+
+        # Act
+        with acting_for("acme"):
+            stale = await client.get("data")
+            await asyncio.gather(*client._revalidations.values())
+            fresh = await client.get("data")
+
+        # Assert
+        assert stale.from_cache and fresh.from_cache
+        assert client.refreshed == ["acme"]
+
+
+@pytest.mark.asyncio
+async def test_forked_child_drops_parent_state(
+    future_expiry_token: str,
+    token_manager_stub_factory: Callable[[str], AuthTokenManager],
+):
+    # Arrange
+    backend = MemoryCacheBackend()
+    client = ScriptedClient(
+        [_response(HTTPStatus.OK)] * 2,
+        token_manager_stub_factory(future_expiry_token),
+        cache_backend=backend,
+        cache_limits=CacheLimits(sweep_interval=60.0),
+        rate_limit=RateLimit(rate=1000.0),
+        adaptive_concurrency=AdaptiveConcurrency(initial_limit=1),
+    )
+    await client.get("data")
+    limiter = client.concurrency_limiter
+    assert limiter is not None
+    # a request in flight in the parent
+    await limiter.acquire()
+    client.add_tenant(
+        "acme",
+        Tenant(
+            refresh_token=_VALID_REFRESH_TOKEN,
+            token_manager=lambda: token_manager_stub_factory(
+                future_expiry_token
+            ),
+        ),
+    )
+    with acting_for("acme"):
+        await client.get("data")
+    sweeper = client._cache_sweeper_task
+    get_flight = client._get_flight
+    bucket = client._rate_limiter.bucket("data")
+
+    # Act
+    BaseHttpClient._reset_instances_after_fork()
+
+    # Assert
+    assert client._cache_sweeper_task is None
+    assert client._get_flight is not get_flight
+    assert not client._tenant_sessions
+    child_limiter = client.concurrency_limiter
+    assert child_limiter is not None
+    assert child_limiter.metrics.in_flight == 0
+    assert client._rate_limiter.bucket("data") is not bucket
+    assert sweeper is not None
+    sweeper.cancel()
@@ -1,12 +1,20 @@
+import json
+from dataclasses import FrozenInstanceError
 from http import HTTPStatus
 from typing import Type
+from uuid import uuid7
 
 import pytest
+from pytest_mock import MockerFixture
 
+from offers_sdk_applifting.http import (
+    http_response as http_response_module,
+)
 from offers_sdk_applifting.http.http_response import (
     HttpResponse,
     JSONType,
 )
+from offers_sdk_applifting.models import Offers
 
 
 @pytest.mark.parametrize(
@@ -56,3 +64,81 @@ def test_get_json_as_invalid_type_raises(
         match=f"Response JSON is not a {invalid_type.__name__}",
     ):
         http_response.get_json_as(invalid_type)
+
+
+def test_json_is_decoded_lazily_from_content(mocker: MockerFixture):
+    # Arrange
+    loads_spy = mocker.spy(http_response_module, "loads")
+    http_response = HttpResponse(
+        status_code=HTTPStatus.OK, content=b'{"key": "value"}'
+    )
+    assert loads_spy.call_count == 0
+
+    # Act
+    first = http_response.json
+    second = http_response.json
+
+    # Assert
+    assert first == second == {"key": "value"}
+    assert loads_spy.call_count == 1
+
+
+def test_validate_as_uses_raw_bytes(mocker: MockerFixture):
+    # Arrange
+    offer_id = uuid7()
+    content = json.dumps(
+        [{"id": str(offer_id), "price": 1, "items_in_stock": 2}]
+    ).encode()
+    http_response = HttpResponse(
+        status_code=HTTPStatus.OK, content=content
+    )
+    loads_spy = mocker.spy(http_response_module, "loads")
+
+    # Act
+    offers = http_response.validate_as(Offers)
+
+    # Assert
+    assert offers[0].id == offer_id
+    assert loads_spy.call_count == 0
+
+
+def test_validate_as_falls_back_to_decoded_json():
+    offer_id = uuid7()
+    http_response = HttpResponse(
+        status_code=HTTPStatus.OK,
+        json=[{"id": str(offer_id), "price": 1, "items_in_stock": 2}],
+    )
+
+    offers = http_response.validate_as(Offers)
+
+    assert offers[0].id == offer_id
+
+
+def test_response_is_immutable():
+    http_response = HttpResponse(status_code=HTTPStatus.OK, json={})
+
+    with pytest.raises(FrozenInstanceError):
+        http_response.from_cache = True  # type: ignore[misc]
+
+
+def test_with_from_cache_keeps_body():
+    http_response = HttpResponse(
+        status_code=HTTPStatus.OK, content=b"[1, 2]"
+    )
+
+    cached = http_response.with_from_cache()
+
+    assert cached.from_cache is True
+    assert cached == HttpResponse(
+        status_code=HTTPStatus.OK, json=[1, 2], from_cache=True
+    )
+    assert cached != object()
+
+
+def test_repr_falls_back_to_raw_content_for_non_json_body():
+    http_response = HttpResponse(
+        status_code=HTTPStatus.BAD_GATEWAY,
+        content=b"<html>Bad Gateway</html>",
+    )
+
+    assert "Bad Gateway</html>" in repr(http_response)
@@ -0,0 +1,450 @@
+import asyncio
+import json
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+from offers_sdk_applifting.http.auth_token.auth_token_manager import (
+    AuthTokenManager,
+)
+from offers_sdk_applifting.http.cache.backends import (
+    MemoryCacheBackend,
+)
+from offers_sdk_applifting.http.cache.usage import (
+    CacheFootprint,
+    CacheLimits,
+)
+from offers_sdk_applifting.http.connection_pool import (
+    PoolLimits,
+    PoolMetrics,
+)
+from offers_sdk_applifting.http.httpx_client import HttpxClient
+from offers_sdk_applifting.http.retry import RetryPolicy
+
+_BASE_URL = "https://api.example.com/api/v1/"
+
+Handler = Callable[[httpx.Request], httpx.Response]
+# taken before `no_backoff_sleep` patches it
+_yield_to_loop = asyncio.sleep
+ClientFactory = Callable[..., HttpxClient]
+
+
+@pytest.fixture
+def token_manager(mocker: MockerFixture) -> AuthTokenManager:
+    token_manager = mocker.Mock(spec=AuthTokenManager)
+    token_manager.is_current_token_expired.return_value = False
+    token_manager.access_token = "access-token"
+    return token_manager
+
+
+@pytest.fixture
+def httpx_client_factory(
+    token_manager: AuthTokenManager,
+) -> Callable[[Handler], HttpxClient]:
+    def _factory(handler: Handler, **kwargs: Any) -> HttpxClient:
+        kwargs.setdefault("cache_backend", MemoryCacheBackend())
+        return HttpxClient(
+            base_url=_BASE_URL,
+            refresh_token="dummy",
+            auth_endpoint="auth",
+            token_manager=token_manager,
+            transport=httpx.MockTransport(handler),
+            **kwargs,
+        )
+
+    return _factory
+
+
+@pytest.fixture(autouse=True)
+def no_backoff_sleep(mocker: MockerFixture) -> None:
+    mocker.patch.object(asyncio, asyncio.sleep.__name__)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "endpoint,params,expected_status,expected_json",
+    [
+        ("offers", {"q": "abc"}, HTTPStatus.OK, {"ok": True}),
+        ("products", {}, HTTPStatus.NOT_FOUND, {"error": "nope"}),
+    ],
+)
+async def test_get(
+    httpx_client_factory: Callable[[Handler], HttpxClient],
+    endpoint: str,
+    params: Dict,
+    expected_status: HTTPStatus,
+    expected_json: Dict,
+):
+    # Arrange
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(expected_status, json=expected_json)
+
+    client = httpx_client_factory(handler)
+
+    # Act
+    resp = await client.get(endpoint, params=params)
+
+    # Assert
+    assert resp.status_code == expected_status
+    assert resp.json == expected_json
+    assert str(requests[0].url).startswith(_BASE_URL + endpoint)
+    assert dict(requests[0].url.params) == params
+
+
+@pytest.mark.asyncio
+async def test_post_sends_json_body(
+    httpx_client_factory: Callable[[Handler], HttpxClient],
+):
+    # Arrange
+    payload = {"name": "New Offer"}
+    received: List[Dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        received.append(json.loads(request.content))
+        return httpx.Response(HTTPStatus.CREATED, json={"id": "1"})
+
+    client = httpx_client_factory(handler)
+
+    # Act
+    resp = await client.post("products", data=payload)
+
+    # Assert
+    assert resp.status_code == HTTPStatus.CREATED
+    assert received == [payload]
+
+
+@pytest.mark.asyncio
+async def test_other_endpoints_are_cached(
+    httpx_client_factory: Callable[[Handler], HttpxClient],
+):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(HTTPStatus.OK, json={"value": 42})
+
+    client = httpx_client_factory(handler)
+
+    r1 = await client.get("data")
+    r2 = await client.get("data")
+
+    assert r1.from_cache is False
+    assert r2.from_cache is True
+    assert r2.json == r1.json
+
+
+@pytest.mark.asyncio
+async def test_auth_is_not_cached(
+    httpx_client_factory: Callable[[Handler], HttpxClient],
+):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            HTTPStatus.OK, json={"access_token": "token"}
+        )
+
+    client = httpx_client_factory(handler)
+
+    r1 = await client.get("auth")
+    r2 = await client.get("auth")
+
+    assert r1.from_cache is False and r2.from_cache is False
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors(
+    httpx_client_factory: Callable[[Handler], HttpxClient],
+):
+    # Arrange
+    statuses = [
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.OK,
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = statuses.pop(0)
+        return httpx.Response(
+            status, json={}, headers={"Retry-After": "1"}
+        )
+
+    client = httpx_client_factory(handler)
+
+    # Act
+    resp = await client.post("products")
+
+    # Assert
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.attempts == 3
+    assert statuses == []
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries(
+    httpx_client_factory: Callable[[Handler], HttpxClient],
+):
+    # Arrange
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(HTTPStatus.BAD_GATEWAY, json={})
+
+    client = httpx_client_factory(handler)
+
+    # Act
+    resp = await client.get("data")
+
+    # Assert
+    assert resp.status_code == HTTPStatus.BAD_GATEWAY
+    assert len(calls) == RetryPolicy().max_retries + 1
+
+
+@pytest.mark.asyncio
+async def test_retries_transport_errors(
+    httpx_client_factory: Callable[[Handler], HttpxClient],
+):
+    # Arrange
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("connection refused")
+        return httpx.Response(HTTPStatus.OK, json=[])
+
+    client = httpx_client_factory(handler)
+
+    # Act
+    resp = await client.get("data")
+
+    # Assert
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_client(
+    httpx_client_factory: Callable[[Handler], HttpxClient],
+):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(HTTPStatus.OK, json=[])
+
+    client = httpx_client_factory(handler)
+
+    responses = await asyncio.gather(
+        *(client.post(f"products/{i}") for i in range(200))
+    )
+
+    assert all(r.status_code == HTTPStatus.OK for r in responses)
+    await client.aclose()
+    assert client._client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_forked_child_opens_its_own_client(
+    httpx_client_factory: Callable[[Handler], HttpxClient],
+):
+    # Arrange
+    client = httpx_client_factory(_echo_path)
+    parent_client = client._client
+
+    # Act
+    client._after_fork()
+    resp = await client.get("data")
+
+    # Assert
+    assert client._client is not parent_client
+    assert resp.json == {"path": "/api/v1/data"}
+    await parent_client.aclose()
+    await client.aclose()
+
+
+def _echo_path(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        HTTPStatus.OK, json={"path": request.url.path}
+    )
+
+
+@pytest.mark.asyncio
+async def test_bounded_cache_evicts_entries(
+    httpx_client_factory: ClientFactory,
+):
+    # Arrange
+    client = httpx_client_factory(
+        _echo_path,
+        cache_limits=CacheLimits(max_entries=1, sweep_interval=None),
+    )
+
+    # Act
+    await client.get("a")
+    a_cached = await client.get("a")
+    await client.get("b")
+    a_again = await client.get("a")
+
+    # Assert
+    assert a_cached.from_cache
+    assert not a_again.from_cache
+    assert client.cache_footprint == CacheFootprint(
+        entries=1,
+        bytes=len(a_again.content or b""),
+        evictions=2,
+        expired=0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_warmup_opens_connections_to_base_url(
+    httpx_client_factory: Callable[[Handler], HttpxClient],
+):
+    # Arrange
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(HTTPStatus.OK)
+
+    client = httpx_client_factory(handler)
+
+    # Act
+    await client.warmup(connections=2)
+
+    # Assert
+    assert [(r.method, str(r.url)) for r in requests] == [
+        ("HEAD", _BASE_URL)
+    ] * 2
+    await client.aclose()
+
+
+def test_pool_limits_configure_httpx_pool(
+    httpx_client_factory: ClientFactory,
+):
+    client = httpx_client_factory(
+        _echo_path,
+        pool_limits=PoolLimits(
+            max_connections=8, keepalive_expiry=2.0
+        ),
+    )
+
+    assert client._limits == httpx.Limits(
+        max_connections=8,
+        max_keepalive_connections=8,
+        keepalive_expiry=2.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_requests_wait_for_a_host_slot(
+    httpx_client_factory: ClientFactory,
+):
+    # Arrange
+    gate = asyncio.Event()
+    active = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await gate.wait()
+        active -= 1
+        return httpx.Response(HTTPStatus.OK, json=[])
+
+    client = httpx_client_factory(
+        handler,
+        cache_backend=None,
+        pool_limits=PoolLimits(max_connections_per_host=2),
+    )
+
+    # Act
+    requests = [
+        asyncio.create_task(client.post(f"products/{i}"))
+        for i in range(5)
+    ]
+    for _ in range(10):
+        await _yield_to_loop(0)
+    in_use = client.pool_metrics
+    gate.set()
+    responses = await asyncio.gather(*requests)
+
+    # Assert
+    assert peak == 2
+    assert in_use == PoolMetrics(in_use=2, idle=0, created=0)
+    assert all(r.status_code == HTTPStatus.OK for r in responses)
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_waiting_for_a_host_slot_times_out(
+    httpx_client_factory: ClientFactory,
+):
+    # Arrange
+    gate = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await gate.wait()
+        return httpx.Response(HTTPStatus.OK, json=[])
+
+    client = httpx_client_factory(
+        handler,
+        cache_backend=None,
+        pool_limits=PoolLimits(max_connections_per_host=1),
+        connect_timeout=0.01,
+    )
+    request = asyncio.create_task(client.get("slow"))
+    for _ in range(10):
+        await _yield_to_loop(0)
+
+    # Act
+    with pytest.raises(TimeoutError, match="stayed busy") as exc:
+        await client.get("offers")
+    gate.set()
+    response = await request
+
+    # Assert
+    assert isinstance(exc.value.__cause__, httpx.PoolTimeout)
+    assert response.status_code == HTTPStatus.OK
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_free_host_slot_is_taken_without_waiting(
+    httpx_client_factory: ClientFactory,
+):
+    # Arrange
+    client = httpx_client_factory(
+        _echo_path, cache_backend=None, connect_timeout=0.0
+    )
+
+    # Act
+    response = await client.get("offers")
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_reuse_idle_connections(
+    local_url: str, token_manager: AuthTokenManager
+):
+    # Arrange
+    client = HttpxClient(
+        base_url=local_url,
+        refresh_token="dummy",
+        auth_endpoint="auth",
+        token_manager=token_manager,
+        cache_backend=None,
+    )
+
+    # Act
+    await client.get("offers")
+    await client.get("offers")
+
+    # Assert
+    assert client.pool_metrics == PoolMetrics(
+        in_use=0, idle=1, created=1
+    )
+    await client.aclose()
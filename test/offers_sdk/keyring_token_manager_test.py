@@ -5,6 +5,7 @@ from datetime import datetime, timedelta, timezone
 import jwt
 import keyring
 import pytest
+from keyring.errors import NoKeyringError
 from pytest_mock import MockerFixture
 
 from offers_sdk_applifting.http.auth_token.keyring_token_manager import (
@@ -68,3 +69,21 @@ def test_store_token_saves_to_keyring(mocker: MockerFixture) -> None:
         _TOKEN_KEY,
         test_token,
     )
+
+
+def test_missing_keyring_means_no_stored_token(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange
+    mocker.patch.object(
+        keyring,
+        keyring.get_password.__name__,
+        side_effect=NoKeyringError,
+    )
+
+    # Act
+    token_mgr = KeyringTokenManager(_TOKEN_KEY)
+
+    # Assert
+    assert token_mgr.get_token() is None
+    assert token_mgr.is_current_token_expired()
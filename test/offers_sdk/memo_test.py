@@ -0,0 +1,53 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from offers_sdk_applifting import memo
+from offers_sdk_applifting.memo import ExpiringMemo, MemoLimits
+
+
+@pytest.fixture
+def clock(mocker: MockerFixture):
+    clock = mocker.patch.object(memo, "time")
+    clock.time.return_value = 0.0
+    return clock.time
+
+
+def test_entries_expire_at_the_given_time(clock):
+    # Arrange
+    offers: ExpiringMemo[str, int] = ExpiringMemo()
+    offers.put("a", 1, expires_at=10.0)
+
+    # Act
+    before = offers.get("a")
+    clock.return_value = 10.0
+    after = offers.get("a")
+
+    # Assert
+    assert (before, after) == (1, None)
+    assert len(offers) == 0
+
+
+def test_ttl_caps_the_expiry(clock):
+    offers: ExpiringMemo[str, int] = ExpiringMemo(MemoLimits(ttl=5.0))
+    offers.put("a", 1, expires_at=100.0)
+
+    clock.return_value = 5.0
+
+    assert offers.get("a") is None
+
+
+def test_least_recently_used_entries_are_dropped(clock):
+    # Arrange
+    offers: ExpiringMemo[str, int] = ExpiringMemo(
+        MemoLimits(max_entries=2)
+    )
+    offers.put("a", 1, expires_at=10.0)
+    offers.put("b", 2, expires_at=10.0)
+    offers.get("a")
+
+    # Act
+    offers.put("c", 3, expires_at=10.0)
+
+    # Assert
+    assert offers.get("b") is None
+    assert (offers.get("a"), offers.get("c")) == (1, 3)
@@ -1,25 +1,68 @@
+import asyncio
+import threading
+import time
+from dataclasses import replace
 from http import HTTPStatus
+from pathlib import Path
+from typing import List, Optional
 from uuid import UUID, uuid7
 
+import keyring
 import pytest
+from cryptography.fernet import Fernet
 from pytest_mock import MockerFixture
 
 from offers_sdk_applifting.client import OffersClient
+from offers_sdk_applifting.config import (
+    ApiConfig,
+    HttpTransport,
+    TokenStore,
+)
 from offers_sdk_applifting.exceptions import (
     AuthenticationError,
+    NotCachedError,
+    RequestTimeoutError,
     SDKError,
     ServerError,
+    ThreadPoolSaturatedError,
+    UnknownTenantError,
     ValidationError,
 )
+from offers_sdk_applifting.http.auth_token.encrypted_file_token_manager import (
+    EncryptedFileTokenManager,
+)
+from offers_sdk_applifting.http.auth_token.file_token_manager import (
+    FileTokenManager,
+)
+from offers_sdk_applifting.http.auth_token.keyring_token_manager import (
+    KeyringTokenManager,
+)
 from offers_sdk_applifting.http.base_client import (
     BaseHttpClient,
     TokenRefreshError,
 )
+from offers_sdk_applifting.http.cache.backends import CacheBackendType
+from offers_sdk_applifting.http.cache.response_cache import CacheMode
+from offers_sdk_applifting.http.cache.usage import CacheFootprint
+from offers_sdk_applifting.http.concurrency_limiter import (
+    AdaptiveConcurrency,
+    AdaptiveConcurrencyLimiter,
+)
+from offers_sdk_applifting.http.connection_pool import (
+    PoolLimits,
+    PoolMetrics,
+)
+from offers_sdk_applifting.http.deadline import remaining_seconds
 from offers_sdk_applifting.http.http_response import (
     HttpResponse,
     JSONType,
 )
+from offers_sdk_applifting.http.httpx_client import HttpxClient
+from offers_sdk_applifting.http.requests_client import RequestsClient
+from offers_sdk_applifting.http.tenancy import current_tenant
+from offers_sdk_applifting.http.thread_pool import ThreadPoolLimits
 from offers_sdk_applifting.models import Offers, Product
+from offers_sdk_applifting.registration import RegistrationReport
 
 
 @pytest.mark.asyncio
@@ -63,7 +106,7 @@ async def test_get_offers(
     # Assert
     assert actual_offers == expected_offers
     mocked_get.assert_called_once_with(
-        f"products/{product_id}/offers"
+        f"products/{product_id}/offers", cache_mode=CacheMode.DEFAULT
     )
 
 
@@ -262,3 +305,969 @@ async def test_unexpected_api_error_handling(
     # Act & Assert
     with pytest.raises(SDKError, match="Unexpected error"):
         await offers_sdk.get_offers(product_id)
+
+
+@pytest.mark.parametrize(
+    "http_transport,expected_type",
+    [
+        (HttpTransport.REQUESTS, RequestsClient),
+        (HttpTransport.HTTPX, HttpxClient),
+    ],
+)
+def test_http_client_is_picked_from_config(
+    mocker: MockerFixture,
+    api_config: ApiConfig,
+    http_transport: HttpTransport,
+    expected_type: type,
+):
+    # Arrange
+    mocker.patch.object(
+        keyring, keyring.get_password.__name__, return_value=None
+    )
+    config = replace(api_config, http_transport=http_transport)
+
+    # Act
+    client = OffersClient(config)
+
+    # Assert
+    assert isinstance(client._http_client, expected_type)
+
+
+@pytest.mark.parametrize(
+    "http_transport", [HttpTransport.REQUESTS, HttpTransport.HTTPX]
+)
+def test_pool_limits_are_passed_to_transport(
+    mocker: MockerFixture,
+    api_config: ApiConfig,
+    http_transport: HttpTransport,
+):
+    # Arrange
+    mocker.patch.object(
+        keyring, keyring.get_password.__name__, return_value=None
+    )
+    limits = PoolLimits(max_connections=4, max_connections_per_host=2)
+    config = replace(
+        api_config, http_transport=http_transport, pool_limits=limits
+    )
+
+    # Act
+    client = OffersClient(config)
+
+    # Assert
+    assert client._http_client._pool_limits == limits
+    assert client.pool_metrics == PoolMetrics(
+        in_use=0, idle=0, created=0
+    )
+
+
+@pytest.mark.parametrize(
+    "http_transport,has_threads",
+    [(HttpTransport.REQUESTS, True), (HttpTransport.HTTPX, False)],
+)
+def test_thread_pool_is_passed_to_requests_transport(
+    mocker: MockerFixture,
+    api_config: ApiConfig,
+    http_transport: HttpTransport,
+    has_threads: bool,
+):
+    # Arrange
+    mocker.patch.object(
+        keyring, keyring.get_password.__name__, return_value=None
+    )
+    config = replace(
+        api_config,
+        http_transport=http_transport,
+        thread_pool=ThreadPoolLimits(max_workers=3),
+    )
+
+    # Act
+    client = OffersClient(config)
+
+    # Assert
+    metrics = client.thread_pool_metrics
+    assert (metrics is not None) == has_threads
+    assert metrics is None or metrics.workers == 3
+
+
+@pytest.mark.asyncio
+async def test_saturated_thread_pool_raises_sdk_error(
+    mocker: MockerFixture,
+    api_config: ApiConfig,
+):
+    # Arrange
+    mocker.patch.object(
+        keyring, keyring.get_password.__name__, return_value=None
+    )
+    offers_sdk = OffersClient(
+        replace(
+            api_config,
+            cache_backend=None,
+            thread_pool=ThreadPoolLimits(
+                max_workers=1, max_queued=0, queue_timeout=0
+            ),
+        )
+    )
+    http_client = offers_sdk._http_client
+    assert isinstance(http_client, RequestsClient)
+    release = threading.Event()
+    busy = asyncio.create_task(
+        http_client._thread_pool.run(release.wait)
+    )
+    for _ in range(500):
+        if http_client.thread_pool_metrics.busy:
+            break
+        await asyncio.sleep(0.01)
+
+    # Act
+    with pytest.raises(SDKError) as exc_info:
+        await offers_sdk.get_offers(uuid7())
+
+    # Assert
+    assert isinstance(exc_info.value, ThreadPoolSaturatedError)
+    release.set()
+    await busy
+    await offers_sdk.aclose()
+
+
+@pytest.mark.parametrize(
+    "token_store,encryption_key,expected_type",
+    [
+        (TokenStore.KEYRING, None, KeyringTokenManager),
+        (TokenStore.FILE, None, FileTokenManager),
+        (
+            TokenStore.FILE,
+            Fernet.generate_key().decode(),
+            EncryptedFileTokenManager,
+        ),
+    ],
+)
+def test_token_store_is_picked_from_config(
+    mocker: MockerFixture,
+    tmp_path: Path,
+    api_config: ApiConfig,
+    token_store: TokenStore,
+    encryption_key: Optional[str],
+    expected_type: type,
+):
+    # Arrange
+    mocker.patch.object(
+        keyring, keyring.get_password.__name__, return_value=None
+    )
+    mocker.patch.object(BaseHttpClient, "_CACHE_PATH", tmp_path)
+    config = replace(
+        api_config,
+        token_store=token_store,
+        token_encryption_key=encryption_key,
+    )
+
+    # Act
+    http_client = OffersClient(config)._http_client
+
+    # Assert
+    assert type(http_client._token_manager) is expected_type
+    assert encryption_key is None or encryption_key not in repr(
+        config
+    )
+
+
+@pytest.mark.parametrize(
+    "cache_backend,shares_cache",
+    [
+        (CacheBackendType.SQLITE, True),
+        (CacheBackendType.MEMORY, False),
+    ],
+)
+def test_multiprocess_mode_shares_token_and_cache_fills(
+    mocker: MockerFixture,
+    tmp_path: Path,
+    api_config: ApiConfig,
+    cache_backend: CacheBackendType,
+    shares_cache: bool,
+):
+    # Arrange
+    mocker.patch.object(BaseHttpClient, "_CACHE_PATH", tmp_path)
+    config = replace(
+        api_config, multiprocess=True, cache_backend=cache_backend
+    )
+
+    # Act
+    http_client = OffersClient(config)._http_client
+
+    # Assert
+    assert isinstance(http_client._token_manager, FileTokenManager)
+    assert http_client.response_cache is not None
+    fill_locks = http_client.response_cache._fill_lock_directory
+    assert fill_locks == (
+        tmp_path / "locks" if shares_cache else None
+    )
+
+
+@pytest.mark.asyncio
+async def test_context_manager_closes_http_client(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+):
+    # Arrange
+    mocked_aclose = mocker.patch.object(
+        http_client_stub, http_client_stub.aclose.__name__
+    )
+
+    # Act
+    async with offers_sdk as client:
+        assert client is offers_sdk
+
+    # Assert
+    mocked_aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_offers_are_coalesced(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+):
+    # Arrange
+    product_id = uuid7()
+    response_data = [
+        {"id": str(uuid7()), "price": 100, "items_in_stock": 5}
+    ]
+
+    async def slow_get(endpoint: str, **_: object) -> HttpResponse:
+        await asyncio.sleep(0)
+        return HttpResponse(
+            status_code=HTTPStatus.OK, json=response_data
+        )
+
+    mocked_get = mocker.patch.object(
+        http_client_stub,
+        http_client_stub.get.__name__,
+        side_effect=slow_get,
+    )
+
+    # Act
+    results = await asyncio.gather(
+        *(offers_sdk.get_offers(product_id) for _ in range(10))
+    )
+
+    # Assert
+    mocked_get.assert_called_once()
+    assert all(offers == results[0] for offers in results)
+    assert results[0][0] is results[1][0]
+    assert results[0] is not results[1]
+    assert offers_sdk.coalescing_stats.coalesced == 9
+
+
+@pytest.mark.asyncio
+async def test_get_offers_with_different_deadlines_share_one_call(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+):
+    # Arrange
+    release = asyncio.Event()
+    deadlines: List[Optional[float]] = []
+
+    async def held_get(endpoint: str, **_: object) -> HttpResponse:
+        deadlines.append(remaining_seconds())
+        await release.wait()
+        return HttpResponse(status_code=HTTPStatus.OK, json=[])
+
+    mocker.patch.object(
+        http_client_stub,
+        http_client_stub.get.__name__,
+        side_effect=held_get,
+    )
+    product_id = uuid7()
+    bounded = asyncio.create_task(
+        offers_sdk.get_offers(product_id, deadline=0.05)
+    )
+    await asyncio.sleep(0)
+
+    # Act
+    unbounded = asyncio.create_task(offers_sdk.get_offers(product_id))
+    with pytest.raises(RequestTimeoutError):
+        await bounded
+    release.set()
+
+    # Assert
+    assert await unbounded == []
+    assert deadlines == [None]
+    assert offers_sdk.coalescing_stats.coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_get_offers_many_yields_results_and_errors(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+):
+    # Arrange
+    ok_id, failing_id = uuid7(), uuid7()
+    offer = {"id": str(uuid7()), "price": 1, "items_in_stock": 1}
+
+    async def get(endpoint: str, **_: object) -> HttpResponse:
+        if str(failing_id) in endpoint:
+            return HttpResponse(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR, json={}
+            )
+        return HttpResponse(status_code=HTTPStatus.OK, json=[offer])
+
+    mocker.patch.object(
+        http_client_stub,
+        http_client_stub.get.__name__,
+        side_effect=get,
+    )
+
+    # Act
+    results = {
+        product_id: outcome
+        async for product_id, outcome in offers_sdk.get_offers_many(
+            [ok_id, failing_id], max_concurrency=2
+        )
+    }
+
+    # Assert
+    assert results[ok_id] == Offers.validate_python([offer])
+    assert isinstance(results[failing_id], ServerError)
+
+
+@pytest.mark.asyncio
+async def test_get_offers_many_maps_token_refresh_errors(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+):
+    # Arrange
+    product_id = uuid7()
+    mocker.patch.object(
+        http_client_stub,
+        http_client_stub.get.__name__,
+        side_effect=TokenRefreshError(
+            "Token refresh failed",
+            HttpResponse(
+                status_code=HTTPStatus.UNAUTHORIZED, json={}
+            ),
+        ),
+    )
+
+    # Act
+    results = [
+        outcome
+        async for _, outcome in offers_sdk.get_offers_many(
+            [product_id]
+        )
+    ]
+
+    # Assert
+    assert isinstance(results[0], AuthenticationError)
+
+
+@pytest.mark.asyncio
+async def test_register_product_treats_retried_conflict_as_success(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+):
+    # Arrange
+    product_id = uuid7()
+    mocker.patch.object(
+        http_client_stub,
+        http_client_stub.post.__name__,
+        return_value=HttpResponse(
+            status_code=HTTPStatus.CONFLICT,
+            json={"detail": "Product already exists"},
+            attempts=2,
+        ),
+    )
+
+    # Act
+    result = await offers_sdk.register_product(
+        Product(name="Test Product", description="A test product"),
+        product_id,
+    )
+
+    # Assert
+    assert result.product_id == str(product_id)
+
+
+@pytest.mark.asyncio
+async def test_register_products_reports_each_outcome(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+):
+    # Arrange
+    responses = {
+        "created": HttpResponse(
+            status_code=HTTPStatus.CREATED, json={}
+        ),
+        "retried-conflict": HttpResponse(
+            status_code=HTTPStatus.CONFLICT, json={}, attempts=3
+        ),
+        "conflict": HttpResponse(
+            status_code=HTTPStatus.CONFLICT, json={}
+        ),
+        "broken": HttpResponse(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR, json={}
+        ),
+    }
+
+    async def post(endpoint: str, data: dict) -> HttpResponse:
+        return responses[data["name"]]
+
+    mocker.patch.object(
+        http_client_stub,
+        http_client_stub.post.__name__,
+        side_effect=post,
+    )
+    explicit_id = uuid7()
+
+    async def products():
+        yield Product(name="created", description="")
+        yield Product(name="retried-conflict", description="")
+        yield Product(name="conflict", description=""), explicit_id
+        yield Product(name="broken", description="")
+
+    # Act
+    report = await offers_sdk.register_products(
+        products(), max_concurrency=2
+    )
+
+    # Assert
+    assert len(report.succeeded) == 2
+    assert report.conflicted == [explicit_id]
+    assert len(report.failed) == 1
+    assert isinstance(next(iter(report.failed.values())), ServerError)
+    assert report.total == 4
+    assert report.elapsed_seconds > 0
+    assert report.throughput > 0
+
+
+@pytest.mark.asyncio
+async def test_register_products_maps_token_refresh_errors(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+):
+    mocker.patch.object(
+        http_client_stub,
+        http_client_stub.post.__name__,
+        side_effect=TokenRefreshError(
+            "Token refresh failed",
+            HttpResponse(
+                status_code=HTTPStatus.UNAUTHORIZED, json={}
+            ),
+        ),
+    )
+
+    report = await offers_sdk.register_products(
+        [Product(name="p", description="")]
+    )
+
+    assert [type(e) for e in report.failed.values()] == [
+        AuthenticationError
+    ]
+
+
+def test_registration_report_throughput_without_elapsed_time():
+    assert RegistrationReport().throughput == 0.0
+
+
+@pytest.mark.asyncio
+async def test_get_offers_raises_timeout_error_past_deadline(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+):
+    # Arrange
+    async def hanging_get(
+        *args: object, **kwargs: object
+    ) -> HttpResponse:
+        await asyncio.Event().wait()
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    mocker.patch.object(
+        http_client_stub,
+        http_client_stub.get.__name__,
+        side_effect=hanging_get,
+    )
+
+    # Act / Assert
+    with pytest.raises(RequestTimeoutError):
+        await offers_sdk.get_offers(uuid7(), deadline=0.01)
+
+
+@pytest.mark.asyncio
+async def test_register_products_applies_deadline_per_product(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+):
+    # Arrange
+    async def post(endpoint: str, data: dict) -> HttpResponse:
+        if data["name"] == "slow":
+            await asyncio.Event().wait()
+        return HttpResponse(
+            status_code=HTTPStatus.CREATED, json={"id": data["id"]}
+        )
+
+    mocker.patch.object(
+        http_client_stub,
+        http_client_stub.post.__name__,
+        side_effect=post,
+    )
+    fast_id, slow_id = uuid7(), uuid7()
+
+    # Act
+    report = await offers_sdk.register_products(
+        [
+            (Product(name="fast", description=""), fast_id),
+            (Product(name="slow", description=""), slow_id),
+        ],
+        deadline=0.01,
+    )
+
+    # Assert
+    assert report.succeeded == [fast_id]
+    assert isinstance(report.failed[slow_id], RequestTimeoutError)
+
+
+@pytest.mark.asyncio
+async def test_batches_follow_adaptive_concurrency_limit(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+):
+    # Arrange
+    mocker.patch.object(
+        http_client_stub,
+        "_concurrency_limiter",
+        AdaptiveConcurrencyLimiter(
+            AdaptiveConcurrency(initial_limit=2)
+        ),
+    )
+    in_flight = 0
+    peak = 0
+
+    async def get(endpoint: str, **_: object) -> HttpResponse:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return HttpResponse(status_code=HTTPStatus.OK, json=[])
+
+    mocker.patch.object(
+        http_client_stub,
+        http_client_stub.get.__name__,
+        side_effect=get,
+    )
+
+    # Act
+    results = [
+        result
+        async for _, result in offers_sdk.get_offers_many(
+            [uuid7() for _ in range(10)]
+        )
+    ]
+
+    # Assert
+    assert results == [[]] * 10
+    assert peak == 2
+    assert offers_sdk.concurrency_metrics is not None
+    assert offers_sdk.concurrency_metrics.limit == 2
+
+
+def test_cache_footprint_comes_from_http_client(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+):
+    footprint = CacheFootprint(
+        entries=1, bytes=2, evictions=3, expired=4
+    )
+    mocker.patch.object(
+        type(http_client_stub),
+        "cache_footprint",
+        new_callable=mocker.PropertyMock,
+        return_value=footprint,
+    )
+
+    assert offers_sdk.cache_footprint == footprint
+
+
+@pytest.mark.asyncio
+async def test_get_offers_reuses_offers_of_cached_responses(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+):
+    # Arrange
+    response_data = [
+        {"id": str(uuid7()), "price": 100, "items_in_stock": 5}
+    ]
+    mocked_get = mocker.patch.object(
+        http_client_stub,
+        http_client_stub.get.__name__,
+        return_value=HttpResponse(
+            status_code=HTTPStatus.OK,
+            json=response_data,
+            expires_at=time.time() + 60,
+        ),
+    )
+    product_id = uuid7()
+
+    # Act
+    first = await offers_sdk.get_offers(product_id)
+    second = await offers_sdk.get_offers(product_id)
+
+    # Assert
+    mocked_get.assert_called_once()
+    assert second == first and second is not first
+    assert second[0] is first[0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("expires_in", [None, -1.0])
+async def test_get_offers_does_not_reuse_uncached_or_stale_responses(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+    expires_in: Optional[float],
+):
+    # Arrange
+    mocked_get = mocker.patch.object(
+        http_client_stub,
+        http_client_stub.get.__name__,
+        return_value=HttpResponse(
+            status_code=HTTPStatus.OK,
+            json=[],
+            expires_at=None
+            if expires_in is None
+            else time.time() + expires_in,
+        ),
+    )
+    product_id = uuid7()
+
+    # Act
+    await offers_sdk.get_offers(product_id)
+    await offers_sdk.get_offers(product_id)
+
+    # Assert
+    assert mocked_get.call_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "cache,uses_memo",
+    [
+        (CacheMode.DEFAULT, True),
+        (CacheMode.ONLY_IF_CACHED, True),
+        (CacheMode.REFRESH, False),
+        (CacheMode.BYPASS, False),
+    ],
+)
+async def test_get_offers_cache_modes(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+    cache: CacheMode,
+    uses_memo: bool,
+):
+    # Arrange
+    mocked_get = mocker.patch.object(
+        http_client_stub,
+        http_client_stub.get.__name__,
+        return_value=HttpResponse(
+            status_code=HTTPStatus.OK,
+            json=[],
+            expires_at=time.time() + 60,
+        ),
+    )
+    product_id = uuid7()
+    await offers_sdk.get_offers(product_id)
+
+    # Act
+    await offers_sdk.get_offers(product_id, cache=cache)
+
+    # Assert
+    assert mocked_get.call_count == (1 if uses_memo else 2)
+    if not uses_memo:
+        mocked_get.assert_called_with(
+            f"products/{product_id}/offers", cache_mode=cache
+        )
+
+
+@pytest.mark.asyncio
+async def test_only_if_cached_miss_raises_not_cached_error(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+):
+    mocker.patch.object(
+        http_client_stub,
+        http_client_stub.get.__name__,
+        return_value=HttpResponse(
+            status_code=HTTPStatus.GATEWAY_TIMEOUT
+        ),
+    )
+
+    with pytest.raises(NotCachedError):
+        await offers_sdk.get_offers(
+            uuid7(), cache=CacheMode.ONLY_IF_CACHED
+        )
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_memo_and_http_cache_entry(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+):
+    # Arrange
+    mocked_get = mocker.patch.object(
+        http_client_stub,
+        http_client_stub.get.__name__,
+        return_value=HttpResponse(
+            status_code=HTTPStatus.OK,
+            json=[],
+            expires_at=time.time() + 60,
+        ),
+    )
+    invalidate = mocker.patch.object(
+        http_client_stub, http_client_stub.invalidate.__name__
+    )
+    invalidate_all = mocker.patch.object(
+        http_client_stub, http_client_stub.invalidate_all.__name__
+    )
+    product_id = uuid7()
+    await offers_sdk.get_offers(product_id)
+
+    # Act
+    await offers_sdk.invalidate(product_id)
+    await offers_sdk.get_offers(product_id)
+    await offers_sdk.invalidate_all()
+    await offers_sdk.get_offers(product_id)
+
+    # Assert
+    assert mocked_get.call_count == 3
+    invalidate.assert_awaited_once_with(
+        f"products/{product_id}/offers"
+    )
+    invalidate_all.assert_awaited_once()
+
+
+def test_learned_ttls_are_reported_per_product(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+):
+    product_id = uuid7()
+    mocker.patch.object(
+        type(http_client_stub),
+        "learned_cache_ttls",
+        new_callable=mocker.PropertyMock,
+        return_value={
+            f"products/{product_id}/offers": 12.5,
+            "products": 60.0,
+        },
+    )
+
+    assert offers_sdk.learned_ttls == {product_id: 12.5}
+
+
+@pytest.mark.parametrize(
+    "token_store,tenant_id,token_path",
+    [
+        (TokenStore.KEYRING, "acme", None),
+        (TokenStore.FILE, "acme", "default.acme"),
+        (TokenStore.FILE, "../../acme", "default...%2F..%2Facme"),
+    ],
+)
+def test_tenant_tokens_are_stored_under_their_own_key(
+    mocker: MockerFixture,
+    tmp_path: Path,
+    api_config: ApiConfig,
+    token_store: TokenStore,
+    tenant_id: str,
+    token_path: Optional[str],
+):
+    # Arrange
+    get_password = mocker.patch.object(
+        keyring, keyring.get_password.__name__, return_value=None
+    )
+    mocker.patch.object(BaseHttpClient, "_CACHE_PATH", tmp_path)
+    offers_sdk = OffersClient(
+        replace(api_config, token_store=token_store)
+    )
+
+    # Act
+    offers_sdk.add_tenant(tenant_id, "acme-refresh-token")
+    tenant = offers_sdk._http_client._tenants[tenant_id]
+    token_manager = tenant.token_manager()
+
+    # Assert
+    assert tenant.refresh_token == "acme-refresh-token"
+    if token_path is None:
+        assert isinstance(token_manager, KeyringTokenManager)
+        assert get_password.call_args.args[1] == "default.acme"
+    else:
+        assert isinstance(token_manager, FileTokenManager)
+        assert token_manager._path == tmp_path / "tokens" / token_path
+        assert token_manager._path.parent == tmp_path / "tokens"
+
+
+@pytest.mark.asyncio
+async def test_unknown_tenant_raises_sdk_error(
+    offers_sdk: OffersClient,
+):
+    # Act
+    with pytest.raises(SDKError) as exc_info:
+        await offers_sdk.get_offers(uuid7(), tenant="nobody")
+
+    # Assert
+    assert isinstance(exc_info.value, UnknownTenantError)
+    assert isinstance(exc_info.value, LookupError)
+
+
+@pytest.mark.asyncio
+async def test_offers_are_fetched_and_memoized_per_tenant(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+):
+    # Arrange
+    tenants: List[Optional[str]] = []
+
+    async def get(*args: object, **kwargs: object) -> HttpResponse:
+        tenants.append(current_tenant())
+        return HttpResponse(
+            status_code=HTTPStatus.OK,
+            json=[],
+            expires_at=time.time() + 60,
+        )
+
+    mocker.patch.object(
+        http_client_stub, http_client_stub.get.__name__, get
+    )
+    invalidate = mocker.patch.object(
+        http_client_stub, http_client_stub.invalidate.__name__
+    )
+    offers_sdk.add_tenant("acme", "acme-refresh-token")
+    product_id = uuid7()
+
+    # Act
+    await offers_sdk.get_offers(product_id)
+    await offers_sdk.get_offers(product_id, tenant="acme")
+    await offers_sdk.get_offers(product_id, tenant="acme")
+    await offers_sdk.invalidate(product_id, tenant="acme")
+    await offers_sdk.get_offers(product_id)
+    async for _ in offers_sdk.get_offers_many(
+        [product_id], tenant="acme"
+    ):
+        pass
+
+    # Assert
+    assert tenants == [None, "acme", "acme"]
+    invalidate.assert_awaited_once_with(
+        f"products/{product_id}/offers"
+    )
+
+
+@pytest.mark.asyncio
+async def test_products_are_registered_for_the_given_tenant(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+):
+    # Arrange
+    tenants: List[Optional[str]] = []
+
+    async def post(*args: object, **kwargs: object) -> HttpResponse:
+        tenants.append(current_tenant())
+        return HttpResponse(
+            status_code=HTTPStatus.CREATED, json={"id": str(uuid7())}
+        )
+
+    mocker.patch.object(
+        http_client_stub, http_client_stub.post.__name__, post
+    )
+    product = Product(name="p", description="d")
+
+    # Act
+    await offers_sdk.register_product(product, tenant="acme")
+    await offers_sdk.register_products([product], tenant="beta")
+
+    # Assert
+    assert tenants == ["acme", "beta"]
+
+
+@pytest.mark.asyncio
+async def test_warmup_opens_configured_connections(
+    mocker: MockerFixture,
+    api_config: ApiConfig,
+    http_client_stub: BaseHttpClient,
+):
+    # Arrange
+    warmup = mocker.patch.object(
+        http_client_stub, http_client_stub.warmup.__name__
+    )
+    offers_sdk = OffersClient(
+        replace(api_config, warmup_connections=4),
+        http_client=http_client_stub,
+    )
+
+    # Act
+    await offers_sdk.warmup()
+
+    # Assert
+    warmup.assert_awaited_once_with(4)
+
+
+@pytest.mark.asyncio
+async def test_warmup_maps_token_refresh_errors(
+    mocker: MockerFixture,
+    offers_sdk: OffersClient,
+    http_client_stub: BaseHttpClient,
+):
+    mocker.patch.object(
+        http_client_stub,
+        http_client_stub.warmup.__name__,
+        side_effect=TokenRefreshError(
+            "Failed",
+            HttpResponse(status_code=HTTPStatus.UNAUTHORIZED),
+        ),
+    )
+
+    with pytest.raises(AuthenticationError):
+        await offers_sdk.warmup()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fails", [False, True])
+async def test_eager_client_warms_up_in_background(
+    mocker: MockerFixture,
+    caplog: pytest.LogCaptureFixture,
+    api_config: ApiConfig,
+    http_client_stub: BaseHttpClient,
+    fails: bool,
+):
+    # Arrange
+    warmup = mocker.patch.object(
+        http_client_stub,
+        http_client_stub.warmup.__name__,
+        side_effect=ConnectionError("refused") if fails else None,
+    )
+
+    # Act
+    offers_sdk = OffersClient(
+        api_config, http_client=http_client_stub, eager=True
+    )
+    assert offers_sdk._warmup_task is not None
+    await offers_sdk._warmup_task
+    await offers_sdk.aclose()
+
+    # Assert
+    warmup.assert_awaited_once_with(api_config.warmup_connections)
+    assert ("Eager warm-up failed" in caplog.text) == fails
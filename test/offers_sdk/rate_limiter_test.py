@@ -0,0 +1,153 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from offers_sdk_applifting.http import rate_limiter
+from offers_sdk_applifting.http.rate_limiter import (
+    RateLimit,
+    RateLimiter,
+    TokenBucket,
+)
+
+
+@pytest.fixture
+def clock(mocker: MockerFixture) -> Mock:
+    clock = mocker.patch.object(rate_limiter, "time")
+    clock.monotonic.return_value = 0.0
+    return clock
+
+
+@pytest.fixture
+def mocked_sleep(mocker: MockerFixture) -> AsyncMock:
+    return mocker.patch.object(asyncio, asyncio.sleep.__name__)
+
+
+@pytest.mark.asyncio
+async def test_bucket_allows_burst_then_queues_waiters(
+    clock: Mock, mocked_sleep: AsyncMock
+):
+    # Arrange
+    bucket = TokenBucket(RateLimit(rate=2, burst=2))
+
+    # Act
+    for _ in range(4):
+        await bucket.acquire()
+
+    # Assert
+    assert [c.args[0] for c in mocked_sleep.await_args_list] == [
+        0.5,
+        1.0,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bucket_refills_over_time(
+    clock: Mock, mocked_sleep: AsyncMock
+):
+    # Arrange
+    bucket = TokenBucket(RateLimit(rate=2, burst=1))
+    await bucket.acquire()
+
+    # Act
+    clock.monotonic.return_value = 0.5
+    await bucket.acquire()
+
+    # Assert
+    mocked_sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_returns_its_token(
+    clock: Mock, mocked_sleep: AsyncMock
+):
+    # Arrange
+    bucket = TokenBucket(RateLimit(rate=1, burst=1))
+    await bucket.acquire()
+    mocked_sleep.side_effect = asyncio.CancelledError
+
+    # Act
+    with pytest.raises(asyncio.CancelledError):
+        await bucket.acquire()
+    mocked_sleep.side_effect = None
+    await bucket.acquire()
+
+    # Assert
+    assert mocked_sleep.await_args_list[-1].args == (1.0,)
+
+
+def test_throttle_reduces_rate_once_per_round_trip(clock: Mock):
+    # Arrange
+    bucket = TokenBucket(
+        RateLimit(rate=8, decrease_factor=0.5, min_rate=3)
+    )
+    clock.monotonic.return_value = 1.0
+
+    # Act
+    bucket.throttle(sent_at=0.5)
+    # sent before the reduction, already accounted for
+    bucket.throttle(sent_at=0.9)
+    after_one = bucket.rate
+    bucket.throttle(sent_at=1.0)
+    bucket.throttle(sent_at=1.0)
+
+    # Assert
+    assert after_one == 4
+    assert bucket.rate == 3
+
+
+def test_recover_climbs_back_to_configured_rate(clock: Mock):
+    # Arrange
+    bucket = TokenBucket(RateLimit(rate=10, increase_step=0.25))
+    bucket.throttle(sent_at=0.0)
+
+    # Act
+    rates = []
+    for _ in range(3):
+        bucket.recover()
+        rates.append(bucket.rate)
+
+    # Assert
+    assert rates == [7.5, 10, 10]
+
+
+@pytest.mark.asyncio
+async def test_limiter_buckets_by_pattern(
+    clock: Mock, mocked_sleep: AsyncMock
+):
+    # Arrange
+    limiter = RateLimiter(
+        RateLimit(rate=1),
+        {"products/*/offers": RateLimit(rate=5)},
+    )
+
+    # Act
+    offers_a = limiter.bucket("products/a/offers")
+    offers_b = limiter.bucket("products/b/offers")
+    auth = limiter.bucket("auth")
+    register = limiter.bucket("products/register")
+
+    # Assert
+    assert offers_a is offers_b
+    assert auth is register
+    assert offers_a is not None and offers_a.rate == 5
+    assert auth is not None and auth.rate == 1
+
+
+@pytest.mark.asyncio
+async def test_limiter_without_limit_never_waits(
+    clock: Mock, mocked_sleep: AsyncMock
+):
+    # Arrange
+    limiter = RateLimiter()
+
+    # Act
+    for _ in range(10):
+        await limiter.acquire("auth")
+    limiter.throttle("auth", sent_at=0.0)
+    limiter.recover("auth")
+
+    # Assert
+    assert limiter.bucket("auth") is None
+    mocked_sleep.assert_not_awaited()
@@ -1,8 +1,11 @@
+import asyncio
+from contextlib import nullcontext
 from http import HTTPStatus
-from typing import Dict
+from typing import Any, Dict
 from urllib.parse import urljoin
 
 import pytest
+import requests
 import requests_mock
 from pytest_mock import MockerFixture
 
@@ -10,7 +13,23 @@ from offers_sdk_applifting.http.auth_token.auth_token_manager import (
     AuthTokenManager,
 )
 from offers_sdk_applifting.http.base_client import BaseHttpClient
-from offers_sdk_applifting.http.requests_client import RequestsClient
+from offers_sdk_applifting.http.cache.backends import (
+    MemoryCacheBackend,
+)
+from offers_sdk_applifting.http.connection_pool import (
+    PoolLimits,
+    PoolMetrics,
+)
+from offers_sdk_applifting.http.requests_client import (
+    RequestsClient,
+    _TrackedHTTPConnectionPool,
+)
+from test.conftest import LocalHandler
+
+
+@pytest.fixture(autouse=True)
+def no_backoff_sleep(mocker: MockerFixture) -> None:
+    mocker.patch.object(asyncio, asyncio.sleep.__name__)
 
 
 @pytest.fixture
@@ -20,7 +39,10 @@ def base_url() -> str:
 
 @pytest.fixture
 def token_manager(mocker: MockerFixture) -> AuthTokenManager:
-    return mocker.Mock(spec=AuthTokenManager)
+    manager = mocker.Mock(spec=AuthTokenManager)
+    manager.exclusive_refresh.return_value = nullcontext()
+    manager.reload_token.return_value = False
+    return manager
 
 
 @pytest.fixture
@@ -32,7 +54,7 @@ def requests_client(
         refresh_token="dummy",
         auth_endpoint="auth",
         token_manager=token_manager,
-        backend="memory",
+        cache_backend=MemoryCacheBackend(),
     )
 
 
@@ -205,7 +227,7 @@ async def test_other_endpoints_are_cached(
 
 
 @pytest.mark.asyncio
-async def test_cached_item_headers_are_redacted(
+async def test_cached_items_hold_no_credentials(
     requests_client: RequestsClient,
     base_url: str,
     mocker: MockerFixture,
@@ -220,10 +242,14 @@ async def test_cached_item_headers_are_redacted(
     endpoint = "data"
     secret_headers = {
         BaseHttpClient._ACCESS_TOKEN_HEADER_KEY: "sensitive-token",
-        BaseHttpClient._REFRESH_TOKEN_HEADER_KEY: "sensitive-token",
     }
+    assert (cache := requests_client.response_cache) is not None
     with requests_mock.Mocker() as mock:
-        mock.get(urljoin(base_url, endpoint), json={"value": 42})
+        mock.get(
+            urljoin(base_url, endpoint),
+            json={"value": 42},
+            headers={"Set-Cookie": "session=secret", "X-Id": "1"},
+        )
 
         # Act
         resp1 = await requests_client.get(
@@ -232,17 +258,324 @@ async def test_cached_item_headers_are_redacted(
         resp2 = await requests_client.get(
             endpoint, headers=secret_headers
         )
-        cached_responses = list(
-            requests_client._session.cache.responses.values()
+    entry = await cache.backend.get(cache.key(endpoint, {}))
+
+    # Assert
+    assert resp1.from_cache is False and resp2.from_cache is True
+    assert entry is not None
+    assert dict(entry.headers) == {"X-Id": "1"}
+    assert b"sensitive-token" not in repr(entry).encode()
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_session(
+    mocker: MockerFixture,
+    requests_client: RequestsClient,
+):
+    mocked_close = mocker.patch.object(
+        requests_client._session,
+        requests_client._session.close.__name__,
+    )
+
+    await requests_client.aclose()
+
+    mocked_close.assert_called_once()
+    with pytest.raises(RuntimeError):
+        await requests_client._thread_pool.run(lambda: None)
+
+
+def test_forked_child_opens_its_own_session(
+    requests_client: RequestsClient,
+):
+    parent_session = requests_client._session
+    parent_threads = requests_client._thread_pool
+
+    requests_client._after_fork()
+
+    assert requests_client._session is not parent_session
+    assert requests_client._thread_pool is not parent_threads
+    assert requests_client._session.get_adapter(
+        "https://api.example.com"
+    ) is not parent_session.get_adapter("https://api.example.com")
+
+
+@pytest.mark.asyncio
+async def test_connection_errors_are_retried(
+    mocker: MockerFixture,
+    base_url: str,
+    requests_client: RequestsClient,
+    token_manager: AuthTokenManager,
+):
+    # Arrange
+    mocker.patch.object(
+        token_manager,
+        AuthTokenManager.is_current_token_expired.__name__,
+        return_value=False,
+    )
+
+    with requests_mock.Mocker() as m:
+        m.get(
+            urljoin(base_url, "offers"),
+            [
+                {"exc": requests.ConnectionError},
+                {"status_code": HTTPStatus.OK, "json": []},
+            ],
         )
 
+        # Act
+        resp = await requests_client.get("offers")
+
+    # Assert
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.attempts == 2
+
+
+def test_adapter_does_not_retry_in_worker_thread(
+    base_url: str, requests_client: RequestsClient
+):
+    adapter = requests_client._session.get_adapter(base_url)
+
+    assert adapter.max_retries.total == 0
+
+
+def test_pool_limits_size_the_pools(
+    base_url: str, token_manager: AuthTokenManager
+):
+    # Arrange
+    client = RequestsClient(
+        base_url=base_url,
+        refresh_token="dummy",
+        auth_endpoint="auth",
+        token_manager=token_manager,
+        cache_backend=MemoryCacheBackend(),
+        pool_limits=PoolLimits(
+            max_connections=12, max_connections_per_host=4
+        ),
+    )
+
+    # Act
+    adapter = client._session.get_adapter(base_url)
+
+    # Assert
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 4
+    assert adapter._pool_block
+    assert client._session.get_adapter("http://localhost") is adapter
+
+
+def test_clients_do_not_share_pools(
+    base_url: str,
+    requests_client: RequestsClient,
+    token_manager: AuthTokenManager,
+):
+    other = RequestsClient(
+        base_url=base_url,
+        refresh_token="dummy",
+        auth_endpoint="auth",
+        token_manager=token_manager,
+        cache_backend=MemoryCacheBackend(),
+    )
+
+    assert other._session.get_adapter(
+        base_url
+    ) is not requests_client._session.get_adapter(base_url)
+
+
+def test_closed_pool_has_no_idle_connections():
+    pool = _TrackedHTTPConnectionPool("localhost")
+    pool.close()
+
+    assert pool.idle_connections == 0
+
+
+def _local_client(
+    mocker: MockerFixture,
+    url: str,
+    token_manager: AuthTokenManager,
+    pool_limits: PoolLimits = PoolLimits(),
+    **kwargs: Any,
+) -> RequestsClient:
+    mocker.patch.object(
+        token_manager,
+        AuthTokenManager.is_current_token_expired.__name__,
+        return_value=False,
+    )
+    token_manager.access_token = "token"
+    return RequestsClient(
+        base_url=url,
+        refresh_token="dummy",
+        auth_endpoint="auth",
+        token_manager=token_manager,
+        cache_backend=None,
+        pool_limits=pool_limits,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_reuse_idle_connections(
+    mocker: MockerFixture,
+    local_url: str,
+    token_manager: AuthTokenManager,
+):
+    # Arrange
+    client = _local_client(mocker, local_url, token_manager)
+    assert client.pool_metrics == PoolMetrics(
+        in_use=0, idle=0, created=0
+    )
+
+    # Act
+    await client.get("offers")
+    await client.get("offers")
+
+    # Assert
+    assert client.pool_metrics == PoolMetrics(
+        in_use=0, idle=1, created=1
+    )
+    assert client.thread_pool_metrics.busy == 0
+    assert client.thread_pool_metrics.queued == 0
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_count_connections_in_use(
+    mocker: MockerFixture,
+    local_url: str,
+    token_manager: AuthTokenManager,
+):
+    # Arrange
+    client = _local_client(mocker, local_url, token_manager)
+    request = asyncio.create_task(client.get("slow"))
+    for _ in range(500):
+        if client.pool_metrics.in_use:
+            break
+        await asyncio.to_thread(LocalHandler.release.wait, 0.01)
+
+    # Act
+    metrics = client.pool_metrics
+    LocalHandler.release.set()
+    await request
+
+    # Assert
+    assert metrics == PoolMetrics(in_use=1, idle=0, created=1)
+    assert client.pool_metrics.in_use == 0
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_waiting_for_a_busy_pool_times_out(
+    mocker: MockerFixture,
+    local_url: str,
+    token_manager: AuthTokenManager,
+):
+    # Arrange
+    client = _local_client(
+        mocker,
+        local_url,
+        token_manager,
+        PoolLimits(max_connections_per_host=1),
+        connect_timeout=0.01,
+    )
+    request = asyncio.create_task(client.get("slow"))
+    for _ in range(500):
+        if client.pool_metrics.in_use:
+            break
+        await asyncio.to_thread(LocalHandler.release.wait, 0.01)
+
+    # Act
+    with pytest.raises(TimeoutError, match="stayed busy") as exc:
+        await client.get("offers")
+    LocalHandler.release.set()
+    await request
+
+    # Assert
+    assert isinstance(exc.value.__cause__, requests.ConnectTimeout)
+    assert client.pool_metrics.created == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_connections_idle_past_keepalive_expiry_reconnect(
+    mocker: MockerFixture,
+    local_url: str,
+    token_manager: AuthTokenManager,
+):
+    # Arrange
+    client = _local_client(
+        mocker,
+        local_url,
+        token_manager,
+        PoolLimits(keepalive_expiry=0.0),
+    )
+
+    # Act
+    await client.get("offers")
+    await client.get("offers")
+
+    # Assert
+    assert client.pool_metrics.created == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_requests_use_configured_timeouts(
+    mocker: MockerFixture,
+    base_url: str,
+    token_manager: AuthTokenManager,
+):
+    # Arrange
+    client = RequestsClient(
+        base_url=base_url,
+        refresh_token="dummy",
+        auth_endpoint="auth",
+        token_manager=token_manager,
+        cache_backend=MemoryCacheBackend(),
+        connect_timeout=2.0,
+        read_timeout=7.0,
+    )
+    mocker.patch.object(
+        token_manager,
+        AuthTokenManager.is_current_token_expired.__name__,
+        return_value=False,
+    )
+
+    with requests_mock.Mocker() as m:
+        m.get(urljoin(base_url, "offers"), json=[])
+        m.post(urljoin(base_url, "products"), json={})
+
+        # Act
+        await client.get("offers")
+        await client.post("products")
+
+        # Assert
+        assert [r.timeout for r in m.request_history] == [
+            (2.0, 7.0),
+            (2.0, 7.0),
+        ]
+
+
+@pytest.mark.asyncio
+async def test_warmup_opens_connections_to_base_url(
+    mocker: MockerFixture,
+    base_url: str,
+    requests_client: RequestsClient,
+    token_manager: AuthTokenManager,
+):
+    # Arrange
+    mocker.patch.object(
+        token_manager,
+        AuthTokenManager.is_current_token_expired.__name__,
+        return_value=False,
+    )
+
+    with requests_mock.Mocker() as m:
+        m.head(base_url)
+
+        # Act
+        await requests_client.warmup(connections=2)
+
         # Assert
-        assert len(cached_responses) == 1
-        cached_response = cached_responses[0]
-        assert resp1.from_cache is False and resp2.from_cache is True
-        assert cached_response.from_cache is True
-        for secret_header in secret_headers.keys():
-            assert (
-                cached_response.request.headers[secret_header]
-                == "REDACTED"
-            )
+        assert [r.method for r in m.request_history] == [
+            "HEAD",
+            "HEAD",
+        ]
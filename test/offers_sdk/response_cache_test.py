@@ -0,0 +1,475 @@
+import asyncio
+from http import HTTPStatus
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from pytest_mock import MockerFixture
+
+from offers_sdk_applifting.http.cache import response_cache
+from offers_sdk_applifting.http.cache.adaptive_ttl import AdaptiveTtl
+from offers_sdk_applifting.http.cache.backends import (
+    FileSystemCacheBackend,
+    MemoryCacheBackend,
+)
+from offers_sdk_applifting.http.cache.early_expiration import (
+    EarlyExpiration,
+)
+from offers_sdk_applifting.http.cache.negative_caching import (
+    NegativeCaching,
+)
+from offers_sdk_applifting.http.cache.response_cache import (
+    DEFAULT_CACHE_TTL_SECONDS,
+    ResponseCache,
+)
+from offers_sdk_applifting.http.cache.usage import (
+    CacheFootprint,
+    CacheLimits,
+)
+from offers_sdk_applifting.http.http_response import HttpResponse
+from offers_sdk_applifting.http.tenancy import acting_for
+
+
+def _ok(
+    content: bytes = b'{"ok": true}', **headers: str
+) -> HttpResponse:
+    return HttpResponse(
+        status_code=HTTPStatus.OK, content=content, headers=headers
+    )
+
+
+def test_key_ignores_param_order_and_slashes():
+    cache = ResponseCache(MemoryCacheBackend(), namespace="a")
+
+    assert cache.key("/offers/", {"b": 1, "a": "x"}) == cache.key(
+        "offers", {"a": "x", "b": "1"}
+    )
+    assert cache.key("offers", {}) != ResponseCache(
+        MemoryCacheBackend(), namespace="b"
+    ).key("offers", {})
+
+
+def test_keys_are_partitioned_by_tenant():
+    cache = ResponseCache(MemoryCacheBackend(), namespace="a")
+    own = cache.key("offers", {})
+
+    with acting_for("acme"):
+        acme = cache.key("offers", {})
+    with acting_for("beta"):
+        beta = cache.key("offers", {})
+
+    assert len({own, acme, beta}) == 3
+
+
+def test_exclusions_take_precedence_over_ttl_rules():
+    cache = ResponseCache(
+        MemoryCacheBackend(),
+        ttl=10.0,
+        endpoint_ttls={"*": 60.0, "auth": 60.0},
+        excluded_endpoints=["auth"],
+    )
+
+    assert cache.ttl_for("auth") is None
+    assert cache.ttl_for("offers") == 60.0
+
+
+@pytest.mark.asyncio
+async def test_round_trip_drops_sensitive_headers():
+    # Arrange
+    cache = ResponseCache(MemoryCacheBackend())
+
+    # Act
+    await cache.store(
+        "offers",
+        {},
+        _ok(**{"Set-Cookie": "secret", "X-Request-Id": "1"}),
+    )
+    cached = await cache.get("offers")
+
+    # Assert
+    assert cached is not None
+    assert cached.from_cache
+    assert cached.json == {"ok": True}
+    assert dict(cached.headers) == {"X-Request-Id": "1"}
+
+
+@pytest.mark.asyncio
+async def test_decoded_responses_are_stored_as_json():
+    cache = ResponseCache(MemoryCacheBackend())
+
+    await cache.store(
+        "offers",
+        {},
+        HttpResponse(status_code=HTTPStatus.OK, json=[1]),
+    )
+    cached = await cache.get("offers")
+
+    assert cached is not None and cached.json == [1]
+
+
+@pytest.mark.asyncio
+async def test_zero_ttl_is_not_stored():
+    backend = MemoryCacheBackend()
+    cache = ResponseCache(backend, ttl=0)
+
+    await cache.store("offers", {}, _ok())
+
+    assert await backend.scan() == []
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_a_miss_and_is_deleted(
+    mocker: MockerFixture,
+):
+    # Arrange
+    backend = MemoryCacheBackend()
+    cache = ResponseCache(
+        backend, limits=CacheLimits(sweep_interval=None)
+    )
+    clock = mocker.patch.object(response_cache, "time")
+    clock.time.return_value = 0.0
+    await cache.store("offers", {}, _ok())
+    clock.time.return_value = DEFAULT_CACHE_TTL_SECONDS
+
+    # Act
+    cached = await cache.get("offers")
+
+    # Assert
+    assert cached is None
+    assert await backend.scan() == []
+    assert cache.footprint == CacheFootprint(
+        entries=0, bytes=0, evictions=0, expired=1
+    )
+
+
+@pytest.mark.asyncio
+async def test_entry_evicted_elsewhere_is_forgotten():
+    # Arrange
+    backend = MemoryCacheBackend()
+    cache = ResponseCache(
+        backend, limits=CacheLimits(sweep_interval=None)
+    )
+    await cache.store("offers", {}, _ok())
+    await backend.clear()
+
+    # Act
+    cached = await cache.get("offers")
+
+    # Assert
+    assert cached is None
+    assert cache.footprint is not None
+    assert cache.footprint.entries == 0
+
+
+@pytest.mark.asyncio
+async def test_limits_trim_entries_from_earlier_runs(tmp_path: Path):
+    # Arrange
+    earlier = ResponseCache(FileSystemCacheBackend(tmp_path))
+    for endpoint in ("a", "b", "c"):
+        await earlier.store(endpoint, {}, _ok())
+
+    # Act
+    bounded = ResponseCache(
+        FileSystemCacheBackend(tmp_path),
+        limits=CacheLimits(max_entries=1, sweep_interval=None),
+    )
+    await bounded.get("a")
+
+    # Assert
+    footprint = bounded.footprint
+    assert footprint is not None
+    assert (footprint.entries, footprint.evictions) == (1, 2)
+    assert len(list(tmp_path.iterdir())) == 1
+    assert earlier.footprint is None
+
+
+@pytest.mark.asyncio
+async def test_backend_failures_are_cache_misses(
+    mocker: MockerFixture,
+):
+    # Arrange
+    backend = MemoryCacheBackend()
+    mocker.patch.object(
+        backend, backend.get.__name__, side_effect=OSError("disk")
+    )
+    mocker.patch.object(
+        backend, backend.set.__name__, side_effect=OSError("disk")
+    )
+    cache = ResponseCache(backend)
+
+    # Act
+    await cache.store("offers", {}, _ok())
+    cached = await cache.get("offers")
+
+    # Assert
+    assert cached is None
+
+
+@pytest.mark.asyncio
+async def test_sweep_without_limits_only_cleans_backend(
+    mocker: MockerFixture,
+):
+    backend = MemoryCacheBackend()
+    cache = ResponseCache(backend)
+    await cache.store("offers", {}, _ok())
+    clock = mocker.patch.object(response_cache, "time")
+    clock.time.return_value = 1e12
+
+    await cache.sweep()
+
+    assert await backend.scan() == []
+    assert cache.footprint is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "age,expected_stale",
+    [(5.0, False), (10.0, True), (14.0, True), (15.0, None)],
+)
+async def test_expired_entries_are_stale_within_window(
+    mocker: MockerFixture,
+    age: float,
+    expected_stale: Optional[bool],
+):
+    # Arrange
+    cache = ResponseCache(
+        MemoryCacheBackend(), ttl=10.0, stale_while_revalidate=5.0
+    )
+    clock = mocker.patch.object(response_cache, "time")
+    clock.time.return_value = 0.0
+    await cache.store("offers", {}, _ok())
+    clock.time.return_value = age
+
+    # Act
+    hit = await cache.lookup("offers")
+
+    # Assert
+    assert (hit and hit.stale) == expected_stale
+    assert (await cache.get("offers") is not None) == (
+        expected_stale is False
+    )
+
+
+@pytest.mark.asyncio
+async def test_sweep_keeps_entries_within_stale_window(
+    mocker: MockerFixture,
+):
+    # Arrange
+    backend = MemoryCacheBackend()
+    cache = ResponseCache(
+        backend, ttl=10.0, stale_while_revalidate=5.0
+    )
+    clock = mocker.patch.object(response_cache, "time")
+    clock.time.return_value = 0.0
+    await cache.store("stale", {}, _ok())
+    clock.time.return_value = 6.0
+    await cache.store("fresh", {}, _ok())
+    clock.time.return_value = 15.0
+
+    # Act
+    await cache.sweep()
+
+    # Assert
+    assert len(await backend.scan()) == 1
+    assert await cache.lookup("fresh") is not None
+
+
+@pytest.mark.asyncio
+async def test_adaptive_ttl_follows_response_changes(
+    mocker: MockerFixture,
+):
+    # Arrange
+    cache = ResponseCache(
+        MemoryCacheBackend(),
+        ttl=60.0,
+        adaptive_ttl=AdaptiveTtl(min_ttl=10.0, decrease_factor=0.5),
+    )
+    clock = mocker.patch.object(response_cache, "time")
+    clock.time.return_value = 0.0
+
+    # Act
+    await cache.store("/offers/", {}, _ok(b"[1]"))
+    expires_at = await cache.store("offers", {}, _ok(b"[2]"))
+
+    # Assert
+    assert expires_at == 30.0
+    assert cache.learned_ttls == {"offers": 30.0}
+    assert ResponseCache(MemoryCacheBackend()).learned_ttls == {}
+
+
+@pytest.mark.asyncio
+async def test_early_expiration_reports_fresh_entries_as_stale(
+    mocker: MockerFixture,
+):
+    # Arrange
+    policy = EarlyExpiration(jitter=0.5)
+    cache = ResponseCache(
+        MemoryCacheBackend(), ttl=100.0, early_expiration=policy
+    )
+    clock = mocker.patch.object(response_cache, "time")
+    clock.time.return_value = 0.0
+    # the policy is frozen, so its class is patched instead
+    jitter = mocker.patch.object(
+        EarlyExpiration,
+        EarlyExpiration.jittered_ttl.__name__,
+        return_value=60.0,
+    )
+    early = mocker.patch.object(
+        EarlyExpiration,
+        EarlyExpiration.expires_early.__name__,
+        return_value=True,
+    )
+
+    # Act
+    expires_at = await cache.store(
+        "offers", {}, _ok(), fetch_time=2.0
+    )
+    hit = await cache.lookup("offers")
+
+    # Assert
+    assert expires_at == 60.0
+    jitter.assert_called_once_with(100.0)
+    early.assert_called_once_with(0.0, 60.0, 2.0)
+    assert hit is not None and hit.stale
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "resp,expected_ttl",
+    [
+        (HttpResponse(status_code=HTTPStatus.NOT_FOUND), 30.0),
+        (
+            HttpResponse(status_code=HTTPStatus.GONE, content=b""),
+            30.0,
+        ),
+        (_ok(b" [] "), 30.0),
+        (HttpResponse(status_code=HTTPStatus.OK, json=[]), 30.0),
+        (_ok(b"[1]"), 100.0),
+        (_ok(b"{}"), 100.0),
+        (HttpResponse(status_code=HTTPStatus.BAD_REQUEST), None),
+    ],
+)
+async def test_negative_results_are_cached_briefly(
+    mocker: MockerFixture,
+    resp: HttpResponse,
+    expected_ttl: Optional[float],
+):
+    # Arrange
+    cache = ResponseCache(
+        MemoryCacheBackend(),
+        ttl=100.0,
+        negative_caching=NegativeCaching(ttl=30.0),
+    )
+    clock = mocker.patch.object(response_cache, "time")
+    clock.time.return_value = 0.0
+
+    # Act
+    expires_at = await cache.store("offers", {}, resp)
+    cached = await cache.get("offers")
+
+    # Assert
+    assert expires_at == expected_ttl
+    if expected_ttl is not None:
+        assert cached is not None
+        assert cached.status_code == resp.status_code
+
+
+@pytest.mark.asyncio
+async def test_negative_ttl_never_exceeds_endpoint_ttl(
+    mocker: MockerFixture,
+):
+    # Arrange
+    cache = ResponseCache(
+        MemoryCacheBackend(),
+        ttl=10.0,
+        negative_caching=NegativeCaching(ttl=30.0, empty_lists=False),
+    )
+    clock = mocker.patch.object(response_cache, "time")
+    clock.time.return_value = 0.0
+
+    # Act
+    missing = await cache.store(
+        "missing", {}, HttpResponse(status_code=HTTPStatus.NOT_FOUND)
+    )
+    empty = await cache.store("empty", {}, _ok(b"[]"))
+
+    # Assert
+    assert missing == empty == 10.0
+
+
+@pytest.mark.asyncio
+async def test_filling_gives_up_waiting_on_a_stuck_process(
+    mocker: MockerFixture, tmp_path: Path
+):
+    # Arrange
+    cache = ResponseCache(
+        MemoryCacheBackend(), fill_lock_directory=tmp_path
+    )
+    mocker.patch.object(
+        ResponseCache, "FILL_LOCK_TIMEOUT_SECONDS", 0.0
+    )
+    async with cache.filling("offers"):
+        # Act
+        async with cache.filling("offers") as recheck:
+            # Assert
+            assert recheck
+    async with ResponseCache(MemoryCacheBackend()).filling(
+        "offers"
+    ) as recheck:
+        assert not recheck
+
+
+@pytest.mark.asyncio
+async def test_filling_locks_each_key_on_its_own(
+    mocker: MockerFixture, tmp_path: Path
+):
+    # Arrange
+    cache = ResponseCache(
+        MemoryCacheBackend(), fill_lock_directory=tmp_path
+    )
+    mocker.patch.object(
+        ResponseCache, "FILL_LOCK_TIMEOUT_SECONDS", 60.0
+    )
+    # keys that used to share a lock file
+    mocker.patch.object(
+        cache,
+        cache.key.__name__,
+        side_effect=lambda endpoint, params: f"abc{params['page']}",
+    )
+
+    # Act
+    async with asyncio.timeout(5):
+        async with cache.filling("offers", {"page": 1}):
+            async with cache.filling("offers", {"page": 2}):
+                pass
+
+    # Assert
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_open_loads_usage_and_survives_backend_failures(
+    mocker: MockerFixture,
+    caplog: pytest.LogCaptureFixture,
+    tmp_path: Path,
+):
+    # Arrange
+    earlier = ResponseCache(FileSystemCacheBackend(tmp_path))
+    await earlier.store("offers", {}, _ok())
+    bounded = ResponseCache(
+        FileSystemCacheBackend(tmp_path),
+        limits=CacheLimits(sweep_interval=None),
+    )
+    broken = MemoryCacheBackend()
+    mocker.patch.object(
+        broken, broken.open.__name__, side_effect=OSError("disk")
+    )
+
+    # Act
+    await bounded.open()
+    await ResponseCache(broken).open()
+
+    # Assert
+    assert bounded.footprint is not None
+    assert bounded.footprint.entries == 1
+    assert "Opening the cache failed" in caplog.text
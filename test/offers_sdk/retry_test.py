@@ -0,0 +1,98 @@
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from pytest_mock import MockerFixture
+
+from offers_sdk_applifting.http.retry import (
+    RetryBudget,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+@pytest.mark.parametrize(
+    "retry_number,expected_ceiling",
+    [(0, 0.5), (1, 1.0), (2, 2.0), (10, 3.0)],
+)
+def test_backoff_uses_full_jitter_up_to_cap(
+    mocker: MockerFixture, retry_number: int, expected_ceiling: float
+):
+    # Arrange
+    uniform = mocker.spy(random, random.uniform.__name__)
+    policy = RetryPolicy(backoff_base=0.5, backoff_cap=3.0)
+
+    # Act
+    delay = policy.backoff(retry_number)
+
+    # Assert
+    uniform.assert_called_once_with(0, expected_ceiling)
+    assert 0 <= delay <= expected_ceiling
+
+
+def test_budget_allows_ratio_of_requests_as_retries(
+    mocker: MockerFixture,
+):
+    # Arrange
+    mocker.patch("time.monotonic", return_value=0.0)
+    budget = RetryBudget(ratio=0.5, min_per_second=0, max_balance=1)
+    assert budget.try_acquire_retry()
+    assert not budget.try_acquire_retry()
+
+    # Act
+    budget.record_request()
+    half_funded = budget.try_acquire_retry()
+    budget.record_request()
+    funded = budget.try_acquire_retry()
+
+    # Assert
+    assert not half_funded
+    assert funded
+
+
+def test_budget_refills_over_time(mocker: MockerFixture):
+    # Arrange
+    clock = mocker.patch("time.monotonic", return_value=0.0)
+    budget = RetryBudget(ratio=0, min_per_second=2, max_balance=5)
+    for _ in range(5):
+        budget.try_acquire_retry()
+    assert budget.balance == 0
+
+    # Act
+    clock.return_value = 1.0
+
+    # Assert
+    assert budget.balance == 2
+    clock.return_value = 100.0
+    assert budget.balance == 5
+
+
+@pytest.mark.parametrize(
+    "headers,expected",
+    [
+        ({}, None),
+        ({"Retry-After": "120"}, 120.0),
+        ({"Retry-After": " 3 "}, 3.0),
+        ({"Retry-After": "soon"}, None),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0.0),
+    ],
+)
+def test_parse_retry_after(headers: dict, expected: float | None):
+    assert parse_retry_after(headers) == expected
+
+
+@pytest.mark.parametrize("usegmt", [True, False])
+def test_parse_retry_after_http_date(usegmt: bool):
+    # Arrange
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    value = format_datetime(retry_at, usegmt=usegmt)
+    if not usegmt:
+        # "-0000" marks a date without timezone information
+        value = value.replace("+0000", "-0000")
+
+    # Act
+    delay = parse_retry_after({"Retry-After": value})
+
+    # Assert
+    assert delay == pytest.approx(30, abs=2)
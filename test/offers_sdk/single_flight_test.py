@@ -0,0 +1,123 @@
+import asyncio
+import gc
+import logging
+
+import pytest
+
+from offers_sdk_applifting.http.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_with_same_key_share_result():
+    # Arrange
+    flight: SingleFlight[str, int] = SingleFlight()
+    calls = 0
+
+    async def work() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return 42
+
+    # Act
+    results = await asyncio.gather(
+        *(flight.do("key", work) for _ in range(10))
+    )
+
+    # Assert
+    assert results == [42] * 10
+    assert calls == 1
+    assert not flight.is_in_flight("key")
+    assert flight.stats.calls == 10
+    assert flight.stats.coalesced == 9
+    assert flight.stats.executed == 1
+
+
+@pytest.mark.asyncio
+async def test_different_keys_run_separately():
+    flight: SingleFlight[str, str] = SingleFlight()
+
+    async def work_for(key: str) -> str:
+        await asyncio.sleep(0)
+        return key
+
+    results = await asyncio.gather(
+        flight.do("a", lambda: work_for("a")),
+        flight.do("b", lambda: work_for("b")),
+    )
+
+    assert results == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_call():
+    # Arrange
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+
+    async def work() -> int:
+        await release.wait()
+        return 7
+
+    first = asyncio.create_task(flight.do("key", work))
+    second = asyncio.create_task(flight.do("key", work))
+    await asyncio.sleep(0)
+
+    # Act
+    first.cancel()
+    release.set()
+
+    # Assert
+    assert await second == 7
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.asyncio
+async def test_failure_after_all_waiters_left_is_not_logged(
+    caplog: pytest.LogCaptureFixture,
+):
+    # Arrange
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+    failed = asyncio.Event()
+
+    async def work() -> int:
+        await release.wait()
+        failed.set()
+        raise ValueError("boom")
+
+    waiter = asyncio.create_task(flight.do("key", work))
+    await asyncio.sleep(0)
+
+    # Act
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    release.set()
+    await failed.wait()
+    await asyncio.sleep(0)
+    del waiter
+    gc.collect()
+
+    # Assert
+    assert not flight.is_in_flight("key")
+    assert not [
+        record
+        for record in caplog.records
+        if record.levelno >= logging.ERROR
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sequential_calls_are_not_coalesced():
+    flight: SingleFlight[str, int] = SingleFlight()
+
+    async def work() -> int:
+        return 1
+
+    await flight.do("key", work)
+    await flight.do("key", work)
+
+    assert flight.stats.coalesced == 0
+    assert flight.stats.executed == 2
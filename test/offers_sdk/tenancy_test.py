@@ -0,0 +1,32 @@
+import asyncio
+
+import pytest
+
+from offers_sdk_applifting.http.tenancy import (
+    acting_for,
+    current_tenant,
+    tenant_context,
+)
+
+
+def test_acting_for_nests_and_none_keeps_the_enclosing_tenant():
+    with acting_for("acme"):
+        with acting_for(None):
+            assert current_tenant() == "acme"
+        with acting_for("beta"):
+            assert current_tenant() == "beta"
+        assert current_tenant() == "acme"
+    assert current_tenant() is None
+
+
+@pytest.mark.asyncio
+async def test_tenant_context_keeps_only_the_tenant():
+    with acting_for("acme"):
+        context = tenant_context()
+
+    task = asyncio.create_task(
+        asyncio.to_thread(current_tenant), context=context
+    )
+
+    assert await task == "acme"
+    assert current_tenant() is None
@@ -0,0 +1,151 @@
+import asyncio
+import threading
+from contextvars import ContextVar
+from typing import Iterator
+
+import pytest
+
+from offers_sdk_applifting.exceptions import ThreadPoolSaturatedError
+from offers_sdk_applifting.http.thread_pool import (
+    BoundedThreadPool,
+    ThreadPoolLimits,
+    ThreadPoolMetrics,
+)
+
+_REQUEST_ID: ContextVar[str] = ContextVar("request_id", default="")
+
+
+@pytest.fixture
+def release() -> Iterator[threading.Event]:
+    release = threading.Event()
+    yield release
+    release.set()
+
+
+@pytest.fixture
+def pool() -> Iterator[BoundedThreadPool]:
+    pool = BoundedThreadPool(
+        ThreadPoolLimits(max_workers=1, max_queued=1)
+    )
+    yield pool
+    pool.shutdown()
+
+
+async def _until_busy(pool: BoundedThreadPool) -> None:
+    for _ in range(500):
+        if pool.metrics.busy:
+            return
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_runs_on_own_threads_in_callers_context(
+    pool: BoundedThreadPool,
+):
+    # Arrange
+    _REQUEST_ID.set("abc")
+
+    def work() -> str:
+        return (
+            f"{_REQUEST_ID.get()} {threading.current_thread().name}"
+        )
+
+    # Act
+    result = await pool.run(work)
+
+    # Assert
+    assert result.startswith("abc offers-sdk")
+    assert pool.metrics == ThreadPoolMetrics(
+        workers=1,
+        busy=0,
+        queued=0,
+        rejected=0,
+        mean_wait=pool.metrics.max_wait,
+        max_wait=pool.metrics.max_wait,
+    )
+
+
+@pytest.mark.asyncio
+async def test_full_queue_holds_callers_back(
+    pool: BoundedThreadPool, release: threading.Event
+):
+    # Arrange
+    calls = [
+        asyncio.create_task(pool.run(release.wait)) for _ in range(3)
+    ]
+    await _until_busy(pool)
+
+    # Act
+    metrics = pool.metrics
+    release.set()
+    results = await asyncio.gather(*calls)
+
+    # Assert
+    assert (metrics.busy, metrics.queued) == (1, 1)
+    assert results == [True] * 3
+    assert pool.metrics.mean_wait > 0
+    assert pool.metrics.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_rejects_once_queue_timeout_passes(
+    release: threading.Event,
+):
+    # Arrange
+    pool = BoundedThreadPool(
+        ThreadPoolLimits(max_workers=1, max_queued=0, queue_timeout=0)
+    )
+    running = asyncio.create_task(pool.run(release.wait))
+    await _until_busy(pool)
+
+    # Act
+    with pytest.raises(ThreadPoolSaturatedError):
+        await pool.run(release.wait)
+
+    # Assert
+    assert pool.metrics.rejected == 1
+    release.set()
+    await running
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_queued_calls(
+    pool: BoundedThreadPool, release: threading.Event
+):
+    # Arrange
+    running = asyncio.create_task(pool.run(release.wait))
+    queued = asyncio.create_task(pool.run(release.wait))
+    await _until_busy(pool)
+
+    # Act
+    pool.shutdown(wait=False)
+    release.set()
+
+    # Assert
+    assert await running
+    with pytest.raises(RuntimeError, match="shut down"):
+        await queued
+    with pytest.raises(RuntimeError):
+        await pool.run(release.wait)
+    assert pool.metrics.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_leaves_the_queue(
+    pool: BoundedThreadPool, release: threading.Event
+):
+    # Arrange
+    running = asyncio.create_task(pool.run(release.wait))
+    queued = asyncio.create_task(pool.run(release.wait))
+    await _until_busy(pool)
+
+    # Act
+    queued.cancel()
+
+    # Assert
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    assert pool.metrics.queued == 0
+    release.set()
+    assert await running
@@ -0,0 +1,51 @@
+from pathlib import Path
+
+import keyring
+from pytest_mock import MockerFixture
+
+from offers_sdk_applifting.config import ApiConfig
+from offers_sdk_applifting.http.base_client import BaseHttpClient
+from offers_sdk_applifting.http.cache.backends import (
+    FileSystemCacheBackend,
+)
+from questionary_cli.container import Container
+
+
+def test_offers_client_is_built_from_api_config(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    # Arrange
+    mocker.patch.object(
+        keyring, keyring.get_password.__name__, return_value=None
+    )
+    mocker.patch.object(BaseHttpClient, "_CACHE_PATH", tmp_path)
+    container = Container()
+    container.config.from_dict(
+        {
+            "base_url": "https://api.example.com/api/v1/",
+            "auth_endpoint": "auth",
+            "refresh_token": "refresh-token",
+            "persistent_auth_token_key": "token-key",
+        }
+    )
+    defaults = ApiConfig(
+        base_url="",
+        auth_endpoint="",
+        refresh_token="",
+        persistent_auth_token_key="",
+    )
+
+    # Act
+    client = container.offers_client()
+
+    # Assert
+    http_client = client._http_client
+    assert client is container.offers_client()
+    assert http_client.response_cache is not None
+    assert isinstance(
+        http_client.response_cache._backend, FileSystemCacheBackend
+    )
+    assert (
+        http_client._connect_timeout,
+        http_client._read_timeout,
+    ) == (defaults.connect_timeout, defaults.read_timeout)